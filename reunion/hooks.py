@@ -143,10 +143,26 @@ after_install = "reunion.meeting_management.api.add_google_calendar_fields.add_c
 # ---------------
 
 scheduler_events = {
+	# Renouvellement des canaux de notification push Google Calendar
+	"daily": [
+		"reunion.meeting_management.api.google_push.renew_channels"
+	],
+	# Reprise des imports d'historique interrompus
+	"hourly": [
+		"reunion.meeting_management.api.google_backfill.resume_backfills"
+	],
 	# Synchronisation Google Calendar toutes les 6 heures
 	"cron": {
 		"0 */6 * * *": [
 			"reunion.meeting_management.api.google_calendar.sync_bidirectional"
+		],
+		# Rafraîchissement du token OAuth avant son expiration
+		"*/10 * * * *": [
+			"reunion.meeting_management.api.google_auth.refresh_token_ahead_of_expiry"
+		],
+		# Reprise des événements dont la synchronisation a échoué
+		"*/15 * * * *": [
+			"reunion.meeting_management.api.google_retry.retry_failed_syncs"
 		]
 	}
 }
@@ -223,6 +239,7 @@ scheduler_events = {
 # Automatically update python controller files with type annotations for this app.
 # export_python_type_annotations = True
 
-# default_log_clearing_doctypes = {
-# 	"Logging DocType Name": 30  # days to retain logs
-# }
+# Durée de conservation des mesures de synchronisation Google Calendar (jours)
+default_log_clearing_doctypes = {
+	"Google Calendar Sync Run": 30
+}
@@ -6,6 +6,12 @@ Script pour ajouter les custom fields Google Calendar aux DocTypes Event et Task
 import frappe
 
 
+# Index composite utilisé par les recherches de la synchronisation
+GOOGLE_SYNC_FIELDS = ['google_calendar_id', 'google_event_id']
+GOOGLE_SYNC_INDEX = 'google_calendar_event_index'
+GOOGLE_SYNC_UNIQUE_INDEX = 'google_calendar_event_unique'
+
+
 def add_custom_fields():
 	"""Ajoute les custom fields pour la synchronisation Google Calendar"""
 	from frappe.custom.doctype.custom_field.custom_field import create_custom_fields
@@ -13,7 +19,7 @@ def add_custom_fields():
 
 	# D'abord, supprimer les custom fields existants en utilisant SQL direct
 	doctypes = ['Event', 'Task']
-	fieldnames = ['google_event_id', 'google_calendar_id']
+	fieldnames = [field['fieldname'] for field in get_custom_fields()['Event']]
 
 	for doctype in doctypes:
 		for fieldname in fieldnames:
@@ -41,6 +47,57 @@ def add_custom_fields():
 	print("✓ Cache cleared and meta refreshed")
 
 	# Custom fields pour Event et Task
+	custom_fields = get_custom_fields()
+
+	# Vérifier si les colonnes existent et les ajouter manuellement si nécessaire
+	for doctype, table_name in [('Event', 'tabEvent'), ('Task', 'tabTask')]:
+		for fieldname in fieldnames:
+			try:
+				# Vérifier si la colonne existe
+				result = frappe.db.sql(f"""
+					SELECT COLUMN_NAME
+					FROM INFORMATION_SCHEMA.COLUMNS
+					WHERE TABLE_SCHEMA = %s
+					AND TABLE_NAME = %s
+					AND COLUMN_NAME = %s
+				""", (frappe.conf.db_name, table_name, fieldname))
+
+				if not result:
+					# La colonne n'existe pas, l'ajouter
+					print(f"⚠ Column {table_name}.{fieldname} does not exist, adding it...")
+					frappe.db.sql(f"""
+						ALTER TABLE `{table_name}`
+						ADD COLUMN `{fieldname}` VARCHAR(140)
+					""")
+					print(f"✓ Added column {table_name}.{fieldname}")
+				else:
+					print(f"✓ Column {table_name}.{fieldname} already exists")
+			except Exception as e:
+				print(f"⚠ Error checking/adding column {table_name}.{fieldname}: {str(e)}")
+
+	frappe.db.commit()
+
+	# Maintenant créer les Custom Field docs
+	create_custom_fields(custom_fields, update=True)
+
+	frappe.db.commit()
+
+	# Index composite pour les recherches de la synchronisation
+	add_google_sync_indexes()
+
+	print("\n✅ All custom fields have been created successfully!")
+
+
+def get_custom_fields(fieldnames=None):
+	"""
+	Définition des custom fields Google Calendar pour Event et Task
+
+	Args:
+		fieldnames: Limiter aux champs indiqués (ex: ceux ajoutés par un patch), tous par défaut
+
+	Returns:
+		dict: Format attendu par create_custom_fields
+	"""
 	custom_fields = {
 		'Event': [
 			{
@@ -60,6 +117,34 @@ def add_custom_fields():
 				'read_only': 1,
 				'hidden': 1,
 				'no_copy': 1
+			},
+			{
+				'fieldname': 'google_etag',
+				'label': 'Google ETag',
+				'fieldtype': 'Data',
+				'insert_after': 'google_calendar_id',
+				'read_only': 1,
+				'hidden': 1,
+				'no_copy': 1
+			},
+			{
+				'fieldname': 'google_content_hash',
+				'label': 'Google Content Hash',
+				'fieldtype': 'Data',
+				'insert_after': 'google_etag',
+				'read_only': 1,
+				'hidden': 1,
+				'no_copy': 1
+			},
+			{
+				'fieldname': 'google_last_origin',
+				'label': 'Google Last Origin',
+				'fieldtype': 'Select',
+				'options': '\nGoogle\nERPNext',
+				'insert_after': 'google_content_hash',
+				'read_only': 1,
+				'hidden': 1,
+				'no_copy': 1
 			}
 		],
 		'Task': [
@@ -80,44 +165,81 @@ def add_custom_fields():
 				'read_only': 1,
 				'hidden': 1,
 				'no_copy': 1
+			},
+			{
+				'fieldname': 'google_etag',
+				'label': 'Google ETag',
+				'fieldtype': 'Data',
+				'insert_after': 'google_calendar_id',
+				'read_only': 1,
+				'hidden': 1,
+				'no_copy': 1
+			},
+			{
+				'fieldname': 'google_content_hash',
+				'label': 'Google Content Hash',
+				'fieldtype': 'Data',
+				'insert_after': 'google_etag',
+				'read_only': 1,
+				'hidden': 1,
+				'no_copy': 1
+			},
+			{
+				'fieldname': 'google_last_origin',
+				'label': 'Google Last Origin',
+				'fieldtype': 'Select',
+				'options': '\nGoogle\nERPNext',
+				'insert_after': 'google_content_hash',
+				'read_only': 1,
+				'hidden': 1,
+				'no_copy': 1
 			}
 		]
 	}
 
-	# Vérifier si les colonnes existent et les ajouter manuellement si nécessaire
-	for doctype, table_name in [('Event', 'tabEvent'), ('Task', 'tabTask')]:
-		for fieldname in ['google_event_id', 'google_calendar_id']:
-			try:
-				# Vérifier si la colonne existe
-				result = frappe.db.sql(f"""
-					SELECT COLUMN_NAME
-					FROM INFORMATION_SCHEMA.COLUMNS
-					WHERE TABLE_SCHEMA = %s
-					AND TABLE_NAME = %s
-					AND COLUMN_NAME = %s
-				""", (frappe.conf.db_name, table_name, fieldname))
-
-				if not result:
-					# La colonne n'existe pas, l'ajouter
-					print(f"⚠ Column {table_name}.{fieldname} does not exist, adding it...")
-					frappe.db.sql(f"""
-						ALTER TABLE `{table_name}`
-						ADD COLUMN `{fieldname}` VARCHAR(140)
-					""")
-					print(f"✓ Added column {table_name}.{fieldname}")
-				else:
-					print(f"✓ Column {table_name}.{fieldname} already exists")
-			except Exception as e:
-				print(f"⚠ Error checking/adding column {table_name}.{fieldname}: {str(e)}")
+	if fieldnames:
+		custom_fields = {
+			doctype: [field for field in fields if field['fieldname'] in fieldnames]
+			for doctype, fields in custom_fields.items()
+		}
+
+	return custom_fields
+
+
+def add_google_sync_indexes():
+	"""
+	Crée l'index composite (google_calendar_id, google_event_id) sur Event et Task
+	L'index est unique si aucun doublon n'existe déjà dans la table, simple sinon
+	(les lignes non synchronisées ont des valeurs NULL et ne sont pas concernées)
+	"""
+	for doctype in ['Event', 'Task']:
+		table_name = f"tab{doctype}"
+
+		try:
+			if frappe.db.has_index(table_name, GOOGLE_SYNC_INDEX) or frappe.db.has_index(table_name, GOOGLE_SYNC_UNIQUE_INDEX):
+				print(f"✓ Index on {table_name} already exists")
+				continue
+
+			duplicates = frappe.db.sql(f"""
+				SELECT google_calendar_id, google_event_id
+				FROM `{table_name}`
+				WHERE google_calendar_id IS NOT NULL AND google_event_id IS NOT NULL
+				GROUP BY google_calendar_id, google_event_id
+				HAVING COUNT(*) > 1
+				LIMIT 1
+			""")
+
+			if duplicates:
+				frappe.db.add_index(doctype, GOOGLE_SYNC_FIELDS, GOOGLE_SYNC_INDEX)
+				print(f"⚠ Duplicate Google IDs found in {table_name}, added non-unique index")
+			else:
+				frappe.db.add_unique(doctype, GOOGLE_SYNC_FIELDS, GOOGLE_SYNC_UNIQUE_INDEX)
+				print(f"✓ Added unique index on {table_name}")
+		except Exception as e:
+			print(f"⚠ Error adding index on {table_name}: {str(e)}")
 
 	frappe.db.commit()
 
-	# Maintenant créer les Custom Field docs
-	create_custom_fields(custom_fields, update=True)
-
-	frappe.db.commit()
-	print("\n✅ All custom fields have been created successfully!")
-
 
 if __name__ == '__main__':
 	add_custom_fields()
@@ -10,6 +10,9 @@ from frappe import _
 from google_auth_oauthlib.flow import Flow
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
+from frappe.utils import get_datetime
+from frappe.utils.password import set_encrypted_password
+from reunion.meeting_management.utils.locks import redis_lock
 import json
 from datetime import datetime, timedelta
 
@@ -18,6 +21,20 @@ from datetime import datetime, timedelta
 # Note: calendar inclut déjà calendar.events, pas besoin des deux
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# Cache des credentials : clé Redis (préfixée par site) et copie locale au worker
+# Redis ne reçoit que le token d'accès et son expiration ; refresh_token et client_secret
+# (champs Password chiffrés) restent dans l'objet Credentials du worker
+CREDENTIALS_CACHE_KEY = "google_calendar_access_token"
+# Les credentials en cache ne sont plus servies peu avant l'expiration du token
+CREDENTIALS_EXPIRY_MARGIN = timedelta(minutes=5)
+_credentials_cache = {}
+
+# Rafraîchissement du token : verrou partagé entre workers
+TOKEN_REFRESH_LOCK = "google_calendar_token_refresh"
+TOKEN_REFRESH_LOCK_TIMEOUT = 30
+# Le Scheduled Job (toutes les 10 minutes) rafraîchit les tokens expirant dans ce délai
+TOKEN_REFRESH_AHEAD = timedelta(minutes=15)
+
 
 @frappe.whitelist()
 def get_authorization_url():
@@ -144,8 +161,8 @@ def handle_oauth_callback(code=None, state=None, error=None):
 		if credentials.expiry:
 			settings.token_expiry = credentials.expiry
 		else:
-			# Par défaut, les tokens expirent après 1 heure
-			settings.token_expiry = datetime.now() + timedelta(hours=1)
+			# Par défaut, les tokens expirent après 1 heure (UTC, comme credentials.expiry)
+			settings.token_expiry = datetime.utcnow() + timedelta(hours=1)
 
 		settings.sync_status = "Connecté"
 
@@ -156,6 +173,9 @@ def handle_oauth_callback(code=None, state=None, error=None):
 		settings.save(ignore_permissions=True)
 		frappe.db.commit()
 
+		# Les anciennes credentials ne doivent plus être servies
+		clear_credentials_cache()
+
 		# Log success
 		frappe.logger().info(f"OAuth tokens saved successfully for user")
 
@@ -191,6 +211,8 @@ def disconnect():
 
 		frappe.db.commit()
 
+		clear_credentials_cache()
+
 		return {
 			"success": True,
 			"message": _("Déconnecté de Google Calendar avec succès")
@@ -209,72 +231,212 @@ def get_credentials():
 	Récupère les credentials OAuth2 valides pour Google Calendar
 	Rafraîchit automatiquement le token si expiré
 
+	Les credentials sont mises en cache (Redis et worker) jusqu'à peu avant l'expiration
+	du token : les appels suivants évitent le chargement des Settings et le déchiffrement.
+
 	Returns:
 		Credentials: Google OAuth2 credentials ou None
 	"""
 	try:
-		settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
+		credentials = get_cached_credentials()
+		if credentials:
+			return credentials
 
-		frappe.logger().info(f"get_credentials - enabled: {settings.enabled}")
-		frappe.logger().info(f"get_credentials - has access_token: {bool(settings.access_token)}")
-		frappe.logger().info(f"get_credentials - has refresh_token: {bool(settings.refresh_token)}")
+		settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
+		credentials = build_credentials(settings)
 
-		if not settings.enabled:
-			frappe.logger().warning("Google Calendar not enabled")
+		if not credentials:
 			return None
 
-		if not settings.access_token or not settings.refresh_token:
-			frappe.logger().warning(f"Missing tokens - access: {bool(settings.access_token)}, refresh: {bool(settings.refresh_token)}")
-			return None
+		# Token expiré ou sur le point de l'être : rafraîchissement sous verrou
+		if _expires_soon(credentials) and credentials.refresh_token:
+			return refresh_credentials()
 
-		# Récupérer les tokens déchiffrés
-		access_token = settings.get_password("access_token")
-		refresh_token = settings.get_password("refresh_token")
+		cache_credentials(credentials)
 
-		frappe.logger().info(f"get_credentials - decrypted access_token: {bool(access_token)}")
-		frappe.logger().info(f"get_credentials - decrypted refresh_token: {bool(refresh_token)}")
+		return credentials
 
-		if not access_token or not refresh_token:
-			frappe.logger().error("Failed to decrypt tokens")
-			return None
+	except Exception as e:
+		frappe.log_error(frappe.get_traceback(), "Google OAuth - Get Credentials Error")
 
-		# Créer les credentials
-		credentials = Credentials(
-			token=access_token,
-			refresh_token=refresh_token,
-			token_uri="https://oauth2.googleapis.com/token",
-			client_id=settings.client_id,
-			client_secret=settings.get_password("client_secret"),
-			scopes=SCOPES
-		)
+		# Marquer comme erreur
+		try:
+			frappe.db.set_single_value("Google Calendar Settings", "sync_status", "Erreur")
+			frappe.db.commit()
+		except:
+			pass
+
+		return None
+
+
+def build_credentials(settings):
+	"""
+	Construit les credentials à partir des tokens enregistrés dans les Settings
+
+	Args:
+		settings: Document Google Calendar Settings
+
+	Returns:
+		Credentials: Google OAuth2 credentials ou None si non connecté
+	"""
+	if not settings.enabled:
+		frappe.logger().warning("Google Calendar not enabled")
+		return None
+
+	if not settings.access_token or not settings.refresh_token:
+		frappe.logger().warning(f"Missing tokens - access: {bool(settings.access_token)}, refresh: {bool(settings.refresh_token)}")
+		return None
+
+	# Récupérer les tokens déchiffrés
+	access_token = settings.get_password("access_token")
+	refresh_token = settings.get_password("refresh_token")
+
+	if not access_token or not refresh_token:
+		frappe.logger().error("Failed to decrypt tokens")
+		return None
+
+	# Créer les credentials
+	return Credentials(
+		token=access_token,
+		refresh_token=refresh_token,
+		token_uri="https://oauth2.googleapis.com/token",
+		client_id=settings.client_id,
+		client_secret=settings.get_password("client_secret"),
+		scopes=SCOPES,
+		expiry=get_datetime(settings.token_expiry) if settings.token_expiry else None
+	)
+
+
+def refresh_credentials(min_validity=CREDENTIALS_EXPIRY_MARGIN):
+	"""
+	Rafraîchit le token d'accès sous verrou Redis
+
+	Un seul worker appelle Google : les autres attendent la fin du rafraîchissement
+	puis réutilisent le nouveau token mis en cache, au lieu de rafraîchir à leur tour.
+
+	Args:
+		min_validity: Durée de validité restante en dessous de laquelle le token est rafraîchi
+
+	Returns:
+		Credentials: Google OAuth2 credentials ou None si non connecté
+	"""
+	with redis_lock(TOKEN_REFRESH_LOCK, timeout=TOKEN_REFRESH_LOCK_TIMEOUT, wait=TOKEN_REFRESH_LOCK_TIMEOUT) as acquired:
+		if not acquired:
+			frappe.logger().warning("Google token refresh lock not acquired, refreshing anyway")
+
+		# Un autre worker a pu rafraîchir le token pendant l'attente
+		credentials = get_cached_credentials()
+		if credentials and not _expires_soon(credentials, min_validity):
+			return credentials
+
+		settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
+		credentials = build_credentials(settings)
+
+		if not credentials:
+			return None
 
-		# Vérifier si le token est expiré et le rafraîchir si nécessaire
-		if credentials.expired and credentials.refresh_token:
+		if _expires_soon(credentials, min_validity):
 			credentials.refresh(Request())
 
-			# Sauvegarder le nouveau token
-			settings.access_token = credentials.token
+			# Seuls le token et son expiration sont écrits : sauvegarder le document chargé
+			# avant l'appel réseau écraserait l'état des calendriers (syncToken, repères...)
+			# mis à jour entre-temps par les synchronisations en cours
+			set_encrypted_password(settings.doctype, settings.name, credentials.token, "access_token")
 			if credentials.expiry:
-				settings.token_expiry = credentials.expiry
-			settings.save(ignore_permissions=True)
+				settings.db_set("token_expiry", credentials.expiry, update_modified=False)
 			frappe.db.commit()
 
+		# Mis en cache avant de libérer le verrou : les workers en attente le réutilisent
+		cache_credentials(credentials)
+
 		return credentials
 
+
+def refresh_token_ahead_of_expiry():
+	"""
+	Rafraîchit le token avant son expiration
+	Appelée par le Scheduled Job, pour que les requêtes n'aient jamais à le faire
+	"""
+	try:
+		settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
+
+		if not settings.enabled or settings.sync_status != "Connecté":
+			return
+
+		refresh_credentials(min_validity=TOKEN_REFRESH_AHEAD)
+
 	except Exception as e:
-		frappe.log_error(frappe.get_traceback(), "Google OAuth - Get Credentials Error")
+		frappe.log_error(frappe.get_traceback(), "Google OAuth - Scheduled Token Refresh Error")
 
-		# Marquer comme erreur
-		try:
-			settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
-			settings.sync_status = "Erreur"
-			settings.save(ignore_permissions=True)
-			frappe.db.commit()
-		except:
-			pass
 
+def get_cached_credentials():
+	"""
+	Renvoie les credentials en cache si le token est encore valide
+
+	Une seule lecture Redis par appel : si le token n'a pas changé, l'objet Credentials
+	déjà construit par ce worker est réutilisé (ainsi que le service Google associé).
+	Un token rafraîchi par un autre worker est repris avec les secrets de l'objet local ;
+	un worker qui n'en a pas encore lit les Settings (voir get_credentials).
+
+	Returns:
+		Credentials: Google OAuth2 credentials ou None
+	"""
+	data = frappe.cache().get_value(CREDENTIALS_CACHE_KEY)
+	local = _credentials_cache.get(frappe.local.site)
+	if not data or not local:
+		return None
+
+	info = json.loads(data)
+
+	if local.token != info.get("token"):
+		local = Credentials(
+			token=info.get("token"),
+			refresh_token=local.refresh_token,
+			token_uri=local.token_uri,
+			client_id=local.client_id,
+			client_secret=local.client_secret,
+			scopes=SCOPES,
+			expiry=datetime.fromisoformat(info["expiry"])
+		)
+		_credentials_cache[frappe.local.site] = local
+
+	if _expires_soon(local):
 		return None
 
+	return local
+
+
+def cache_credentials(credentials):
+	"""
+	Met en cache des credentials jusqu'à peu avant l'expiration de leur token
+
+	Args:
+		credentials: Google OAuth2 credentials
+	"""
+	if not credentials.expiry:
+		return
+
+	ttl = (credentials.expiry - datetime.utcnow() - CREDENTIALS_EXPIRY_MARGIN).total_seconds()
+	if ttl <= 0:
+		return
+
+	# Jamais les secrets longue durée : Redis est partagé et non chiffré
+	payload = json.dumps({"token": credentials.token, "expiry": credentials.expiry.isoformat()})
+	frappe.cache().set_value(CREDENTIALS_CACHE_KEY, payload, expires_in_sec=int(ttl))
+	_credentials_cache[frappe.local.site] = credentials
+
+
+def clear_credentials_cache():
+	"""
+	Invalide les credentials en cache (connexion, déconnexion, modification des Settings)
+	"""
+	frappe.cache().delete_value(CREDENTIALS_CACHE_KEY)
+	_credentials_cache.pop(frappe.local.site, None)
+
+
+def _expires_soon(credentials, margin=CREDENTIALS_EXPIRY_MARGIN):
+	return not credentials.expiry or credentials.expiry - margin <= datetime.utcnow()
+
 
 def get_redirect_uri():
 	"""
@@ -0,0 +1,147 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+"""
+Import de l'historique d'un calendrier (Google Calendar Sync Config.backfill_until)
+L'historique est lu par tranches d'un mois en remontant le temps, une tâche de fond par
+tranche ; backfill_cursor mémorise la dernière tranche importée pour reprendre après un
+arrêt. La synchronisation régulière n'est pas bloquée : elle ne lit que sa fenêtre.
+"""
+
+import frappe
+from reunion.meeting_management.api.google_auth import get_credentials
+from reunion.meeting_management.api.google_calendar import (
+	fetch_calendar_events,
+	get_quota_bucket,
+	is_series_mode,
+	sync_events_to_doctype,
+	update_calendar_config
+)
+from reunion.meeting_management.utils.google_client import MAX_PAGE_SIZE, get_calendar_service
+from reunion.meeting_management.utils.locks import SingleFlight
+from reunion.meeting_management.utils.sync_window import next_backfill_chunk, sync_window, to_google_time
+from reunion.meeting_management.utils.transaction import TransactionBatch
+
+
+BACKFILL_FLIGHT = "google_calendar_backfill"
+# Durée maximale d'une tranche (secondes)
+BACKFILL_JOB_TIMEOUT = 1800
+
+
+def enqueue_backfill(cal_config):
+	"""
+	Lance l'import de la prochaine tranche de l'historique d'un calendrier (file "long")
+	Sans effet si l'historique est importé ou si cette tranche est déjà en file ou en cours
+
+	Args:
+		cal_config: Ligne Google Calendar Sync Config
+	"""
+	chunk = get_next_chunk(cal_config)
+	if not chunk or SingleFlight(f"{BACKFILL_FLIGHT}:{cal_config.calendar_id}").owner():
+		return
+
+	frappe.enqueue(
+		"reunion.meeting_management.api.google_backfill.run_backfill",
+		queue="long",
+		timeout=BACKFILL_JOB_TIMEOUT,
+		# Identifiant propre à la tranche : la tranche suivante est mise en file par la tâche en cours
+		job_id=f"{BACKFILL_FLIGHT}::{cal_config.calendar_id}::{chunk[1]}",
+		deduplicate=True,
+		# Depuis on_update des paramètres : la tâche doit lire backfill_until enregistré
+		enqueue_after_commit=True,
+		calendar_id=cal_config.calendar_id
+	)
+
+
+def resume_backfills():
+	"""
+	Relance les imports d'historique interrompus (worker arrêté, erreur Google...)
+	Appelée par le Scheduled Job
+	"""
+	settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
+
+	if not settings.enabled or settings.sync_status != "Connecté":
+		return
+
+	for cal_config in settings.calendars_to_sync:
+		if cal_config.enabled:
+			enqueue_backfill(cal_config)
+
+
+def get_next_chunk(cal_config):
+	"""
+	Returns:
+		tuple: (début, fin) de la prochaine tranche à importer, None si l'historique est importé
+	"""
+	window_start, _window_end = sync_window(cal_config.days_past, cal_config.days_future)
+	return next_backfill_chunk(cal_config.backfill_until, cal_config.backfill_cursor, window_start)
+
+
+def run_backfill(calendar_id):
+	"""
+	Tâche de fond : importe une tranche de l'historique puis met la suivante en file
+
+	Args:
+		calendar_id: ID du calendrier Google
+	"""
+	flight = SingleFlight(f"{BACKFILL_FLIGHT}:{calendar_id}")
+	if not flight.acquire():
+		return
+
+	cal_config = None
+
+	try:
+		settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
+		cal_config = next(
+			(row for row in settings.calendars_to_sync if row.calendar_id == calendar_id and row.enabled),
+			None
+		)
+
+		chunk = cal_config and get_next_chunk(cal_config)
+		if not chunk:
+			return
+
+		credentials = get_credentials()
+		if not credentials:
+			return
+
+		start, end = chunk
+		pager = fetch_calendar_events(
+			get_calendar_service(credentials),
+			calendar_id,
+			None,
+			to_google_time(start),
+			to_google_time(end),
+			settings.page_size,
+			get_quota_bucket(settings),
+			not is_series_mode(cal_config)
+		)
+
+		batch = TransactionBatch(settings.commit_batch_size)
+		synced = 0
+
+		for page in pager.pages():
+			flight.heartbeat()
+			synced += sync_events_to_doctype(page, cal_config, MAX_PAGE_SIZE, batch).synced
+
+		batch.commit()
+
+		# Tranche importée : la suivante repartira de son début
+		update_calendar_config(cal_config, backfill_cursor=start)
+		frappe.db.commit()
+
+		frappe.logger().info(
+			f"Google Calendar backfill {calendar_id}: {start} -> {end}, {synced} synced in {pager.pages_fetched} page(s)"
+		)
+
+	except Exception:
+		cal_config = None
+		frappe.db.rollback()
+		frappe.log_error(frappe.get_traceback(), f"Google Calendar - Backfill Error for {calendar_id}")
+
+	finally:
+		flight.release()
+
+	# Une tâche par tranche : le worker est libéré entre deux mois
+	if cal_config:
+		enqueue_backfill(cal_config)
@@ -7,10 +7,70 @@ API pour la synchronisation avec Google Calendar
 
 import frappe
 from frappe import _
-from googleapiclient.discovery import build
-from datetime import datetime, timedelta
-from dateutil import parser as dateutil_parser
+from frappe.utils import now_datetime
+from googleapiclient.errors import HttpError
+from datetime import datetime
+from functools import partial
+from itertools import islice
 from reunion.meeting_management.api.google_auth import get_credentials
+from reunion.meeting_management.utils.google_client import (
+	EventPager,
+	SeriesPager,
+	DEFAULT_PAGE_SIZE,
+	MAX_PAGE_SIZE,
+	MAX_BATCH_SIZE,
+	CALENDAR_FIELDS,
+	CALENDAR_LIST_FIELDS,
+	PUSHED_EVENT_FIELDS,
+	execute_batch,
+	get_calendar_service
+)
+from reunion.meeting_management.utils.transaction import TransactionBatch
+from reunion.meeting_management.utils.concurrent_fetch import CalendarFetcher
+from reunion.meeting_management.utils.locks import SingleFlight
+from reunion.meeting_management.utils.content_hash import ORIGIN_ERPNEXT, ORIGIN_GOOGLE, REPEAT_FIELDS, content_hash
+from reunion.meeting_management.utils.rate_limit import QuotaBucket, execute_request
+from reunion.meeting_management.utils.sync_metrics import STATUS_ERROR, SyncMetrics, percentile
+from reunion.meeting_management.utils.recurrence import repeat_fields_from_google, rrule_from_repeat_fields
+from reunion.meeting_management.utils.sync_window import needs_full_resync, sync_window, to_google_time
+from reunion.meeting_management.utils.google_time import erpnext_to_google, google_date_to_erpnext, google_to_erpnext
+from reunion.meeting_management.doctype.google_calendar_sync_failure.google_calendar_sync_failure import (
+	DIRECTION_PULL,
+	DIRECTION_PUSH,
+	clear_failures,
+	record_failure
+)
+
+
+# Événement temps réel suivi par le formulaire Google Calendar Settings
+SYNC_PROGRESS_EVENT = "google_calendar_sync_progress"
+# Durée maximale d'une synchronisation lancée depuis le formulaire (file "long")
+SYNC_JOB_TIMEOUT = 3600
+# Verrous d'exécution unique par sens de synchronisation (le verrou de chaque
+# calendrier importé est suffixé par son ID)
+SYNC_FLIGHTS = {
+	"from_google": "google_calendar_sync::from_google",
+	"to_google": "google_calendar_sync::to_google"
+}
+# Traitement des événements supprimés dans Google (Google Calendar Settings.deleted_events_action)
+DELETED_EVENTS_DELETE = "Supprimer"
+DELETED_EVENTS_CANCEL = "Annuler"
+# Stockage des événements récurrents (Google Calendar Sync Config.recurring_mode)
+RECURRING_MODE_INSTANCES = "Occurrences"
+RECURRING_MODE_SERIES = "Séries"
+# Nombre de lignes supprimées (ou annulées) par requête
+DELETE_CHUNK_SIZE = 500
+# Documents rattachés par lien dynamique, supprimés avec les lignes (DocType, champ DocType, champ nom)
+DYNAMIC_LINKS = (
+	("ToDo", "reference_type", "reference_name"),
+	("Comment", "reference_doctype", "reference_name"),
+	("Version", "ref_doctype", "docname"),
+	("DocShare", "share_doctype", "share_name"),
+	("View Log", "reference_doctype", "reference_name"),
+	("Document Follow", "ref_doctype", "ref_docname")
+)
+# Attente maximale d'un import ciblé quand le calendrier est déjà en cours d'import (secondes)
+TARGETED_SYNC_WAIT = 120
 
 
 @frappe.whitelist()
@@ -34,15 +94,18 @@ def get_calendar_info():
 				"message": _("Non connecté à Google Calendar")
 			}
 
-		# Construire le service Google Calendar API
-		service = build('calendar', 'v3', credentials=credentials)
+		# Service Google Calendar API (construit une fois par thread)
+		service = get_calendar_service(credentials)
 
 		# Récupérer les infos du calendrier
 		settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
 		calendar_id = settings.calendar_id or "primary"
 
 		# Obtenir les détails du calendrier
-		calendar = service.calendars().get(calendarId=calendar_id).execute()
+		calendar = execute_request(
+			service.calendars().get(calendarId=calendar_id, fields=CALENDAR_FIELDS),
+			get_quota_bucket(settings)
+		)
 
 		return {
 			"success": True,
@@ -84,11 +147,11 @@ def list_calendars():
 				"message": _("Non connecté à Google Calendar")
 			}
 
-		# Construire le service Google Calendar API
-		service = build('calendar', 'v3', credentials=credentials)
+		# Service Google Calendar API (construit une fois par thread)
+		service = get_calendar_service(credentials)
 
 		# Lister tous les calendriers
-		calendar_list = service.calendarList().list().execute()
+		calendar_list = execute_request(service.calendarList().list(fields=CALENDAR_LIST_FIELDS), get_quota_bucket())
 
 		calendars = []
 		for calendar in calendar_list.get('items', []):
@@ -116,14 +179,26 @@ def list_calendars():
 
 
 @frappe.whitelist()
-def sync_from_google():
+def sync_from_google(calendar_id=None):
 	"""
 	Importe les événements de Google Calendar vers ERPNext
 	Synchronise tous les calendriers configurés vers leurs DocTypes respectifs (Event ou Task)
 
+	Une seule importation complète tourne à la fois sur le site, et chaque calendrier
+	n'est importé que par une exécution à la fois : les appels concurrents sont ignorés
+	(ou se limitent aux calendriers libres) au lieu de refaire le même travail.
+
+	Args:
+		calendar_id: Limiter la synchronisation à ce calendrier (ex: notification push)
+
 	Returns:
-		dict: {"success": bool, "events_synced": int, "tasks_synced": int, "message": str}
+		dict: {"success": bool, "events_synced": int, "tasks_synced": int, "sync_run": str, "message": str}
 	"""
+	flights = []
+	# Verrou de chaque calendrier, libéré dès que son import est terminé
+	calendar_flights = {}
+	metrics = None
+
 	try:
 		credentials = get_credentials()
 
@@ -142,73 +217,177 @@ def sync_from_google():
 				"message": _("Aucun calendrier configuré. Cliquez sur 'Charger les calendriers' d'abord.")
 			}
 
-		# Construire le service Google Calendar API
-		service = build('calendar', 'v3', credentials=credentials)
-
-		# Récupérer les événements : 1 mois avant aujourd'hui et 2 mois après aujourd'hui
+		# Fenêtre propre à chaque calendrier (days_past / days_future), calculée au même instant
 		now = datetime.utcnow()
-		time_min = (now - timedelta(days=30)).isoformat() + 'Z'  # 1 mois avant
-		time_max = (now + timedelta(days=60)).isoformat() + 'Z'  # 2 mois après
 
 		total_events_synced = 0
 		total_tasks_synced = 0
+		total_skipped = 0
+		total_deleted = 0
 		calendars_processed = 0
 
-		# Parcourir chaque calendrier configuré
+		# Les écritures sont validées par lots plutôt qu'à chaque événement
+		batch = TransactionBatch(settings.commit_batch_size)
+
+		if not calendar_id:
+			flight = SingleFlight(SYNC_FLIGHTS["from_google"])
+			if not flight.acquire():
+				return sync_already_running("from_google", flight)
+			flights.append(flight)
+
+		calendars = {}
 		for cal_config in settings.calendars_to_sync:
-			if not cal_config.enabled:
+			if not cal_config.enabled or (calendar_id and cal_config.calendar_id != calendar_id):
+				continue
+
+			# Calendrier déjà en cours d'import : une importation complète le laisse à l'exécution
+			# en cours, un import ciblé (notification push) attend qu'elle se termine pour
+			# récupérer les modifications survenues entre-temps
+			flight = SingleFlight(f"{SYNC_FLIGHTS['from_google']}:{cal_config.calendar_id}")
+			if not flight.acquire(wait=TARGETED_SYNC_WAIT if calendar_id else 0):
+				continue
+
+			calendar_flights[cal_config.name] = flight
+			calendars[cal_config.name] = cal_config
+
+		if calendar_id and not calendars:
+			return sync_already_running("from_google")
+
+		# Durées et compteurs enregistrés dans Google Calendar Sync Run
+		metrics = SyncMetrics(DIRECTION_PULL, calendar_id)
+		failed_calendars = set()
+
+		# Quota Google partagé par tous les threads et workers du site
+		bucket = get_quota_bucket(settings)
+
+		# Un flux incrémental ne renvoie que les événements modifiés : la fenêtre glissante
+		# (occurrences des séries, événements anciens entrant dans la fenêtre) n'avance
+		# qu'avec une lecture complète, refaite périodiquement
+		window_anchor = now_datetime()
+		full_reads = {
+			name for name, cal_config in calendars.items()
+			if not cal_config.sync_token or needs_full_resync(cal_config.window_anchor, window_anchor)
+		}
+
+		def open_pager(cal_config, sync_token):
+			# Exécuté dans un thread : get_calendar_service fournit un service par thread
+			service = get_calendar_service(credentials)
+			time_min, time_max = get_sync_window(cal_config, now)
+			return fetch_calendar_events(service, cal_config.calendar_id, sync_token, time_min, time_max,
+				page_size, bucket, not is_series_mode(cal_config))
+
+		# Les calendriers sont lus en parallèle, les pages sont écrites ici au fil de l'eau
+		fetcher = CalendarFetcher(settings.sync_concurrency)
+		page_size = settings.page_size
+		jobs = [
+			(name, partial(open_pager, cal_config, None if name in full_reads else cal_config.sync_token))
+			for name, cal_config in calendars.items()
+		]
+
+		calendars_done = 0
+
+		def release_calendar(name):
+			# Écritures du calendrier validées (lot et token, écrit hors lot) avant de laisser
+			# la place à un import ciblé
+			batch.commit()
+			frappe.db.commit()
+			flight = calendar_flights.pop(name, None)
+			if flight:
+				flight.release()
+
+		for kind, name, payload in fetcher.run(jobs):
+			cal_config = calendars[name]
+
+			# Prolonge les verrous tant que l'import progresse
+			for flight in flights + list(calendar_flights.values()):
+				flight.heartbeat()
+
+			if kind != "page":
+				calendars_done += 1
+
+			if kind == "error":
+				failed_calendars.add(name)
+				metrics.finish_calendar(cal_config.calendar_id, error=True)
+				frappe.log_error(payload, f"Google Calendar - Sync Error for {cal_config.calendar_id}")
+				publish_sync_progress("from_google", cal_config, calendars_done, len(calendars), status="error")
+				release_calendar(name)
+				continue
+
+			if name in failed_calendars:
+				# Continue avec les autres calendriers même si un échoue
 				continue
 
 			try:
-				# Récupérer les événements de ce calendrier
-				events_result = service.events().list(
-					calendarId=cal_config.calendar_id,
-					timeMin=time_min,
-					timeMax=time_max,
-					maxResults=100,
-					singleEvents=True,
-					orderBy='startTime'
-				).execute()
-
-				events = events_result.get('items', [])
-
-				# Synchroniser chaque événement vers le DocType configuré
-				for event in events:
-					try:
-						if cal_config.sync_to_doctype == "Event":
-							sync_event_to_erpnext(event, cal_config.calendar_id)
-							total_events_synced += 1
-						elif cal_config.sync_to_doctype == "Task":
-							sync_event_to_task(event, cal_config.calendar_id)
-							total_tasks_synced += 1
-					except Exception as e:
-						# Log mais ne pas arrêter la synchronisation
-						frappe.log_error(
-							f"Error syncing event {event.get('id', 'unknown')}: {str(e)}\n{frappe.get_traceback()}",
-							f"Google Calendar - Sync Single Event Error"
-						)
-
-				calendars_processed += 1
+				if kind == "page":
+					# Une page Google = un lot (une seule requête de recherche des existants)
+					with metrics.timer(cal_config.calendar_id, "db_time"):
+						counts = sync_events_to_doctype(payload, cal_config, MAX_PAGE_SIZE, batch)
+
+					metrics.add(cal_config.calendar_id, pages=1, synced=counts.synced, skipped=counts.skipped,
+						failed=counts.failed, deleted=counts.deleted, db_writes=counts.synced + counts.deleted)
+
+					if cal_config.sync_to_doctype == "Event":
+						total_events_synced += counts.synced
+					elif cal_config.sync_to_doctype == "Task":
+						total_tasks_synced += counts.synced
+					total_skipped += counts.skipped
+					total_deleted += counts.deleted
+
+					publish_sync_progress("from_google", cal_config, calendars_done, len(calendars),
+						events_synced=total_events_synced, tasks_synced=total_tasks_synced, skipped=total_skipped)
+
+				elif kind == "done":
+					if payload.sync_token_expired:
+						frappe.logger().info(f"Sync token expired for {cal_config.calendar_id}, ran full sync")
+
+					# Mémoriser le token pour ne récupérer que les modifications au prochain passage
+					if payload.next_sync_token:
+						save_sync_token(cal_config, payload.next_sync_token)
+					elif payload.sync_token_expired:
+						save_sync_token(cal_config, None)
+
+					# Fenêtre entièrement relue : prochaine lecture complète dans FULL_RESYNC_INTERVAL
+					if name in full_reads or payload.sync_token_expired:
+						update_calendar_config(cal_config, window_anchor=window_anchor)
+
+					calendars_processed += 1
+					metrics.add(cal_config.calendar_id, api_calls=payload.pages_fetched, api_time=payload.api_time)
+					metrics.finish_calendar(cal_config.calendar_id)
+					release_calendar(name)
+
+					publish_sync_progress("from_google", cal_config, calendars_done, len(calendars),
+						events_synced=total_events_synced, tasks_synced=total_tasks_synced, skipped=total_skipped)
 
 			except Exception as e:
+				failed_calendars.add(name)
+				metrics.finish_calendar(cal_config.calendar_id, error=True)
 				frappe.log_error(
 					frappe.get_traceback(),
 					f"Google Calendar - Sync Error for {cal_config.calendar_id}"
 				)
-				# Continue avec les autres calendriers même si un échoue
-				continue
+				# Ses pages suivantes ne sont plus lues, son verrou est libéré sans attendre la fin
+				fetcher.cancel(name)
+				release_calendar(name)
+				if kind == "page":
+					calendars_done += 1
+				publish_sync_progress("from_google", cal_config, calendars_done, len(calendars), status="error")
 
 		# Mettre à jour la date de dernière synchronisation
-		settings.last_sync = datetime.now()
-		settings.sync_status = "Connecté"
-		settings.save(ignore_permissions=True)
+		# (sans sauvegarder les lignes de calendrier, modifiées entre-temps par l'import de l'historique)
+		settings.db_set({"last_sync": datetime.now(), "sync_status": "Connecté"})
 		frappe.db.commit()
 
+		sync_run = metrics.save()
+
 		message_parts = []
 		if total_events_synced > 0:
 			message_parts.append(f"{total_events_synced} événement(s)")
 		if total_tasks_synced > 0:
 			message_parts.append(f"{total_tasks_synced} tâche(s)")
+		if total_skipped > 0:
+			message_parts.append(f"{total_skipped} inchangé(s)")
+		if total_deleted > 0:
+			message_parts.append(f"{total_deleted} supprimé(s)")
 
 		message = _("Synchronisation réussie: {0} depuis {1} calendrier(s)").format(
 			" et ".join(message_parts) if message_parts else "0 éléments",
@@ -219,35 +398,357 @@ def sync_from_google():
 			"success": True,
 			"events_synced": total_events_synced,
 			"tasks_synced": total_tasks_synced,
+			"skipped": total_skipped,
+			"deleted": total_deleted,
 			"calendars_processed": calendars_processed,
+			"sync_run": sync_run,
 			"message": message
 		}
 
 	except Exception as e:
 		frappe.log_error(frappe.get_traceback(), "Google Calendar - Sync From Google Error")
+		traceback = frappe.get_traceback()
 
-		# Marquer comme erreur
+		# Marquer comme erreur (sans réécrire les lignes de calendrier, voir plus haut)
 		try:
-			settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
-			settings.sync_status = "Erreur"
-			settings.save(ignore_permissions=True)
+			frappe.db.set_single_value("Google Calendar Settings", "sync_status", "Erreur")
 			frappe.db.commit()
 		except:
 			pass
 
+		if metrics:
+			metrics.save(STATUS_ERROR, traceback)
+
 		return {
 			"success": False,
 			"message": str(e)
 		}
 
+	finally:
+		for flight in flights + list(calendar_flights.values()):
+			flight.release()
+
+
+def get_sync_window(cal_config, now=None):
+	"""
+	Fenêtre lue lors d'une synchronisation complète d'un calendrier
+
+	Args:
+		cal_config: Ligne Google Calendar Sync Config (days_past, days_future)
+		now: Instant de référence UTC (maintenant par défaut)
+
+	Returns:
+		tuple: (time_min, time_max) au format RFC 3339
+	"""
+	time_min, time_max = sync_window(cal_config.days_past, cal_config.days_future, now)
+	return to_google_time(time_min), to_google_time(time_max)
+
+
+def is_series_mode(cal_config):
+	"""
+	Returns:
+		bool: True si les séries de ce calendrier sont stockées une seule fois (Events uniquement,
+			les Tasks n'ont pas de champs de répétition)
+	"""
+	return cal_config.recurring_mode == RECURRING_MODE_SERIES and cal_config.sync_to_doctype == "Event"
+
+
+def fetch_calendar_events(service, calendar_id, sync_token, time_min, time_max, page_size=None, bucket=None,
+		single_events=True):
+	"""
+	Prépare la lecture paginée des événements d'un calendrier Google
+	Utilise le syncToken stocké pour ne récupérer que les modifications depuis le dernier passage,
+	et repasse en synchronisation complète si Google répond 410 Gone (token expiré)
+	Les suppressions (status "cancelled") sont demandées dans les deux cas
+
+	N'accède pas à la base : peut être appelée depuis un thread de CalendarFetcher.
+
+	Args:
+		service: Service Google Calendar API
+		calendar_id: ID du calendrier Google
+		sync_token: syncToken du dernier passage (None pour une synchronisation complète)
+		time_min: Début de la fenêtre (synchronisation complète, occurrences des séries)
+		time_max: Fin de la fenêtre (synchronisation complète, occurrences des séries)
+		page_size: Nombre d'événements par page (maxResults)
+		bucket: QuotaBucket du site (voir get_quota_bucket)
+		single_events: False pour recevoir les séries une seule fois (mode "Séries")
+
+	Returns:
+		EventPager: Itérateur sur les événements, nextSyncToken disponible en fin de parcours
+	"""
+	pager = None
+
+	if sync_token:
+		try:
+			# syncToken est incompatible avec timeMin, timeMax et orderBy
+			pager = EventPager(
+				service,
+				calendar_id,
+				page_size,
+				bucket,
+				syncToken=sync_token,
+				showDeleted=True,
+				singleEvents=single_events
+			).start()
+
+		except HttpError as e:
+			if e.resp.status != 410:
+				raise
+
+	if pager is None:
+		pager = EventPager(
+			service,
+			calendar_id,
+			page_size,
+			bucket,
+			timeMin=time_min,
+			timeMax=time_max,
+			# Les suppressions faites depuis le dernier passage doivent être appliquées
+			# avant que le nouveau syncToken ne les dépasse
+			showDeleted=True,
+			singleEvents=single_events
+		)
+		# Token invalidé par Google : on repart d'une synchronisation complète
+		pager.sync_token_expired = bool(sync_token)
+
+	if not single_events:
+		# Les séries sans équivalent ERPNext (règle, exceptions) sont importées occurrence par occurrence
+		return SeriesPager(
+			pager,
+			# Fuseau sans incidence sur l'équivalence : System Settings n'est pas lu dans le thread
+			lambda master: repeat_fields_from_google(master, "UTC") is not None,
+			timeMin=time_min,
+			timeMax=time_max,
+			# Occurrences supprimées d'une série déjà importée occurrence par occurrence
+			showDeleted=True
+		)
+
+	return pager
+
+
+def sync_events_to_doctype(events, cal_config, chunk_size=DEFAULT_PAGE_SIZE, batch=None):
+	"""
+	Consomme un flux d'événements Google et les synchronise vers le DocType configuré
+	Les documents existants sont recherchés en une seule requête par lot d'événements,
+	et ceux dont l'etag Google n'a pas changé ne sont pas réécrits
+	Les documents des événements supprimés dans Google sont supprimés (ou annulés) par lot
+	Un événement en erreur est enregistré dans Google Calendar Sync Failure pour être retenté
+
+	Args:
+		events: Itérable d'événements Google Calendar (dict), ex: EventPager
+		cal_config: Ligne Google Calendar Sync Config
+		chunk_size: Nombre d'événements traités par lot
+		batch: TransactionBatch regroupant les commits (un nouveau lot par défaut)
+
+	Returns:
+		frappe._dict: {"synced": int, "skipped": int, "failed": int, "deleted": int}
+	"""
+	upsert = {
+		"Event": sync_event_to_erpnext,
+		"Task": sync_event_to_task
+	}.get(cal_config.sync_to_doctype)
+
+	counts = frappe._dict(synced=0, skipped=0, failed=0, deleted=0)
+
+	if not upsert:
+		return counts
+
+	batch = batch or TransactionBatch()
+	deleted_events_action = frappe.db.get_single_value(
+		"Google Calendar Settings", "deleted_events_action", cache=True
+	) or DELETED_EVENTS_DELETE
+
+	try:
+		for chunk in iter_chunks(events, chunk_size):
+			existing_rows = get_synced_rows(
+				cal_config.sync_to_doctype,
+				cal_config.calendar_id,
+				[event.get('id') for event in chunk]
+			)
+
+			# Événements supprimés dans Google (lectures incrémentales et complètes, showDeleted)
+			cancelled = [
+				existing_rows[event['id']].name for event in chunk
+				if event.get('status') == 'cancelled' and event.get('id') in existing_rows
+			]
+			if cancelled:
+				counts.deleted += remove_cancelled_rows(
+					cal_config.sync_to_doctype, cancelled, deleted_events_action, batch
+				)
+
+			# Événements à jour dans ERPNext : leurs échecs éventuels sont résolus
+			resolved = [event.get('id') for event in chunk if event.get('status') == 'cancelled']
+
+			for event in chunk:
+				if event.get('status') == 'cancelled':
+					continue
+
+				existing = existing_rows.get(event.get('id'))
+
+				# Événement inchangé côté Google : aucune écriture
+				if existing and existing.google_etag and existing.google_etag == event.get('etag'):
+					counts.skipped += 1
+					continue
+
+				try:
+					# Savepoint par événement : une erreur n'annule que celui-ci
+					with batch.item():
+						upsert(event, cal_config.calendar_id, existing.name if existing else None)
+					counts.synced += 1
+					resolved.append(event.get('id'))
+				except Exception as e:
+					# Retenté plus tard par retry_failed_syncs, sans arrêter la synchronisation
+					counts.failed += 1
+					record_failure(
+						DIRECTION_PULL,
+						cal_config.calendar_id,
+						event.get('id'),
+						frappe.get_traceback(),
+						cal_config.sync_to_doctype,
+						existing.name if existing else None
+					)
+
+			clear_failures(DIRECTION_PULL, cal_config.calendar_id, resolved)
+	finally:
+		# Valider ce qui a été importé, même si la lecture d'une page a échoué
+		batch.commit()
+
+	return counts
+
+
+def remove_cancelled_rows(doctype, names, action=DELETED_EVENTS_DELETE, batch=None):
+	"""
+	Supprime (ou annule) en masse les documents d'événements supprimés dans Google
+	La suppression se fait par requêtes groupées, sans charger les documents (les hooks
+	on_trash ne sont pas appelés) : tables enfants, pièces jointes et documents liés
+	(commentaires, versions, ToDo...) sont supprimés avec eux, comme le fait frappe.delete_doc.
+	Les Tasks sont toujours annulées : arborescence (parent_task) et liens des feuilles
+	de temps et projets ne permettent pas de les supprimer en masse.
+
+	Args:
+		doctype: "Event" ou "Task"
+		names: Noms des documents concernés
+		action: DELETED_EVENTS_DELETE ou DELETED_EVENTS_CANCEL (statut "Cancelled")
+		batch: TransactionBatch en cours (un savepoint par groupe de lignes)
+
+	Returns:
+		int: Nombre de documents supprimés ou annulés
+	"""
+	batch = batch or TransactionBatch()
+	if doctype == "Task":
+		action = DELETED_EVENTS_CANCEL
+
+	child_doctypes = [field.options for field in frappe.get_meta(doctype).get_table_fields()]
+	removed = 0
+
+	for chunk in iter_chunks(names, DELETE_CHUNK_SIZE):
+		try:
+			with batch.item():
+				if action == DELETED_EVENTS_CANCEL:
+					frappe.db.set_value(doctype, {"name": ["in", chunk]}, "status", "Cancelled")
+				else:
+					delete_rows(doctype, chunk, child_doctypes)
+			removed += len(chunk)
+		except Exception as e:
+			frappe.log_error(frappe.get_traceback(), f"Google Calendar - Remove Cancelled {doctype} Error")
+
+	return removed
+
+
+def delete_rows(doctype, names, child_doctypes):
+	"""
+	Supprime des documents et ce que frappe.delete_doc supprimerait avec eux
+
+	Args:
+		doctype: DocType des documents
+		names: Noms des documents
+		child_doctypes: DocTypes de leurs tables enfants
+	"""
+	for child_doctype in child_doctypes:
+		frappe.db.delete(child_doctype, {"parenttype": doctype, "parent": ["in", names]})
+
+	# Fichiers supprimés un par un pour retirer aussi le fichier sur disque (rares sur ces documents)
+	for file_name in frappe.get_all("File",
+			filters={"attached_to_doctype": doctype, "attached_to_name": ["in", names]}, pluck="name"):
+		frappe.delete_doc("File", file_name, ignore_permissions=True)
+
+	for linked_doctype, doctype_field, name_field in DYNAMIC_LINKS:
+		frappe.db.delete(linked_doctype, {doctype_field: doctype, name_field: ["in", names]})
+
+	frappe.db.delete(doctype, {"name": ["in", names]})
+
 
-def sync_event_to_erpnext(google_event, calendar_id):
+def get_synced_rows(doctype, calendar_id, google_event_ids):
+	"""
+	Charge en une requête les documents déjà synchronisés d'un calendrier
+
+	Args:
+		doctype: "Event" ou "Task"
+		calendar_id: ID du calendrier source
+		google_event_ids: IDs Google des événements à rechercher
+
+	Returns:
+		dict: {google_event_id: {"name", "google_etag"}}
+	"""
+	google_event_ids = [event_id for event_id in google_event_ids if event_id]
+	if not google_event_ids:
+		return {}
+
+	rows = frappe.get_all(doctype,
+		filters={
+			'google_calendar_id': calendar_id,
+			'google_event_id': ['in', google_event_ids]
+		},
+		fields=['name', 'google_event_id', 'google_etag']
+	)
+
+	return {row.google_event_id: row for row in rows}
+
+
+def iter_chunks(iterable, size):
+	"""
+	Découpe un itérable en listes de taille maximale size sans le matérialiser entièrement
+	"""
+	iterator = iter(iterable)
+	while True:
+		chunk = list(islice(iterator, size))
+		if not chunk:
+			return
+		yield chunk
+
+
+def save_sync_token(cal_config, sync_token):
+	"""
+	Enregistre le syncToken d'un calendrier
+
+	Args:
+		cal_config: Ligne Google Calendar Sync Config
+		sync_token: Nouveau token (None pour forcer une synchronisation complète)
+	"""
+	update_calendar_config(cal_config, sync_token=sync_token)
+
+
+def update_calendar_config(cal_config, **values):
+	"""
+	Met à jour l'état de synchronisation d'un calendrier sans sauvegarder tout le document Settings
+	La ligne en mémoire est aussi modifiée pour qu'un settings.save() ultérieur ne l'écrase pas
+
+	Args:
+		cal_config: Ligne Google Calendar Sync Config
+		values: Champs à mettre à jour
+	"""
+	cal_config.update(values)
+	frappe.db.set_value(cal_config.doctype, cal_config.name, values, update_modified=False)
+
+
+def sync_event_to_erpnext(google_event, calendar_id, existing=None):
 	"""
 	Synchronise un événement Google Calendar vers le DocType Event d'ERPNext
 
 	Args:
 		google_event: Événement Google Calendar (dict)
 		calendar_id: ID du calendrier source
+		existing: Nom de l'Event déjà synchronisé (voir get_synced_rows), None pour une création
 	"""
 	# Extraire les données de l'événement Google
 	google_event_id = google_event.get('id')
@@ -259,26 +760,11 @@ def sync_event_to_erpnext(google_event, calendar_id):
 	start = google_event.get('start', {})
 	end = google_event.get('end', {})
 
-	if 'dateTime' in start:
-		# Parser les dates ISO 8601 avec timezone et convertir en format MySQL
-		start_dt = dateutil_parser.parse(start['dateTime'])
-		end_dt = dateutil_parser.parse(end['dateTime'])
+	# Heures converties dans le fuseau du site, fin exclusive des journées entières ramenée au dernier jour
+	starts_on, ends_on, all_day = google_to_erpnext(start, end)
 
-		# Convertir au format MySQL (YYYY-MM-DD HH:MM:SS)
-		starts_on = start_dt.strftime('%Y-%m-%d %H:%M:%S')
-		ends_on = end_dt.strftime('%Y-%m-%d %H:%M:%S')
-		all_day = 0
-	else:
-		# Événements all-day (date uniquement)
-		starts_on = start['date'] + ' 00:00:00'
-		ends_on = end['date'] + ' 23:59:59'
-		all_day = 1
-
-	# Vérifier si l'événement existe déjà (par google_event_id)
-	existing = frappe.db.exists('Event', {
-		'google_event_id': google_event_id,
-		'google_calendar_id': calendar_id
-	})
+	# Série en mode "Séries" : règle stockée dans les champs de répétition de l'Event
+	repeat_fields = repeat_fields_from_google(google_event) or {'repeat_this_event': 0}
 
 	if existing:
 		# Mettre à jour l'événement existant
@@ -289,6 +775,8 @@ def sync_event_to_erpnext(google_event, calendar_id):
 		event_doc.starts_on = starts_on
 		event_doc.ends_on = ends_on
 		event_doc.all_day = all_day
+		event_doc.update(repeat_fields)
+		event_doc.google_etag = google_event.get('etag')
 		event_doc.save(ignore_permissions=True)
 	else:
 		# Créer un nouvel événement
@@ -302,21 +790,24 @@ def sync_event_to_erpnext(google_event, calendar_id):
 			'all_day': all_day,
 			'google_event_id': google_event_id,
 			'google_calendar_id': calendar_id,
+			'google_etag': google_event.get('etag'),
 			'event_type': 'Public',  # Par défaut
-			'status': 'Open'
+			'status': 'Open',
+			**repeat_fields
 		})
 		event_doc.insert(ignore_permissions=True)
 
-	frappe.db.commit()
+	set_google_origin(event_doc)
 
 
-def sync_event_to_task(google_event, calendar_id):
+def sync_event_to_task(google_event, calendar_id, existing=None):
 	"""
 	Synchronise un événement Google Calendar vers le DocType Task d'ERPNext
 
 	Args:
 		google_event: Événement Google Calendar (dict)
 		calendar_id: ID du calendrier source
+		existing: Nom de la Task déjà synchronisée (voir get_synced_rows), None pour une création
 	"""
 	# Extraire les données de l'événement Google
 	google_event_id = google_event.get('id')
@@ -327,18 +818,9 @@ def sync_event_to_task(google_event, calendar_id):
 	start = google_event.get('start', {})
 	end = google_event.get('end', {})
 
-	if 'dateTime' in start:
-		exp_start_date = start['dateTime'].split('T')[0]
-		exp_end_date = end['dateTime'].split('T')[0]
-	else:
-		exp_start_date = start['date']
-		exp_end_date = end['date']
-
-	# Vérifier si la tâche existe déjà
-	existing = frappe.db.exists('Task', {
-		'google_event_id': google_event_id,
-		'google_calendar_id': calendar_id
-	})
+	# Dates dans le fuseau du site, fin exclusive des journées entières ramenée au dernier jour
+	exp_start_date = google_date_to_erpnext(start)
+	exp_end_date = max(exp_start_date, google_date_to_erpnext(end, end=True))
 
 	if existing:
 		# Mettre à jour la tâche existante
@@ -347,6 +829,7 @@ def sync_event_to_task(google_event, calendar_id):
 		task_doc.description = description
 		task_doc.exp_start_date = exp_start_date
 		task_doc.exp_end_date = exp_end_date
+		task_doc.google_etag = google_event.get('etag')
 		task_doc.save(ignore_permissions=True)
 	else:
 		# Créer une nouvelle tâche
@@ -358,22 +841,47 @@ def sync_event_to_task(google_event, calendar_id):
 			'exp_end_date': exp_end_date,
 			'google_event_id': google_event_id,
 			'google_calendar_id': calendar_id,
+			'google_etag': google_event.get('etag'),
 			'status': 'Open'
 		})
 		task_doc.insert(ignore_permissions=True)
 
-	frappe.db.commit()
+	set_google_origin(task_doc)
+
+
+def set_google_origin(doc):
+	"""
+	Mémorise l'empreinte du contenu reçu de Google : tant qu'elle ne change pas,
+	l'envoi vers Google ignore la ligne (pas de renvoi de ce qui vient d'être importé)
+
+	Calculée après l'enregistrement, sur les valeurs réellement stockées : Frappe nettoie
+	le HTML (description, sujet) et Event.validate vide ends_on d'un événement sans durée
+
+	Args:
+		doc: Document Event ou Task enregistré
+	"""
+	doc.db_set({
+		"google_content_hash": content_hash(doc.doctype, doc),
+		"google_last_origin": ORIGIN_GOOGLE
+	}, update_modified=False)
 
 
 @frappe.whitelist()
 def sync_to_google():
 	"""
 	Synchronise les événements ERPNext vers Google Calendar
-	Exporte tous les événements modifiés depuis la dernière synchro
+	Exporte les événements modifiés depuis le dernier envoi réussi de chaque calendrier
+	Un seul envoi tourne à la fois sur le site : un appel concurrent est ignoré
 
 	Returns:
-		dict: {"success": bool, "events_synced": int, "message": str}
+		dict: {"success": bool, "events_synced": int, "sync_run": str, "message": str}
 	"""
+	flight = SingleFlight(SYNC_FLIGHTS["to_google"])
+	if not flight.acquire():
+		return sync_already_running("to_google", flight)
+
+	metrics = None
+
 	try:
 		credentials = get_credentials()
 
@@ -392,53 +900,269 @@ def sync_to_google():
 				"message": _("Aucun calendrier configuré")
 			}
 
-		# Construire le service Google Calendar API
-		service = build('calendar', 'v3', credentials=credentials)
-
-		# Récupérer tous les événements ERPNext qui ont un google_event_id
-		# (ce sont ceux qui ont été synchronisés depuis Google)
-		events_to_sync = frappe.db.get_all('Event',
-			filters={
-				'google_event_id': ['!=', ''],
-				'google_calendar_id': ['!=', '']
-			},
-			fields=['name', 'subject', 'description', 'location', 'starts_on', 'ends_on',
-					'all_day', 'status', 'google_event_id', 'google_calendar_id', 'modified']
-		)
+		# Service Google Calendar API (construit une fois par thread)
+		service = get_calendar_service(credentials)
+		bucket = get_quota_bucket(settings)
 
 		events_synced = 0
+		metrics = SyncMetrics(DIRECTION_PUSH)
 
-		for event in events_to_sync:
-			try:
-				sync_erpnext_event_to_google(service, event)
-				events_synced += 1
-			except Exception as e:
-				frappe.log_error(
-					f"Error syncing event {event.name} to Google: {str(e)}\n{frappe.get_traceback()}",
-					"Google Calendar - Sync To Google Single Event Error"
-				)
+		# Seuls les calendriers synchronisés vers Event sont renvoyés vers Google
+		calendars = [
+			cal_config for cal_config in settings.calendars_to_sync
+			if cal_config.enabled and cal_config.sync_to_doctype == "Event"
+		]
+
+		for index, cal_config in enumerate(calendars, start=1):
+			flight.heartbeat()
+			events_synced += push_calendar_to_google(service, cal_config, bucket, metrics)
+			metrics.finish_calendar(cal_config.calendar_id)
+			publish_sync_progress("to_google", cal_config, index, len(calendars), events_synced=events_synced)
 
 		return {
 			"success": True,
 			"events_synced": events_synced,
+			"sync_run": metrics.save(),
 			"message": _("Synchronisation vers Google réussie: {0} événement(s)").format(events_synced)
 		}
 
 	except Exception as e:
 		frappe.log_error(frappe.get_traceback(), "Google Calendar - Sync To Google Error")
+
+		if metrics:
+			metrics.save(STATUS_ERROR, frappe.get_traceback())
+
 		return {
 			"success": False,
 			"message": str(e)
 		}
 
+	finally:
+		flight.release()
+
+
+def sync_already_running(direction, flight=None):
+	"""
+	Résultat renvoyé quand une synchronisation est déjà en cours
+
+	Args:
+		direction: "from_google" ou "to_google"
+		flight: Verrou SingleFlight occupé (pour indiquer l'exécution en cours)
+
+	Returns:
+		dict: {"success": True, "skipped": True, "running_job": str, "message": str}
+	"""
+	return {
+		"success": True,
+		"skipped": True,
+		"direction": direction,
+		"running_job": flight.owner() if flight else None,
+		"message": _("Une synchronisation est déjà en cours")
+	}
+
+
+def push_calendar_to_google(service, cal_config, bucket=None, metrics=None):
+	"""
+	Envoie vers Google les Events d'un calendrier modifiés depuis le dernier envoi
+	Les envois en erreur sont enregistrés dans Google Calendar Sync Failure et retentés
+	par retry_failed_syncs : le repère (last_push_watermark) avance donc sur tout le lot
+	Les Events dont le contenu n'a pas changé depuis le dernier échange avec Google
+	(google_content_hash) ne sont pas renvoyés
+
+	Args:
+		service: Service Google Calendar API
+		cal_config: Ligne Google Calendar Sync Config
+		bucket: QuotaBucket du site (voir get_quota_bucket)
+		metrics: SyncMetrics de l'exécution en cours
+
+	Returns:
+		int: Nombre d'événements envoyés
+	"""
+	metrics = metrics or SyncMetrics(DIRECTION_PUSH)
+
+	filters = {
+		'google_calendar_id': cal_config.calendar_id,
+		'google_event_id': ['!=', '']
+	}
+	if cal_config.last_push_watermark:
+		filters['modified'] = ['>', cal_config.last_push_watermark]
+
+	calendar_id = cal_config.calendar_id
+
+	with metrics.timer(calendar_id, "db_time"):
+		events_to_sync = get_events_to_push(filters)
+
+	events_synced = 0
+
+	# Modifiés uniquement par l'import (ou sans changement des champs synchronisés) : rien à envoyer
+	changed_events = [event for event in events_to_sync if event.content_hash != event.google_content_hash]
+	metrics.add(calendar_id, skipped=len(events_to_sync) - len(changed_events))
+
+	# Les mises à jour sont regroupées en requêtes batch de 50 appels
+	for chunk in iter_chunks(changed_events, MAX_BATCH_SIZE):
+		with metrics.timer(calendar_id, "api_time"):
+			results = push_events_batch(service, chunk, bucket)
+
+		metrics.add(calendar_id, pages=1, api_calls=len(chunk))
+		pushed = []
+
+		for event, response, error in results:
+			if not error:
+				events_synced += 1
+				metrics.add(calendar_id, synced=1, db_writes=1)
+				mark_pushed(event, response)
+				pushed.append(event.google_event_id)
+			else:
+				metrics.add(calendar_id, failed=1)
+				record_failure(
+					DIRECTION_PUSH,
+					cal_config.calendar_id,
+					event.google_event_id,
+					error,
+					'Event',
+					event.name
+				)
+
+		# Envoyés avec succès : un échec précédent ne doit plus être renvoyé
+		clear_failures(DIRECTION_PUSH, calendar_id, pushed)
+
+	if events_to_sync:
+		update_calendar_config(cal_config, last_push_watermark=events_to_sync[-1].modified)
+
+	frappe.db.commit()
+
+	return events_synced
+
 
-def sync_erpnext_event_to_google(service, event):
+def get_events_to_push(filters):
+	"""
+	Events à envoyer vers Google, avec l'empreinte de leur contenu actuel (content_hash)
+
+	Args:
+		filters: Filtres frappe.get_all sur Event
+
+	Returns:
+		list: frappe._dict triés par date de modification
+	"""
+	events = frappe.db.get_all('Event',
+		filters=filters,
+		fields=['name', 'subject', 'description', 'location', 'starts_on', 'ends_on',
+				'all_day', 'status', 'google_event_id', 'google_calendar_id', 'google_content_hash',
+				'modified', *REPEAT_FIELDS],
+		order_by='modified asc'
+	)
+
+	for event in events:
+		event.content_hash = content_hash('Event', event)
+
+	return events
+
+
+def mark_pushed(event, response):
+	"""
+	Mémorise le contenu envoyé et l'etag renvoyé par Google
+	L'etag évite de réimporter cette modification au prochain passage
+
+	Args:
+		event: Event envoyé (voir get_events_to_push)
+		response: Ressource renvoyée par events.update
+	"""
+	frappe.db.set_value('Event', event.name, {
+		'google_content_hash': event.content_hash,
+		'google_last_origin': ORIGIN_ERPNEXT,
+		'google_etag': response.get('etag') if response else None
+	}, update_modified=False)
+
+
+def push_events_batch(service, events, bucket=None):
+	"""
+	Envoie un lot d'Events vers Google Calendar en une requête batch
+
+	Args:
+		service: Service Google Calendar API
+		events: Documents Event ERPNext (dict), au plus MAX_BATCH_SIZE
+		bucket: QuotaBucket du site (voir get_quota_bucket)
+
+	Returns:
+		list: [(event, réponse Google ou None, erreur ou None)] dans l'ordre des événements
+	"""
+	requests = []
+	errors = {}
+
+	for event in events:
+		try:
+			requests.append((event.name, service.events().update(
+				calendarId=event['google_calendar_id'],
+				eventId=event['google_event_id'],
+				body=build_google_event_body(event),
+				fields=PUSHED_EVENT_FIELDS
+			)))
+		except Exception as e:
+			errors[event.name] = f"{str(e)}\n{frappe.get_traceback()}"
+
+	results = {}
+	if requests:
+		try:
+			results = execute_batch(service, requests, bucket)
+		except Exception as e:
+			# Échec de la requête batch elle-même : tout le lot est en erreur
+			for request_id, request in requests:
+				errors[request_id] = f"{str(e)}\n{frappe.get_traceback()}"
+
+	responses = {}
+	for request_id, (response, exception) in results.items():
+		if exception:
+			errors[request_id] = str(exception)
+		else:
+			responses[request_id] = response
+
+	return [(event, responses.get(event.name), errors.get(event.name)) for event in events]
+
+
+def sync_erpnext_event_to_google(service, event, bucket=None):
 	"""
 	Synchronise un événement ERPNext vers Google Calendar
 
 	Args:
 		service: Service Google Calendar API
 		event: Document Event ERPNext (dict)
+		bucket: QuotaBucket du site (voir get_quota_bucket)
+	"""
+	# Mettre à jour l'événement dans Google Calendar
+	execute_request(service.events().update(
+		calendarId=event['google_calendar_id'],
+		eventId=event['google_event_id'],
+		body=build_google_event_body(event),
+		fields=PUSHED_EVENT_FIELDS
+	), bucket)
+
+
+def get_quota_bucket(settings=None):
+	"""
+	Seau à jetons Redis du site, dimensionné sur le quota Calendar API du projet Google
+
+	Args:
+		settings: Google Calendar Settings (lu si absent)
+
+	Returns:
+		QuotaBucket: Utilisable depuis les threads de récupération
+	"""
+	if settings is None:
+		settings = frappe.get_cached_doc("Google Calendar Settings", "Google Calendar Settings")
+
+	cache = frappe.cache()
+	return QuotaBucket(cache, cache.make_key("google_calendar_quota"), settings.api_quota_per_minute)
+
+
+def build_google_event_body(event):
+	"""
+	Construit la ressource Google Calendar correspondant à un Event ERPNext
+
+	Args:
+		event: Document Event ERPNext (dict)
+
+	Returns:
+		dict: Corps de la requête events.update
 	"""
 	# Construire l'événement Google Calendar
 	google_event = {
@@ -447,47 +1171,177 @@ def sync_erpnext_event_to_google(service, event):
 		'location': event.get('location', ''),
 	}
 
-	# Gérer les dates
-	if event.get('all_day'):
-		# Événement all-day
-		start_date = event['starts_on'].split(' ')[0] if isinstance(event['starts_on'], str) else event['starts_on'].strftime('%Y-%m-%d')
-		end_date = event['ends_on'].split(' ')[0] if isinstance(event['ends_on'], str) else event['ends_on'].strftime('%Y-%m-%d')
+	# Heures du site envoyées avec leur fuseau, fin exclusive pour les journées entières
+	google_event['start'], google_event['end'] = erpnext_to_google(
+		event['starts_on'], event.get('ends_on'), event.get('all_day')
+	)
+
+	# Série stockée une seule fois : renvoyer sa règle
+	recurrence = rrule_from_repeat_fields(event)
+	if recurrence:
+		google_event['recurrence'] = recurrence
 
-		google_event['start'] = {'date': start_date}
-		google_event['end'] = {'date': end_date}
+	return google_event
+
+
+@frappe.whitelist()
+def enqueue_sync(direction):
+	"""
+	Lance une synchronisation en tâche de fond (file "long") depuis le formulaire
+	La progression est publiée en temps réel sur l'événement SYNC_PROGRESS_EVENT ;
+	si une synchronisation tourne déjà (planifiée ou lancée par un autre utilisateur),
+	l'appelant suit sa progression au lieu d'en lancer une seconde
+
+	Args:
+		direction: "from_google" ou "to_google"
+
+	Returns:
+		dict: {"success": bool, "job_id": str, "joined": bool, "message": str}
+	"""
+	frappe.only_for("System Manager")
+
+	if direction not in SYNC_FLIGHTS:
+		frappe.throw(_("Sens de synchronisation inconnu: {0}").format(direction))
+
+	running_job = SingleFlight(SYNC_FLIGHTS[direction]).owner()
+	if running_job:
+		return {
+			"success": True,
+			"job_id": running_job,
+			"joined": True,
+			"message": _("Une synchronisation est déjà en cours, suivi de sa progression")
+		}
+
+	job_id = f"google_calendar_sync::{direction}"
+	job = frappe.enqueue(
+		"reunion.meeting_management.api.google_calendar.run_sync_job",
+		queue="long",
+		timeout=SYNC_JOB_TIMEOUT,
+		job_id=job_id,
+		deduplicate=True,
+		direction=direction
+	)
+
+	if not job:
+		return {
+			"success": True,
+			"job_id": job_id,
+			"joined": True,
+			"message": _("Une synchronisation est déjà en cours, suivi de sa progression")
+		}
+
+	return {
+		"success": True,
+		"job_id": job.id,
+		"message": _("Synchronisation lancée en arrière-plan")
+	}
+
+
+def run_sync_job(direction):
+	"""
+	Tâche de fond lancée par enqueue_sync
+	Publie le résultat final pour que le formulaire se mette à jour
+
+	Args:
+		direction: "from_google" ou "to_google"
+	"""
+	if direction == "from_google":
+		result = sync_from_google()
 	else:
-		# Événement avec heure - convertir en ISO 8601 avec timezone
-		from datetime import datetime
-		import pytz
-
-		# Parser les dates MySQL
-		if isinstance(event['starts_on'], str):
-			starts_on = datetime.strptime(event['starts_on'], '%Y-%m-%d %H:%M:%S')
-			ends_on = datetime.strptime(event['ends_on'], '%Y-%m-%d %H:%M:%S')
-		else:
-			starts_on = event['starts_on']
-			ends_on = event['ends_on']
+		result = sync_to_google()
 
-		# Ajouter timezone (UTC par défaut)
-		tz = pytz.UTC
-		starts_on = tz.localize(starts_on) if starts_on.tzinfo is None else starts_on
-		ends_on = tz.localize(ends_on) if ends_on.tzinfo is None else ends_on
+	publish_sync_result(direction, result)
 
-		google_event['start'] = {'dateTime': starts_on.isoformat()}
-		google_event['end'] = {'dateTime': ends_on.isoformat()}
 
-	# Mettre à jour l'événement dans Google Calendar
-	service.events().update(
-		calendarId=event['google_calendar_id'],
-		eventId=event['google_event_id'],
-		body=google_event
-	).execute()
+def publish_sync_result(direction, result):
+	"""
+	Publie le résultat final d'une synchronisation pour les formulaires qui la suivent
+	Rien n'est publié si elle a été ignorée : l'exécution en cours publiera le sien
+
+	Args:
+		direction: "from_google" ou "to_google"
+		result: Dictionnaire renvoyé par sync_from_google / sync_to_google
+	"""
+	if result.get("skipped"):
+		return
+
+	frappe.publish_realtime(SYNC_PROGRESS_EVENT, {
+		"direction": direction,
+		"done": True,
+		"result": result
+	}, doctype="Google Calendar Settings", docname="Google Calendar Settings")
+
+
+def publish_sync_progress(direction, cal_config, calendars_done, calendars_total, **counts):
+	"""
+	Publie l'avancement d'une synchronisation pour tous les utilisateurs ayant le formulaire
+	Google Calendar Settings ouvert (y compris ceux qui ont rejoint une exécution en cours)
+
+	Args:
+		direction: "from_google" ou "to_google"
+		cal_config: Ligne Google Calendar Sync Config en cours
+		calendars_done: Nombre de calendriers terminés
+		calendars_total: Nombre de calendriers à traiter
+		counts: Compteurs cumulés (events_synced, tasks_synced, skipped...)
+	"""
+	frappe.publish_realtime(SYNC_PROGRESS_EVENT, {
+		"direction": direction,
+		"done": False,
+		"calendar_id": cal_config.calendar_id,
+		"calendar_name": cal_config.calendar_name or cal_config.calendar_id,
+		"calendars_done": calendars_done,
+		"calendars_total": calendars_total,
+		**counts
+	}, doctype="Google Calendar Settings", docname="Google Calendar Settings")
+
+
+@frappe.whitelist()
+def get_sync_metrics(direction=None, limit=50):
+	"""
+	Dernières exécutions de synchronisation et percentiles de leurs mesures
+	Permet de suivre l'évolution des performances en production
+
+	Args:
+		direction: "Import" ou "Export" (toutes par défaut)
+		limit: Nombre d'exécutions récentes prises en compte
+
+	Returns:
+		dict: {"success": True, "runs": list, "percentiles": {sens: {mesure: {"p50", "p90", "p99"}}}}
+	"""
+	frappe.only_for("System Manager")
+
+	filters = {"direction": direction} if direction else {}
+	runs = frappe.get_all("Google Calendar Sync Run",
+		filters=filters,
+		fields=["name", "direction", "status", "calendar_id", "started_at", "duration", "api_time",
+				"db_time", "events_per_second", "calendars_count", "pages", "api_calls", "synced",
+				"skipped", "failed", "deleted", "db_writes"],
+		order_by="started_at desc",
+		limit=frappe.utils.cint(limit) or 50
+	)
+
+	percentiles = {}
+	for run_direction in {run.direction for run in runs}:
+		direction_runs = [run for run in runs if run.direction == run_direction]
+
+		percentiles[run_direction] = {
+			metric: {f"p{p}": percentile([run[metric] for run in direction_runs], p) for p in (50, 90, 99)}
+			for metric in ("duration", "api_time", "db_time", "events_per_second")
+		}
+		percentiles[run_direction]["runs"] = len(direction_runs)
+		percentiles[run_direction]["errors"] = len([run for run in direction_runs if run.status == STATUS_ERROR])
+
+	return {
+		"success": True,
+		"runs": runs,
+		"percentiles": percentiles
+	}
 
 
 def sync_bidirectional():
 	"""
 	Fonction pour synchronisation bidirectionnelle automatique
-	Appelée par le Scheduled Job
+	Appelée par le Scheduled Job ; chaque sens est ignoré s'il est déjà en cours
 	"""
 	try:
 		settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
@@ -498,9 +1352,11 @@ def sync_bidirectional():
 
 		# Synchroniser Google → ERPNext
 		result_from_google = sync_from_google()
+		publish_sync_result("from_google", result_from_google)
 
 		# Synchroniser ERPNext → Google
 		result_to_google = sync_to_google()
+		publish_sync_result("to_google", result_to_google)
 
 		frappe.logger().info(f"Bidirectional sync completed: {result_from_google}, {result_to_google}")
 
@@ -0,0 +1,311 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+"""
+Notifications push Google Calendar (events.watch)
+Google appelle le webhook à chaque modification d'un calendrier surveillé,
+qui déclenche alors une synchronisation incrémentale de ce seul calendrier
+"""
+
+import frappe
+import hmac
+import uuid
+from frappe import _
+from frappe.utils import add_to_date, convert_utc_to_system_timezone, get_datetime, now_datetime
+from datetime import datetime
+from reunion.meeting_management.api.google_auth import get_credentials
+from reunion.meeting_management.api.google_calendar import get_quota_bucket, update_calendar_config
+from reunion.meeting_management.utils.google_client import CHANNEL_FIELDS, get_calendar_service
+from reunion.meeting_management.utils.rate_limit import execute_request
+
+
+# Durée de vie demandée pour un canal (Google plafonne à 7 jours pour events.watch)
+CHANNEL_TTL = 7 * 24 * 3600
+# Les canaux expirant dans ce délai sont renouvelés par le Scheduled Job quotidien
+CHANNEL_RENEW_BEFORE_DAYS = 2
+# Durée de vie de l'indicateur "notification non traitée" d'un calendrier (secondes)
+PENDING_NOTIFICATION_TTL = 3600
+# Nombre maximal d'imports enchaînés par un job de notification
+MAX_SYNC_PASSES = 5
+
+
+@frappe.whitelist(allow_guest=True, methods=["POST"])
+def receive_notification():
+	"""
+	Webhook appelé par Google Calendar (en-têtes X-Goog-*, corps vide)
+	Accessible via: /api/method/reunion.meeting_management.api.google_push.receive_notification
+	"""
+	handle_notification(frappe.request.headers)
+
+	# Google attend uniquement un code 2xx
+	return None
+
+
+def handle_notification(headers):
+	"""
+	Traite une notification Google Calendar
+
+	Args:
+		headers: En-têtes HTTP de la notification
+
+	Returns:
+		bool: True si la notification correspond à un canal connu
+	"""
+	channel_id = headers.get("X-Goog-Channel-ID")
+	if not channel_id:
+		return False
+
+	cal_config = frappe.db.get_value(
+		"Google Calendar Sync Config",
+		{"channel_id": channel_id},
+		["calendar_id", "channel_token", "enabled"],
+		as_dict=True
+	)
+
+	# Le jeton du canal authentifie l'appel (le webhook est accessible sans connexion)
+	if not cal_config or not hmac.compare_digest(
+		cal_config.channel_token or "", headers.get("X-Goog-Channel-Token") or ""
+	):
+		return False
+
+	# "sync" est envoyé une seule fois à la création du canal
+	if headers.get("X-Goog-Resource-State") == "sync" or not cal_config.enabled:
+		return True
+
+	# Indicateur relu par le job en cours : deduplicate ignore aussi les notifications
+	# reçues pendant son exécution, après qu'il a lu les modifications
+	set_pending_notification(cal_config.calendar_id)
+
+	# Une seule synchronisation en file par calendrier, quel que soit le nombre de notifications
+	frappe.enqueue(
+		"reunion.meeting_management.api.google_push.sync_notified_calendar",
+		queue="short",
+		job_id=f"google_calendar_push_sync::{cal_config.calendar_id}",
+		deduplicate=True,
+		calendar_id=cal_config.calendar_id
+	)
+
+	return True
+
+
+def sync_notified_calendar(calendar_id):
+	"""
+	Job lancé par une notification : synchronisation incrémentale d'un seul calendrier
+	Relancée tant que des notifications arrivent pendant l'import (MAX_SYNC_PASSES au plus)
+
+	Args:
+		calendar_id: ID du calendrier Google modifié
+	"""
+	from reunion.meeting_management.api.google_calendar import sync_from_google
+
+	# Le job est mis en file par le webhook (Guest) : les documents sont créés par Administrator
+	frappe.set_user("Administrator")
+
+	for _pass in range(MAX_SYNC_PASSES):
+		# Les notifications reçues à partir d'ici déclenchent un nouveau passage
+		clear_pending_notification(calendar_id)
+
+		result = sync_from_google(calendar_id=calendar_id)
+		frappe.logger().info(f"Push notification sync for {calendar_id}: {result}")
+
+		if not has_pending_notification(calendar_id):
+			return
+
+
+def set_pending_notification(calendar_id):
+	"""
+	Signale une notification de ce calendrier pas encore prise en compte par un import
+	"""
+	frappe.cache().set(get_pending_key(calendar_id), 1, ex=PENDING_NOTIFICATION_TTL)
+
+
+def has_pending_notification(calendar_id):
+	"""
+	Returns:
+		bool: True si une notification est arrivée depuis le dernier clear_pending_notification
+	"""
+	return bool(frappe.cache().exists(get_pending_key(calendar_id)))
+
+
+def clear_pending_notification(calendar_id):
+	"""
+	Efface l'indicateur de notification d'un calendrier (avant un import)
+	"""
+	frappe.cache().delete(get_pending_key(calendar_id))
+
+
+def get_pending_key(calendar_id):
+	return frappe.cache().make_key(f"google_calendar_push_pending:{calendar_id}")
+
+
+@frappe.whitelist()
+def register_channels():
+	"""
+	Enregistre (ou renouvelle) un canal de notification pour chaque calendrier activé
+
+	Returns:
+		dict: {"success": bool, "channels_registered": int, "message": str}
+	"""
+	try:
+		credentials = get_credentials()
+
+		if not credentials:
+			return {
+				"success": False,
+				"message": _("Non connecté à Google Calendar")
+			}
+
+		settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
+
+		if not settings.push_notifications:
+			return {
+				"success": False,
+				"message": _("Les notifications push ne sont pas activées")
+			}
+
+		service = get_calendar_service(credentials)
+
+		channels_registered = 0
+
+		for cal_config in settings.calendars_to_sync:
+			if not cal_config.enabled:
+				continue
+
+			try:
+				register_channel(service, cal_config)
+				channels_registered += 1
+			except Exception as e:
+				frappe.log_error(
+					frappe.get_traceback(),
+					f"Google Calendar - Register Channel Error for {cal_config.calendar_id}"
+				)
+
+		frappe.db.commit()
+
+		return {
+			"success": True,
+			"channels_registered": channels_registered,
+			"message": _("{0} canal(aux) de notification enregistré(s)").format(channels_registered)
+		}
+
+	except Exception as e:
+		frappe.log_error(frappe.get_traceback(), "Google Calendar - Register Channels Error")
+		return {
+			"success": False,
+			"message": str(e)
+		}
+
+
+def register_channel(service, cal_config):
+	"""
+	Ouvre un canal events.watch pour un calendrier, en fermant l'ancien s'il existe
+
+	Args:
+		service: Service Google Calendar API
+		cal_config: Ligne Google Calendar Sync Config
+	"""
+	stop_channel(service, cal_config)
+
+	channel_id = str(uuid.uuid4())
+	channel_token = frappe.generate_hash(length=32)
+
+	response = execute_request(service.events().watch(
+		calendarId=cal_config.calendar_id,
+		body={
+			"id": channel_id,
+			"type": "web_hook",
+			"address": get_notification_url(),
+			"token": channel_token,
+			"params": {"ttl": str(CHANNEL_TTL)}
+		},
+		fields=CHANNEL_FIELDS
+	), get_quota_bucket())
+
+	# Google renvoie l'expiration en millisecondes depuis l'epoch (UTC)
+	expiration = convert_utc_to_system_timezone(
+		datetime.utcfromtimestamp(int(response["expiration"]) / 1000)
+	).replace(tzinfo=None)
+
+	update_calendar_config(
+		cal_config,
+		channel_id=channel_id,
+		channel_resource_id=response.get("resourceId"),
+		channel_token=channel_token,
+		channel_expiration=expiration
+	)
+
+
+def stop_channel(service, cal_config):
+	"""
+	Ferme le canal de notification d'un calendrier s'il existe
+
+	Args:
+		service: Service Google Calendar API
+		cal_config: Ligne Google Calendar Sync Config
+	"""
+	if not cal_config.channel_id or not cal_config.channel_resource_id:
+		return
+
+	try:
+		execute_request(service.channels().stop(body={
+			"id": cal_config.channel_id,
+			"resourceId": cal_config.channel_resource_id
+		}), get_quota_bucket())
+	except Exception:
+		# Canal déjà expiré côté Google
+		pass
+
+	update_calendar_config(
+		cal_config,
+		channel_id=None,
+		channel_resource_id=None,
+		channel_token=None,
+		channel_expiration=None
+	)
+
+
+def renew_channels():
+	"""
+	Renouvelle les canaux qui expirent bientôt
+	Appelée par le Scheduled Job quotidien
+	"""
+	try:
+		settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
+
+		if not settings.enabled or not settings.push_notifications or settings.sync_status != "Connecté":
+			return
+
+		credentials = get_credentials()
+		if not credentials:
+			return
+
+		service = get_calendar_service(credentials)
+		renew_before = add_to_date(now_datetime(), days=CHANNEL_RENEW_BEFORE_DAYS)
+
+		for cal_config in settings.calendars_to_sync:
+			try:
+				if not cal_config.enabled:
+					stop_channel(service, cal_config)
+				elif not cal_config.channel_expiration or get_datetime(cal_config.channel_expiration) < renew_before:
+					register_channel(service, cal_config)
+			except Exception as e:
+				frappe.log_error(
+					frappe.get_traceback(),
+					f"Google Calendar - Renew Channel Error for {cal_config.calendar_id}"
+				)
+
+		frappe.db.commit()
+
+	except Exception as e:
+		frappe.log_error(frappe.get_traceback(), "Google Calendar - Renew Channels Error")
+
+
+def get_notification_url():
+	"""
+	URL du webhook transmise à Google (doit être publique et en HTTPS)
+
+	Returns:
+		str: URL de receive_notification
+	"""
+	site_url = frappe.utils.get_url()
+	return f"{site_url}/api/method/reunion.meeting_management.api.google_push.receive_notification"
@@ -0,0 +1,161 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+"""
+Reprise des événements dont la synchronisation a échoué (Google Calendar Sync Failure)
+Chaque élément est retenté seul : l'import relit l'événement Google, l'export renvoie l'Event
+"""
+
+import frappe
+from frappe.utils import now_datetime
+from googleapiclient.errors import HttpError
+from reunion.meeting_management.api.google_auth import get_credentials
+from reunion.meeting_management.api.google_calendar import (
+	get_events_to_push,
+	get_quota_bucket,
+	iter_chunks,
+	mark_pushed,
+	push_events_batch,
+	sync_events_to_doctype
+)
+from reunion.meeting_management.doctype.google_calendar_sync_failure.google_calendar_sync_failure import (
+	DIRECTION_PULL,
+	DIRECTION_PUSH,
+	STATUS_PENDING,
+	clear_failure,
+	record_failure
+)
+from reunion.meeting_management.utils.google_client import EVENT_FIELDS, MAX_BATCH_SIZE, get_calendar_service
+from reunion.meeting_management.utils.locks import redis_lock
+from reunion.meeting_management.utils.rate_limit import execute_request
+from reunion.meeting_management.utils.transaction import TransactionBatch
+
+
+# Nombre maximal d'éléments retentés par passage du Scheduled Job
+RETRY_LIMIT = 200
+
+
+def retry_failed_syncs():
+	"""
+	Retente les synchronisations en échec arrivées à échéance
+	Appelée par le Scheduled Job
+	"""
+	try:
+		settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
+
+		if not settings.enabled or settings.sync_status != "Connecté":
+			return
+
+		with redis_lock("google_calendar_retry", timeout=900) as acquired:
+			# Passage précédent encore en cours
+			if not acquired:
+				return
+
+			failures = frappe.get_all("Google Calendar Sync Failure",
+				filters={"status": STATUS_PENDING, "next_retry": ["<=", now_datetime()]},
+				fields=["name", "direction", "calendar_id", "google_event_id", "reference_name"],
+				order_by="next_retry asc",
+				limit=RETRY_LIMIT
+			)
+
+			if not failures:
+				return
+
+			credentials = get_credentials()
+			if not credentials:
+				return
+
+			service = get_calendar_service(credentials)
+			bucket = get_quota_bucket(settings)
+			calendars = {
+				cal_config.calendar_id: cal_config
+				for cal_config in settings.calendars_to_sync
+				if cal_config.enabled
+			}
+
+			retry_pulls(service, bucket, calendars, [f for f in failures if f.direction == DIRECTION_PULL])
+			retry_pushes(service, bucket, calendars, [f for f in failures if f.direction == DIRECTION_PUSH])
+
+			frappe.db.commit()
+
+	except Exception as e:
+		frappe.log_error(frappe.get_traceback(), "Google Calendar - Retry Failed Syncs Error")
+
+
+def retry_pulls(service, bucket, calendars, failures):
+	"""
+	Relit chaque événement en échec depuis Google et le réimporte
+
+	Args:
+		service: Service Google Calendar API
+		bucket: QuotaBucket du site
+		calendars: {calendar_id: Google Calendar Sync Config} des calendriers activés
+		failures: Google Calendar Sync Failure à retenter (import)
+	"""
+	batch = TransactionBatch()
+
+	for failure in failures:
+		cal_config = calendars.get(failure.calendar_id)
+
+		# Calendrier retiré de la synchronisation : plus rien à retenter
+		if not cal_config:
+			clear_failure(failure.name)
+			continue
+
+		try:
+			event = execute_request(service.events().get(
+				calendarId=failure.calendar_id,
+				eventId=failure.google_event_id,
+				fields=EVENT_FIELDS
+			), bucket)
+		except HttpError as e:
+			if e.resp.status in (404, 410):
+				# Événement supprimé côté Google depuis l'échec
+				clear_failure(failure.name)
+			else:
+				record_failure(DIRECTION_PULL, failure.calendar_id, failure.google_event_id, frappe.get_traceback())
+			continue
+
+		# Un nouvel échec met à jour cet élément (tentatives, prochaine échéance)
+		counts = sync_events_to_doctype([event], cal_config, batch=batch)
+		if not counts.failed:
+			clear_failure(failure.name)
+
+	batch.commit()
+
+
+def retry_pushes(service, bucket, calendars, failures):
+	"""
+	Renvoie vers Google les Events en échec, par requêtes batch
+
+	Args:
+		service: Service Google Calendar API
+		bucket: QuotaBucket du site
+		calendars: {calendar_id: Google Calendar Sync Config} des calendriers activés
+		failures: Google Calendar Sync Failure à retenter (export)
+	"""
+	failures_by_event = {}
+	for failure in failures:
+		if failure.calendar_id in calendars and failure.reference_name:
+			failures_by_event[failure.reference_name] = failure
+		else:
+			clear_failure(failure.name)
+
+	if not failures_by_event:
+		return
+
+	events = get_events_to_push({"name": ["in", list(failures_by_event)]})
+
+	# Event supprimé depuis l'échec
+	for name in set(failures_by_event) - {event.name for event in events}:
+		clear_failure(failures_by_event[name].name)
+
+	for chunk in iter_chunks(events, MAX_BATCH_SIZE):
+		for event, response, error in push_events_batch(service, chunk, bucket):
+			failure = failures_by_event[event.name]
+
+			if not error:
+				mark_pushed(event, response)
+				clear_failure(failure.name)
+			else:
+				record_failure(DIRECTION_PUSH, failure.calendar_id, failure.google_event_id, error, "Event", event.name)
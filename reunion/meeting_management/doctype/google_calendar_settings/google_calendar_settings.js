@@ -34,6 +34,12 @@ frappe.ui.form.on('Google Calendar Settings', {
 					sync_to_google_now(frm);
 				}, __('Actions'));
 
+				if (frm.doc.push_notifications) {
+					frm.add_custom_button(__('Activer les notifications push'), function() {
+						register_push_channels(frm);
+					}, __('Actions'));
+				}
+
 				frm.add_custom_button(__('Déconnecter'), function() {
 					disconnect_google(frm);
 				}, __('Actions'));
@@ -80,37 +86,83 @@ function connect_to_google(frm) {
 }
 
 function sync_from_google_now(frm) {
+	run_background_sync(frm, 'from_google', __('Synchronisation depuis Google'), function(result) {
+		return __('Synchronisation réussie ! {0} événements importés', [result.events_synced || 0]);
+	});
+}
+
+function sync_to_google_now(frm) {
+	run_background_sync(frm, 'to_google', __('Synchronisation vers Google'), function(result) {
+		return __('Synchronisation réussie ! {0} événements exportés', [result.events_synced || 0]);
+	});
+}
+
+function run_background_sync(frm, direction, title, success_message) {
+	// La synchronisation tourne en tâche de fond : la progression arrive en temps réel
+	let on_progress = function(data) {
+		if (data.direction !== direction) {
+			return;
+		}
+
+		if (!data.done) {
+			let counts = data.events_synced || 0;
+			if (data.tasks_synced) {
+				counts += data.tasks_synced;
+			}
+
+			frappe.show_progress(title, data.calendars_done, data.calendars_total,
+				__('{0} : {1} élément(s) synchronisé(s)', [data.calendar_name, counts]));
+			return;
+		}
+
+		frappe.realtime.off('google_calendar_sync_progress', on_progress);
+		frappe.hide_progress();
+
+		if (data.result && data.result.success) {
+			frappe.show_alert({
+				message: success_message(data.result),
+				indicator: 'green'
+			});
+			frm.reload_doc();
+		} else {
+			frappe.msgprint({
+				title: __('Erreur'),
+				indicator: 'red',
+				message: (data.result && data.result.message) || __('Erreur lors de la synchronisation')
+			});
+		}
+	};
+
+	frappe.realtime.on('google_calendar_sync_progress', on_progress);
+
 	frappe.call({
-		method: 'reunion.meeting_management.api.google_calendar.sync_from_google',
-		freeze: true,
-		freeze_message: __('Synchronisation depuis Google en cours...'),
+		method: 'reunion.meeting_management.api.google_calendar.enqueue_sync',
+		args: { direction: direction },
 		callback: function(r) {
 			if (r.message && r.message.success) {
 				frappe.show_alert({
-					message: __('Synchronisation réussie ! {0} événements importés', [r.message.events_synced || 0]),
-					indicator: 'green'
+					message: r.message.message,
+					indicator: 'blue'
 				});
-				frm.reload_doc();
 			} else {
-				frappe.msgprint({
-					title: __('Erreur'),
-					indicator: 'red',
-					message: r.message.message || __('Erreur lors de la synchronisation')
-				});
+				frappe.realtime.off('google_calendar_sync_progress', on_progress);
 			}
+		},
+		error: function() {
+			frappe.realtime.off('google_calendar_sync_progress', on_progress);
 		}
 	});
 }
 
-function sync_to_google_now(frm) {
+function register_push_channels(frm) {
 	frappe.call({
-		method: 'reunion.meeting_management.api.google_calendar.sync_to_google',
+		method: 'reunion.meeting_management.api.google_push.register_channels',
 		freeze: true,
-		freeze_message: __('Synchronisation vers Google en cours...'),
+		freeze_message: __('Enregistrement des notifications push...'),
 		callback: function(r) {
 			if (r.message && r.message.success) {
 				frappe.show_alert({
-					message: __('Synchronisation réussie ! {0} événements exportés', [r.message.events_synced || 0]),
+					message: r.message.message,
 					indicator: 'green'
 				});
 				frm.reload_doc();
@@ -118,7 +170,7 @@ function sync_to_google_now(frm) {
 				frappe.msgprint({
 					title: __('Erreur'),
 					indicator: 'red',
-					message: r.message.message || __('Erreur lors de la synchronisation')
+					message: r.message.message || __('Erreur lors de l\'enregistrement des notifications')
 				});
 			}
 		}
@@ -3,6 +3,21 @@
 
 import frappe
 from frappe.model.document import Document
+from frappe.utils import cstr
+
+
+# État de synchronisation des calendriers, écrit uniquement par les synchronisations
+# (update_calendar_config, sans modifier "modified") : jamais repris du formulaire
+SYNC_STATE_FIELDS = (
+	"sync_token",
+	"window_anchor",
+	"last_push_watermark",
+	"backfill_cursor",
+	"channel_id",
+	"channel_resource_id",
+	"channel_token",
+	"channel_expiration"
+)
 
 
 class GoogleCalendarSettings(Document):
@@ -12,3 +27,49 @@ class GoogleCalendarSettings(Document):
 		"""Validation avant sauvegarde"""
 		if self.enabled and not (self.client_id and self.client_secret):
 			frappe.throw("Client ID et Client Secret sont requis pour activer Google Calendar")
+
+		self.keep_sync_state()
+		self.reset_sync_tokens()
+
+	def keep_sync_state(self):
+		"""Conserve l'état de synchronisation enregistré : un formulaire ouvert avant une synchronisation renvoie des valeurs périmées"""
+		before = self.get_doc_before_save()
+		previous = {row.name: row for row in before.calendars_to_sync} if before else {}
+
+		for row in self.calendars_to_sync:
+			saved = previous.get(row.name)
+			for fieldname in SYNC_STATE_FIELDS:
+				row.set(fieldname, saved.get(fieldname) if saved else None)
+
+	def reset_sync_tokens(self):
+		"""Force une lecture complète des calendriers dont le mode de récurrence ou la fenêtre a changé"""
+		before = self.get_doc_before_save()
+		if not before:
+			return
+
+		fields = ("recurring_mode", "days_past", "days_future")
+		previous = {row.name: [cstr(row.get(fieldname)) for fieldname in fields] for row in before.calendars_to_sync}
+		for row in self.calendars_to_sync:
+			if row.name in previous and previous[row.name] != [cstr(row.get(fieldname)) for fieldname in fields]:
+				row.sync_token = None
+
+	def on_update(self):
+		"""Invalide les credentials en cache si la configuration OAuth a changé et lance les imports d'historique demandés"""
+		from reunion.meeting_management.api.google_auth import clear_credentials_cache
+
+		oauth_fields = ("enabled", "client_id", "client_secret", "access_token", "refresh_token", "token_expiry")
+		if any(self.has_value_changed(fieldname) for fieldname in oauth_fields):
+			clear_credentials_cache()
+
+		self.start_backfills()
+
+	def start_backfills(self):
+		"""Lance l'import de l'historique des calendriers dont la date de début vient d'être saisie"""
+		from reunion.meeting_management.api.google_backfill import enqueue_backfill
+
+		before = self.get_doc_before_save()
+		previous = {row.name: cstr(row.backfill_until) for row in before.calendars_to_sync} if before else {}
+
+		for row in self.calendars_to_sync:
+			if row.enabled and row.backfill_until and previous.get(row.name) != cstr(row.backfill_until):
+				enqueue_backfill(row)
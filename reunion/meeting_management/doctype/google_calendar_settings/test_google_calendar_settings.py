@@ -0,0 +1,68 @@
+"""
+Unit tests for Google Calendar Settings
+"""
+
+import frappe
+import unittest
+from reunion.meeting_management.api.google_calendar import update_calendar_config
+
+
+CALENDAR_ID = "test-settings@example.com"
+
+
+class TestGoogleCalendarSettings(unittest.TestCase):
+	"""
+	Test that saving the form keeps the sync state written by the syncs
+	"""
+
+	def setUp(self):
+		"""
+		A synced calendar row
+		"""
+		settings = self.get_settings()
+		settings.append("calendars_to_sync", {"calendar_id": CALENDAR_ID, "sync_to_doctype": "Event"})
+		settings.save(ignore_permissions=True)
+
+	def tearDown(self):
+		"""
+		Clean up after tests
+		"""
+		settings = self.get_settings()
+		settings.calendars_to_sync = [row for row in settings.calendars_to_sync if row.calendar_id != CALENDAR_ID]
+		settings.save(ignore_permissions=True)
+
+	def get_settings(self):
+		return frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
+
+	def get_row(self, settings):
+		return next(row for row in settings.calendars_to_sync if row.calendar_id == CALENDAR_ID)
+
+	def test_stale_form_keeps_sync_state(self):
+		"""
+		Values updated by a sync after the form was loaded are not overwritten
+		"""
+		stale = self.get_settings()
+
+		update_calendar_config(self.get_row(self.get_settings()), sync_token="token-2", channel_token="channel-2")
+
+		self.get_row(stale).days_past = 10
+		stale.save(ignore_permissions=True)
+
+		row = self.get_row(self.get_settings())
+		self.assertEqual(row.channel_token, "channel-2")
+		self.assertEqual(row.days_past, 10)
+
+	def test_sync_state_is_not_editable(self):
+		"""
+		Sync state sent by the client is ignored, and a new window still resets the token
+		"""
+		update_calendar_config(self.get_row(self.get_settings()), sync_token="token-2", backfill_cursor="2025-01-01")
+
+		settings = self.get_settings()
+		self.get_row(settings).backfill_cursor = "2020-01-01"
+		self.get_row(settings).days_future = 90
+		settings.save(ignore_permissions=True)
+
+		row = self.get_row(self.get_settings())
+		self.assertEqual(str(row.backfill_cursor), "2025-01-01")
+		self.assertFalse(row.sync_token)
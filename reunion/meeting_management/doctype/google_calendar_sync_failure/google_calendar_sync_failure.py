@@ -0,0 +1,122 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import add_to_date, now_datetime
+
+
+# Sens de synchronisation
+DIRECTION_PULL = "Import"
+DIRECTION_PUSH = "Export"
+
+STATUS_PENDING = "En attente"
+STATUS_ABANDONED = "Abandonné"
+
+# Délai avant la tentative n : RETRY_BASE_MINUTES * 2^(n-1), plafonné
+RETRY_BASE_MINUTES = 5
+RETRY_MAX_MINUTES = 24 * 60
+# Au-delà, l'élément est abandonné et signalé une seule fois dans Error Log
+MAX_ATTEMPTS = 8
+
+# Taille maximale de l'erreur conservée
+MAX_ERROR_LENGTH = 5000
+
+
+class GoogleCalendarSyncFailure(Document):
+	"""Événement dont la synchronisation a échoué, retenté par retry_failed_syncs"""
+	pass
+
+
+def record_failure(direction, calendar_id, google_event_id, error, reference_doctype=None, reference_name=None):
+	"""
+	Enregistre l'échec de synchronisation d'un événement (ou incrémente ses tentatives)
+	et planifie la prochaine tentative
+
+	Args:
+		direction: DIRECTION_PULL ou DIRECTION_PUSH
+		calendar_id: ID du calendrier Google
+		google_event_id: ID de l'événement Google
+		error: Message ou traceback de l'erreur
+		reference_doctype: DocType ERPNext concerné (Event ou Task)
+		reference_name: Document ERPNext concerné
+	"""
+	name = frappe.db.get_value("Google Calendar Sync Failure", {
+		"direction": direction,
+		"calendar_id": calendar_id,
+		"google_event_id": google_event_id
+	})
+
+	if name:
+		failure = frappe.get_doc("Google Calendar Sync Failure", name)
+
+		# Nouvel échec d'un élément abandonné (modifié depuis) : nouveau cycle de tentatives
+		if failure.status == STATUS_ABANDONED:
+			failure.attempts = 0
+	else:
+		failure = frappe.new_doc("Google Calendar Sync Failure")
+		failure.update({
+			"direction": direction,
+			"calendar_id": calendar_id,
+			"google_event_id": google_event_id
+		})
+
+	failure.attempts = (failure.attempts or 0) + 1
+	failure.last_error = (error or "")[-MAX_ERROR_LENGTH:]
+	failure.reference_doctype = reference_doctype or failure.reference_doctype
+	failure.reference_name = reference_name or failure.reference_name
+
+	if failure.attempts >= MAX_ATTEMPTS:
+		failure.status = STATUS_ABANDONED
+		failure.next_retry = None
+		frappe.log_error(
+			f"Event {google_event_id} ({direction}) abandoned after {failure.attempts} attempts:\n{failure.last_error}",
+			f"Google Calendar - Sync Failure Abandoned for {calendar_id}"
+		)
+	else:
+		failure.status = STATUS_PENDING
+		failure.next_retry = add_to_date(now_datetime(), minutes=retry_delay_minutes(failure.attempts))
+
+	failure.save(ignore_permissions=True)
+
+
+def clear_failure(name):
+	"""
+	Supprime un échec une fois l'événement synchronisé
+
+	Args:
+		name: Nom du Google Calendar Sync Failure
+	"""
+	frappe.db.delete("Google Calendar Sync Failure", name)
+
+
+def clear_failures(direction, calendar_id, google_event_ids):
+	"""
+	Supprime en une requête les échecs d'événements synchronisés depuis avec succès
+	(import ou envoi normal) : ils ne doivent plus être relus ni renvoyés
+
+	Args:
+		direction: DIRECTION_PULL ou DIRECTION_PUSH
+		calendar_id: ID du calendrier Google
+		google_event_ids: IDs Google des événements synchronisés
+	"""
+	google_event_ids = [event_id for event_id in google_event_ids if event_id]
+	if not google_event_ids:
+		return
+
+	frappe.db.delete("Google Calendar Sync Failure", {
+		"direction": direction,
+		"calendar_id": calendar_id,
+		"google_event_id": ["in", google_event_ids]
+	})
+
+
+def retry_delay_minutes(attempts):
+	"""
+	Args:
+		attempts: Nombre de tentatives déjà échouées
+
+	Returns:
+		int: Délai avant la prochaine tentative (minutes)
+	"""
+	return min(RETRY_MAX_MINUTES, RETRY_BASE_MINUTES * 2 ** max(0, attempts - 1))
@@ -0,0 +1,92 @@
+"""
+Unit tests for Google Calendar Sync Failure
+"""
+
+import frappe
+import unittest
+from reunion.meeting_management.doctype.google_calendar_sync_failure.google_calendar_sync_failure import (
+	DIRECTION_PULL,
+	MAX_ATTEMPTS,
+	RETRY_MAX_MINUTES,
+	STATUS_ABANDONED,
+	STATUS_PENDING,
+	clear_failures,
+	record_failure,
+	retry_delay_minutes
+)
+
+
+class TestGoogleCalendarSyncFailure(unittest.TestCase):
+	"""
+	Test the retry queue of failed event syncs
+	"""
+
+	def tearDown(self):
+		"""
+		Clean up after tests
+		"""
+		frappe.db.delete("Google Calendar Sync Failure", {"calendar_id": "test-calendar"})
+
+	def get_failure(self):
+		return frappe.get_doc("Google Calendar Sync Failure", {
+			"calendar_id": "test-calendar",
+			"google_event_id": "event-1"
+		})
+
+	def test_failures_are_merged(self):
+		"""
+		Failing twice updates the same row and pushes back the next retry
+		"""
+		record_failure(DIRECTION_PULL, "test-calendar", "event-1", "boom")
+		first_retry = self.get_failure().next_retry
+
+		record_failure(DIRECTION_PULL, "test-calendar", "event-1", "boom again")
+		failure = self.get_failure()
+
+		self.assertEqual(failure.attempts, 2)
+		self.assertEqual(failure.status, STATUS_PENDING)
+		self.assertEqual(failure.last_error, "boom again")
+		self.assertGreater(failure.next_retry, first_retry)
+		self.assertEqual(frappe.db.count("Google Calendar Sync Failure", {"calendar_id": "test-calendar"}), 1)
+
+	def test_abandoned_after_max_attempts(self):
+		"""
+		The item stops being retried once the attempt limit is reached
+		"""
+		for attempt in range(MAX_ATTEMPTS):
+			record_failure(DIRECTION_PULL, "test-calendar", "event-1", "boom")
+
+		failure = self.get_failure()
+		self.assertEqual(failure.status, STATUS_ABANDONED)
+		self.assertIsNone(failure.next_retry)
+
+	def test_abandoned_item_starts_a_new_cycle(self):
+		"""
+		A new failure of an abandoned item is retried again instead of being abandoned at once
+		"""
+		for attempt in range(MAX_ATTEMPTS + 1):
+			record_failure(DIRECTION_PULL, "test-calendar", "event-1", "boom")
+
+		failure = self.get_failure()
+		self.assertEqual(failure.attempts, 1)
+		self.assertEqual(failure.status, STATUS_PENDING)
+		self.assertIsNotNone(failure.next_retry)
+
+	def test_cleared_after_success(self):
+		"""
+		Failures of events synced successfully since are removed
+		"""
+		record_failure(DIRECTION_PULL, "test-calendar", "event-1", "boom")
+		record_failure(DIRECTION_PULL, "test-calendar", "event-2", "boom")
+
+		clear_failures(DIRECTION_PULL, "test-calendar", ["event-1", None])
+
+		self.assertFalse(frappe.db.exists("Google Calendar Sync Failure", {"google_event_id": "event-1"}))
+		self.assertTrue(frappe.db.exists("Google Calendar Sync Failure", {"google_event_id": "event-2"}))
+
+	def test_retry_delay_is_bounded(self):
+		"""
+		The backoff doubles on each attempt up to the maximum
+		"""
+		self.assertEqual(retry_delay_minutes(2), 2 * retry_delay_minutes(1))
+		self.assertEqual(retry_delay_minutes(50), RETRY_MAX_MINUTES)
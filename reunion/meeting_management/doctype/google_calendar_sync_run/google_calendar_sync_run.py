@@ -0,0 +1,18 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+
+
+class GoogleCalendarSyncRun(Document):
+	"""Mesures d'une exécution de synchronisation Google Calendar (voir SyncMetrics)"""
+
+	@staticmethod
+	def clear_old_logs(days=30):
+		"""Purge appelée par Log Settings (default_log_clearing_doctypes)"""
+		from frappe.query_builder import Interval
+		from frappe.query_builder.functions import Now
+
+		table = frappe.qb.DocType("Google Calendar Sync Run")
+		frappe.db.delete(table, filters=(table.modified < (Now() - Interval(days=days))))
@@ -0,0 +1,51 @@
+"""
+Unit tests for Google Calendar Sync Run
+"""
+
+import frappe
+import json
+import unittest
+from reunion.meeting_management.utils.sync_metrics import SyncMetrics, percentile
+
+
+class TestGoogleCalendarSyncRun(unittest.TestCase):
+	"""
+	Test the recording of sync metrics
+	"""
+
+	def tearDown(self):
+		"""
+		Clean up after tests
+		"""
+		frappe.db.delete("Google Calendar Sync Run", {"calendar_id": "test-calendar"})
+
+	def test_run_is_recorded_per_calendar(self):
+		"""
+		Counters are stored per calendar and summed on the run
+		"""
+		metrics = SyncMetrics("Import", "test-calendar")
+		metrics.add("test-calendar", pages=2, synced=10, skipped=3)
+		metrics.add("other-calendar", pages=1, synced=5, failed=1)
+		with metrics.timer("test-calendar", "db_time"):
+			pass
+		metrics.finish_calendar("test-calendar")
+
+		run = frappe.get_doc("Google Calendar Sync Run", metrics.save())
+		calendar_stats = json.loads(run.calendar_stats)
+
+		self.assertEqual(run.pages, 3)
+		self.assertEqual(run.synced, 15)
+		self.assertEqual(run.failed, 1)
+		self.assertEqual(run.calendars_count, 2)
+		self.assertEqual(calendar_stats["test-calendar"]["skipped"], 3)
+		self.assertIsNotNone(calendar_stats["other-calendar"]["duration"])
+
+	def test_percentile(self):
+		"""
+		Nearest-rank percentile ignores missing values
+		"""
+		values = [5, 1, None, 3, 2, 4]
+
+		self.assertEqual(percentile(values, 50), 3)
+		self.assertEqual(percentile(values, 100), 5)
+		self.assertIsNone(percentile([], 90))
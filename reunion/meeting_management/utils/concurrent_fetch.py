@@ -0,0 +1,101 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+"""
+Récupération concurrente des événements de plusieurs calendriers Google
+"""
+
+import queue
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+
+DEFAULT_CONCURRENCY = 4
+
+
+class CalendarFetcher:
+	"""
+	Lit les pages d'événements de plusieurs calendriers sur un pool de threads borné
+
+	Les threads ne font que des appels HTTP et déposent les pages dans une file bornée ;
+	les écritures restent dans le thread appelant, la connexion base de données de Frappe
+	n'étant pas thread-safe. La taille de la file limite la mémoire utilisée quand la
+	base est plus lente que le réseau. Une lecture peut être abandonnée (cancel) :
+	ses pages suivantes ne sont plus demandées ni renvoyées.
+	"""
+
+	def __init__(self, max_workers=DEFAULT_CONCURRENCY, queue_size=None):
+		self.max_workers = max(1, int(max_workers or DEFAULT_CONCURRENCY))
+		self.queue = queue.Queue(maxsize=queue_size or self.max_workers * 2)
+		self.stop = threading.Event()
+		self.cancelled = set()
+
+	def run(self, jobs):
+		"""
+		Lance la lecture et renvoie les messages des threads au fur et à mesure
+
+		Args:
+			jobs: Liste de tuples (clé, fonction) ; la fonction est appelée dans un thread
+				et doit renvoyer un EventPager (ou tout objet exposant pages())
+
+		Yields:
+			tuple: ("page", clé, événements), ("done", clé, pager) ou ("error", clé, traceback)
+		"""
+		if not jobs:
+			return
+
+		executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs)))
+
+		try:
+			for key, open_pager in jobs:
+				executor.submit(self._worker, key, open_pager)
+
+			remaining = len(jobs)
+			while remaining:
+				message = self.queue.get()
+				if message[0] != "page":
+					remaining -= 1
+				if message[1] not in self.cancelled:
+					yield message
+		finally:
+			# Débloque les threads si l'appelant s'arrête avant la fin
+			self.stop.set()
+			executor.shutdown(wait=True)
+
+	def cancel(self, key):
+		"""
+		Abandonne la lecture d'un calendrier (ex: écriture de ses pages en échec)
+		Plus aucun message de cette clé n'est renvoyé par run()
+
+		Args:
+			key: Clé du job
+		"""
+		self.cancelled.add(key)
+
+	def _worker(self, key, open_pager):
+		try:
+			if key in self.cancelled:
+				self._put(("cancelled", key, None))
+				return
+
+			pager = open_pager()
+			for items in pager.pages():
+				if not self._put(("page", key, items)):
+					return
+				# Lecture abandonnée par l'appelant : les pages suivantes ne sont pas demandées
+				if key in self.cancelled:
+					self._put(("cancelled", key, None))
+					return
+			self._put(("done", key, pager))
+		except Exception:
+			self._put(("error", key, traceback.format_exc()))
+
+	def _put(self, message):
+		while not self.stop.is_set():
+			try:
+				self.queue.put(message, timeout=0.5)
+				return True
+			except queue.Full:
+				continue
+		return False
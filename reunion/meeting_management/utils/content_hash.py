@@ -0,0 +1,73 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+"""
+Empreinte du contenu synchronisé d'un Event ou d'une Task
+Permet de reconnaître, au moment de l'envoi vers Google, une ligne qui n'a pas
+changé depuis sa dernière réception (écho de l'import)
+"""
+
+import hashlib
+import json
+from datetime import date, datetime, time
+
+
+# Champs échangés avec Google pour chaque DocType
+HASH_FIELDS = {
+	"Event": ("subject", "description", "location", "starts_on", "ends_on", "all_day"),
+	"Task": ("subject", "description", "exp_start_date", "exp_end_date")
+}
+
+# Champs de répétition d'un Event (séries stockées une seule fois)
+REPEAT_FIELDS = (
+	"repeat_this_event", "repeat_on", "repeat_till",
+	"monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"
+)
+
+# Valeurs de google_last_origin
+ORIGIN_GOOGLE = "Google"
+ORIGIN_ERPNEXT = "ERPNext"
+
+
+def content_hash(doctype, values):
+	"""
+	Calcule l'empreinte des champs synchronisés
+
+	Args:
+		doctype: "Event" ou "Task"
+		values: Document ou dict (les valeurs lues en base et celles d'un document
+			en mémoire donnent la même empreinte)
+
+	Returns:
+		str: Empreinte SHA-1 hexadécimale
+	"""
+	fieldnames = HASH_FIELDS[doctype]
+
+	# Ajoutés seulement pour une série : l'empreinte des autres Events reste inchangée
+	if doctype == "Event" and values.get("repeat_this_event"):
+		fieldnames += REPEAT_FIELDS
+
+	normalized = [_normalize(values.get(fieldname)) for fieldname in fieldnames]
+	return hashlib.sha1(json.dumps(normalized).encode()).hexdigest()
+
+
+def _normalize(value):
+	if value is None:
+		return ""
+
+	if isinstance(value, bool):
+		value = int(value)
+
+	if isinstance(value, str):
+		try:
+			value = datetime.fromisoformat(value)
+		except ValueError:
+			return value
+
+	if isinstance(value, datetime):
+		return value.replace(microsecond=0, tzinfo=None).isoformat(sep=" ")
+
+	if isinstance(value, date):
+		return datetime.combine(value, time()).isoformat(sep=" ")
+
+	return str(value)
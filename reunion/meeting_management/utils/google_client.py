@@ -0,0 +1,294 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+"""
+Outils d'accès à l'API Google Calendar partagés par les synchronisations
+"""
+
+import json
+import threading
+import time
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from reunion.meeting_management.utils.rate_limit import (
+	MAX_RETRIES,
+	call_with_backoff,
+	execute_request,
+	is_retryable,
+	retry_delay
+)
+
+# Limites de maxResults imposées par events.list
+MAX_PAGE_SIZE = 2500
+DEFAULT_PAGE_SIZE = 250
+
+# Nombre maximal d'appels regroupés dans une requête batch Calendar API
+MAX_BATCH_SIZE = 50
+
+# Réponses partielles (paramètre fields) : seuls les champs lus par la synchronisation sont renvoyés
+EVENT_FIELDS = (
+	"id,etag,status,summary,description,location,start,end,"
+	"recurrence,recurringEventId,originalStartTime,updated"
+)
+EVENT_LIST_FIELDS = f"items({EVENT_FIELDS}),nextPageToken,nextSyncToken"
+# Réponse d'un envoi vers Google : seul l'etag est conservé (mark_pushed)
+PUSHED_EVENT_FIELDS = "id,etag"
+CALENDAR_FIELDS = "id,summary,description,timeZone"
+CALENDAR_LIST_FIELDS = "items(id,summary,description,primary,accessRole,backgroundColor)"
+CHANNEL_FIELDS = "id,resourceId,expiration"
+
+# Service Google Calendar de chaque thread (httplib2 n'est pas thread-safe)
+_local = threading.local()
+
+# Document de découverte analysé une seule fois par processus, partagé par tous les threads
+_discovery_document = None
+_discovery_lock = threading.Lock()
+
+
+def get_discovery_document():
+	"""
+	Renvoie le document de découverte Calendar API v3 livré avec googleapiclient, analysé
+	une seule fois par processus : les threads de récupération ne construisent plus que
+	leur client (Resource) et leur connexion HTTP
+
+	googleapiclient complète les descriptions des méthodes à la création de chaque ressource ;
+	ces compléments sont faits ici, sous verrou, avant que le document soit partagé.
+
+	Returns:
+		dict: Document de découverte
+	"""
+	global _discovery_document
+
+	with _discovery_lock:
+		if _discovery_document is None:
+			document = json.loads(get_static_doc("calendar", "v3"))
+			service = build_from_document(document, http=build_http())
+			for resource in document.get("resources", {}):
+				getattr(service, resource)()
+			_discovery_document = document
+
+	return _discovery_document
+
+
+def get_calendar_service(credentials):
+	"""
+	Renvoie le service Google Calendar du thread courant, authentifié avec les credentials fournis
+
+	Le client est construit une seule fois par thread à partir du document de découverte
+	partagé (get_discovery_document : ni téléchargement ni nouvelle analyse) ;
+	les appels suivants ne font que remplacer les credentials de la connexion HTTP.
+
+	Args:
+		credentials: google.oauth2.credentials.Credentials
+
+	Returns:
+		Resource: Service Google Calendar API v3
+	"""
+	cached = getattr(_local, "calendar_service", None)
+
+	if cached is None:
+		http = AuthorizedHttp(credentials, http=build_http())
+		service = build_from_document(get_discovery_document(), http=http)
+		_local.calendar_service = cached = (service, http)
+
+	service, http = cached
+	http.credentials = credentials
+
+	return service
+
+
+class EventPager:
+	"""
+	Parcourt toutes les pages de events.list et renvoie les événements un par un
+
+	Seule la page en cours est gardée en mémoire, quelle que soit la taille du calendrier.
+	Le nextSyncToken n'est renseigné qu'une fois la dernière page atteinte.
+	Chaque page passe par le seau de quota (bucket) et est retentée en cas de dépassement.
+	method="instances" (avec eventId) parcourt les occurrences d'une série.
+	Seuls les champs EVENT_LIST_FIELDS sont demandés, sauf fields fourni dans params.
+	"""
+
+	def __init__(self, service, calendar_id, page_size=DEFAULT_PAGE_SIZE, bucket=None, method="list", **params):
+		self.service = service
+		self.calendar_id = calendar_id
+		self.bucket = bucket
+		self.method = method
+		self.page_size = max(1, min(int(page_size or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+		self.params = {"fields": EVENT_LIST_FIELDS, **params}
+		self.next_sync_token = None
+		self.sync_token_expired = False
+		self.pages_fetched = 0
+		# Temps passé à attendre l'API Google (secondes, reprises comprises)
+		self.api_time = 0.0
+		self._first_result = None
+
+	def start(self):
+		"""
+		Récupère immédiatement la première page
+		Permet de détecter une erreur (ex: syncToken expiré) avant de commencer le traitement
+
+		Returns:
+			EventPager: self
+		"""
+		if self._first_result is None:
+			self._first_result = self._fetch(None)
+		return self
+
+	def pages(self):
+		"""
+		Générateur des pages d'événements (listes de dicts)
+		"""
+		result = self._first_result or self._fetch(None)
+		self._first_result = None
+
+		while True:
+			yield result.get('items', [])
+
+			page_token = result.get('nextPageToken')
+			if not page_token:
+				self.next_sync_token = result.get('nextSyncToken')
+				return
+
+			result = self._fetch(page_token)
+
+	def __iter__(self):
+		for items in self.pages():
+			yield from items
+
+	def _fetch(self, page_token):
+		self.pages_fetched += 1
+		started = time.monotonic()
+
+		try:
+			return execute_request(getattr(self.service.events(), self.method)(
+				calendarId=self.calendar_id,
+				maxResults=self.page_size,
+				pageToken=page_token,
+				**self.params
+			), self.bucket)
+		finally:
+			self.api_time += time.monotonic() - started
+
+
+class SeriesPager:
+	"""
+	Pages d'un EventPager lu sans singleEvents (séries stockées une seule fois)
+
+	Une série est remplacée par ses occurrences dans la fenêtre (events.instances), lues
+	dans le même thread que la page, quand sa règle n'a pas d'équivalent ERPNext
+	(voir is_supported) ou quand la liste contient une de ses exceptions (occurrence
+	modifiée ou supprimée, avec recurringEventId) : ERPNext ne sait pas les représenter.
+	L'annulation du maître est alors transmise avant ses occurrences, pour que la ligne
+	de la série éventuellement déjà stockée soit retirée. Chaque série n'est remplacée
+	qu'une fois par parcours. Les autres attributs sont ceux de l'EventPager.
+	"""
+
+	def __init__(self, pager, is_supported, **instance_params):
+		self.pager = pager
+		self.is_supported = is_supported
+		self.instance_params = instance_params
+		self.series_expanded = 0
+		self.expanded = set()
+
+	def __getattr__(self, name):
+		return getattr(self.pager, name)
+
+	def pages(self):
+		for items in self.pager.pages():
+			page = []
+
+			for item in items:
+				series_id = self._series_to_expand(item)
+				if not series_id:
+					page.append(item)
+				elif series_id not in self.expanded:
+					self.expanded.add(series_id)
+					page.extend(self._instances(series_id))
+
+			yield page
+
+	def __iter__(self):
+		for items in self.pages():
+			yield from items
+
+	def _series_to_expand(self, item):
+		"""
+		Returns:
+			str: ID de la série à remplacer par ses occurrences, None si l'élément est gardé tel quel
+		"""
+		# Exception d'une série : remplacée, comme la série, par les occurrences
+		if item.get("recurringEventId"):
+			return item["recurringEventId"]
+
+		if item.get("recurrence") and item.get("status") != "cancelled":
+			if item["id"] in self.expanded or not self.is_supported(item):
+				return item["id"]
+
+		return None
+
+	def _instances(self, series_id):
+		self.series_expanded += 1
+
+		# La série n'est plus stockée comme telle
+		yield {"id": series_id, "status": "cancelled"}
+
+		instances = EventPager(
+			self.pager.service,
+			self.pager.calendar_id,
+			self.pager.page_size,
+			self.pager.bucket,
+			method="instances",
+			eventId=series_id,
+			**self.instance_params
+		)
+
+		try:
+			yield from instances
+		except HttpError as e:
+			# Série supprimée dans Google : seule l'annulation est transmise
+			if e.resp.status not in (404, 410):
+				raise
+		finally:
+			self.pager.pages_fetched += instances.pages_fetched
+			self.pager.api_time += instances.api_time
+
+
+def execute_batch(service, requests, bucket=None, max_retries=MAX_RETRIES):
+	"""
+	Exécute des requêtes Google Calendar en une seule requête HTTP batch
+	Les sous-requêtes refusées pour dépassement de quota sont renvoyées dans un nouveau
+	batch après un délai ; chaque sous-requête compte pour un jeton du quota.
+
+	Args:
+		service: Service Google Calendar API
+		requests: Liste de tuples (request_id, HttpRequest), au plus MAX_BATCH_SIZE
+		bucket: QuotaBucket partagé (None = pas de limitation locale)
+		max_retries: Nombre maximal de nouvelles tentatives
+
+	Returns:
+		dict: {request_id: (response, exception)} pour chaque requête
+	"""
+	results = {}
+	pending = list(requests)
+
+	def callback(request_id, response, exception):
+		results[request_id] = (response, exception)
+
+	for attempt in range(max_retries + 1):
+		batch = service.new_batch_http_request(callback=callback)
+		for request_id, request in pending:
+			batch.add(request, request_id=request_id)
+
+		call_with_backoff(batch.execute, bucket, cost=len(pending), max_retries=max_retries)
+
+		retry = [(request_id, request) for request_id, request in pending if is_retryable(results[request_id][1])]
+		if not retry or attempt == max_retries:
+			break
+
+		time.sleep(max(retry_delay(results[request_id][1], attempt) for request_id, request in retry))
+		pending = retry
+
+	return results
@@ -0,0 +1,179 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+"""
+Conversion des dates entre Google Calendar et ERPNext, dans les deux sens
+
+ERPNext stocke des datetimes naïfs dans le fuseau du site ; Google renvoie des
+dateTime RFC 3339 avec décalage (ou un timeZone séparé) et des dates de journée
+entière dont la fin est exclusive. Les fuseaux sont mis en cache et le parsing
+passe par datetime.fromisoformat (dateutil n'est utilisé que pour les formats rares).
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from dateutil import parser as dateutil_parser
+
+
+# Format des Datetime ERPNext
+ERPNEXT_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Heure de fin d'une journée entière dans ERPNext
+END_OF_DAY = time(23, 59, 59)
+
+
+@lru_cache(maxsize=None)
+def get_zone(name):
+	"""
+	Args:
+		name: Nom IANA du fuseau (ex: "Europe/Paris")
+
+	Returns:
+		tzinfo: Fuseau correspondant, UTC si le nom est vide ou inconnu
+	"""
+	if not name:
+		return timezone.utc
+
+	try:
+		return ZoneInfo(name)
+	except (ZoneInfoNotFoundError, ValueError):
+		return timezone.utc
+
+
+def get_site_timezone():
+	"""
+	Returns:
+		str: Fuseau du site (System Settings), dans lequel ERPNext stocke ses dates
+	"""
+	from frappe.utils import get_system_timezone
+
+	return get_system_timezone()
+
+
+def parse_google_datetime(value, tz_name=None):
+	"""
+	Lit un dateTime Google
+
+	Args:
+		value: Chaîne RFC 3339 (ex: "2025-03-01T10:00:00+01:00", "2025-03-01T09:00:00Z")
+		tz_name: Fuseau appliqué si la chaîne n'a pas de décalage (start.timeZone)
+
+	Returns:
+		datetime: Datetime avec fuseau
+	"""
+	try:
+		# Python 3.10 n'accepte pas le suffixe Z
+		parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+	except ValueError:
+		parsed = dateutil_parser.isoparse(value)
+
+	if parsed.tzinfo is None:
+		parsed = parsed.replace(tzinfo=get_zone(tz_name))
+
+	return parsed
+
+
+def google_to_erpnext(start, end, site_tz=None):
+	"""
+	Convertit le début et la fin d'un événement Google en valeurs ERPNext
+
+	Args:
+		start: Champ "start" Google ({"dateTime": ..., "timeZone": ...} ou {"date": ...})
+		end: Champ "end" Google
+		site_tz: Fuseau du site (lu dans System Settings par défaut)
+
+	Returns:
+		tuple: (starts_on, ends_on, all_day), datetimes naïfs dans le fuseau du site ;
+			la fin exclusive d'une journée entière devient 23:59:59 du dernier jour
+	"""
+	if "dateTime" not in start:
+		start_date = date.fromisoformat(start["date"])
+		end_date = date.fromisoformat(end["date"]) - timedelta(days=1) if end.get("date") else start_date
+
+		return (
+			datetime.combine(start_date, time()),
+			datetime.combine(max(start_date, end_date), END_OF_DAY),
+			1
+		)
+
+	zone = get_zone(site_tz or get_site_timezone())
+	starts_on = parse_google_datetime(start["dateTime"], start.get("timeZone")).astimezone(zone)
+	ends_on = (
+		parse_google_datetime(end["dateTime"], end.get("timeZone")).astimezone(zone)
+		if end.get("dateTime") else starts_on
+	)
+
+	return starts_on.replace(tzinfo=None), ends_on.replace(tzinfo=None), 0
+
+
+def erpnext_to_google(starts_on, ends_on, all_day, site_tz=None):
+	"""
+	Convertit le début et la fin d'un Event ERPNext en champs "start" / "end" Google
+
+	Args:
+		starts_on: Datetime ERPNext (datetime naïf ou chaîne) dans le fuseau du site
+		ends_on: Datetime ERPNext (None : même valeur que starts_on)
+		all_day: Journée entière (la fin envoyée à Google est le lendemain du dernier jour)
+		site_tz: Fuseau du site (lu dans System Settings par défaut)
+
+	Returns:
+		tuple: (start, end) au format de l'API Google
+	"""
+	starts_on = to_datetime(starts_on)
+	ends_on = to_datetime(ends_on) if ends_on else starts_on
+
+	if all_day:
+		end_date = max(starts_on.date(), ends_on.date()) + timedelta(days=1)
+		return {"date": starts_on.date().isoformat()}, {"date": end_date.isoformat()}
+
+	# timeZone est exigé par Google pour les séries
+	tz_name = site_tz or get_site_timezone()
+	zone = get_zone(tz_name)
+
+	return (
+		{"dateTime": _localize(starts_on, zone).isoformat(), "timeZone": tz_name},
+		{"dateTime": _localize(ends_on, zone).isoformat(), "timeZone": tz_name}
+	)
+
+
+def google_date_to_erpnext(value, site_tz=None, end=False):
+	"""
+	Date ERPNext d'un champ "start" / "end" Google (dates des Tasks)
+
+	Args:
+		value: Champ Google ({"dateTime": ...} ou {"date": ...})
+		site_tz: Fuseau du site (lu dans System Settings par défaut)
+		end: True pour une fin : la date exclusive d'une journée entière devient le dernier jour
+
+	Returns:
+		date: Date dans le fuseau du site
+	"""
+	if "dateTime" in value:
+		zone = get_zone(site_tz or get_site_timezone())
+		return parse_google_datetime(value["dateTime"], value.get("timeZone")).astimezone(zone).date()
+
+	result = date.fromisoformat(value["date"])
+	return result - timedelta(days=1) if end else result
+
+
+def to_datetime(value):
+	"""
+	Returns:
+		datetime: Valeur ERPNext (chaîne, date ou datetime) en datetime
+	"""
+	if isinstance(value, datetime):
+		return value
+	if isinstance(value, date):
+		return datetime.combine(value, time())
+
+	try:
+		return datetime.fromisoformat(str(value))
+	except ValueError:
+		return datetime.strptime(str(value)[:19], ERPNEXT_DATETIME_FORMAT)
+
+
+def _localize(value, zone):
+	if value.tzinfo is None:
+		return value.replace(tzinfo=zone)
+	return value.astimezone(zone)
@@ -0,0 +1,124 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+"""
+Verrous Redis partagés entre les workers d'un site
+"""
+
+import frappe
+import time
+from contextlib import contextmanager
+from redis.exceptions import LockError
+
+
+# Durée de vie d'un verrou d'exécution unique sans battement de cœur (secondes)
+SINGLE_FLIGHT_TTL = 300
+
+
+@contextmanager
+def redis_lock(name, timeout=60, wait=0):
+	"""
+	Verrou Redis préfixé par le site, libéré automatiquement après timeout secondes
+
+	Args:
+		name: Nom du verrou
+		timeout: Durée de vie maximale du verrou (secondes)
+		wait: Durée d'attente maximale pour l'obtenir (0 = ne pas attendre)
+
+	Yields:
+		bool: True si le verrou a été obtenu
+	"""
+	cache = frappe.cache()
+	lock = cache.lock(
+		cache.make_key(f"lock:{name}"),
+		timeout=timeout,
+		blocking=wait > 0,
+		blocking_timeout=wait or None
+	)
+	acquired = lock.acquire()
+
+	try:
+		yield acquired
+	finally:
+		if acquired:
+			try:
+				lock.release()
+			except LockError:
+				# Verrou déjà expiré
+				pass
+
+
+class SingleFlight:
+	"""
+	Verrou d'exécution unique d'une synchronisation (par site, ou par calendrier)
+
+	Le verrou expire après ttl secondes sans battement de cœur : un worker tué ne bloque
+	pas les synchronisations suivantes plus longtemps. Le détenteur (id du job RQ ou
+	utilisateur) est enregistré pour que les appelants suivants puissent suivre son exécution.
+	"""
+
+	def __init__(self, name, ttl=SINGLE_FLIGHT_TTL):
+		cache = frappe.cache()
+		self.key = cache.make_key(f"single_flight:{name}")
+		self.ttl = ttl
+		self._lock = cache.lock(self.key, timeout=ttl, blocking=False)
+		self._last_beat = 0
+
+	def acquire(self, owner=None, wait=0):
+		"""
+		Tente d'obtenir le verrou
+
+		Args:
+			owner: Identifiant du détenteur (par défaut le job RQ courant ou l'utilisateur)
+			wait: Durée d'attente maximale si le verrou est occupé (0 = ne pas attendre)
+
+		Returns:
+			bool: True si le verrou a été obtenu
+		"""
+		owner = owner or get_current_owner()
+		acquired = self._lock.acquire(
+			blocking=wait > 0,
+			blocking_timeout=wait or None,
+			token=f"{owner}|{frappe.generate_hash(length=8)}"
+		)
+		self._last_beat = time.monotonic()
+		return acquired
+
+	def heartbeat(self):
+		"""
+		Prolonge le verrou ; peut être appelé souvent, Redis n'est sollicité qu'au tiers du TTL
+		"""
+		if time.monotonic() - self._last_beat < self.ttl / 3:
+			return
+
+		self._lock.reacquire()
+		self._last_beat = time.monotonic()
+
+	def release(self):
+		try:
+			self._lock.release()
+		except LockError:
+			# Verrou déjà expiré
+			pass
+
+	def owner(self):
+		"""
+		Returns:
+			str: Détenteur actuel du verrou, None s'il est libre
+		"""
+		value = frappe.cache().get(self.key)
+		if not value:
+			return None
+
+		return value.decode().split("|")[0]
+
+
+def get_current_owner():
+	"""
+	Returns:
+		str: Id du job RQ en cours, ou utilisateur de la requête
+	"""
+	from rq import get_current_job
+
+	job = get_current_job()
+	return job.id if job else f"user:{frappe.session.user}"
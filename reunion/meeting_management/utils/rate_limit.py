@@ -0,0 +1,163 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+"""
+Exécution des appels Google Calendar dans la limite du quota de l'API
+Les appels refusés pour dépassement de quota ou erreur serveur sont retentés
+avec un délai exponentiel aléatoire (ou le délai Retry-After indiqué par Google)
+"""
+
+import json
+import random
+import time
+from googleapiclient.errors import HttpError
+
+
+# Quota Calendar API par défaut d'un projet Google (requêtes par minute et par utilisateur)
+DEFAULT_QUOTA_PER_MINUTE = 600
+
+MAX_RETRIES = 6
+BACKOFF_BASE = 1
+BACKOFF_MAX = 64
+
+# Codes HTTP retentés tels quels ; un 403 ne l'est que pour un dépassement de quota
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+# Seau à jetons partagé : le jeton est réservé même s'il n'est pas encore disponible,
+# le script renvoie alors le délai à attendre avant d'émettre la requête
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - cost
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate) + 1)
+if tokens >= 0 then
+	return '0'
+end
+return tostring(-tokens / rate)
+"""
+
+
+class QuotaBucket:
+	"""
+	Seau à jetons Redis commun à tous les workers et threads d'un site
+
+	La clé est calculée à la construction (dans le thread principal) : l'objet peut ensuite
+	être utilisé depuis les threads de récupération, sans accès au contexte Frappe.
+	"""
+
+	def __init__(self, redis, key, quota_per_minute=DEFAULT_QUOTA_PER_MINUTE):
+		self.key = key
+		self.rate = max(1, int(quota_per_minute or DEFAULT_QUOTA_PER_MINUTE)) / 60
+		# Rafale maximale : une seconde de quota
+		self.capacity = max(1.0, self.rate)
+		self._script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+
+	def acquire(self, cost=1):
+		"""
+		Réserve des jetons et attend qu'ils soient disponibles
+
+		Args:
+			cost: Nombre de requêtes Google à émettre (taille du lot pour une requête batch)
+		"""
+		wait = float(self._script(keys=[self.key], args=[self.rate, self.capacity, time.time(), cost]))
+		if wait > 0:
+			time.sleep(wait)
+
+
+def execute_request(request, bucket=None, max_retries=MAX_RETRIES):
+	"""
+	Exécute une requête Google en respectant le quota, avec reprise sur dépassement
+
+	Args:
+		request: HttpRequest googleapiclient
+		bucket: QuotaBucket partagé (None = pas de limitation locale)
+		max_retries: Nombre maximal de nouvelles tentatives
+
+	Returns:
+		dict: Réponse de l'API
+	"""
+	return call_with_backoff(request.execute, bucket, max_retries=max_retries)
+
+
+def call_with_backoff(func, bucket=None, cost=1, max_retries=MAX_RETRIES):
+	"""
+	Appelle func en réservant cost jetons, et la relance après un délai si Google
+	refuse l'appel pour dépassement de quota ou erreur temporaire
+
+	Returns:
+		Valeur renvoyée par func
+	"""
+	attempt = 0
+
+	while True:
+		if bucket:
+			bucket.acquire(cost)
+
+		try:
+			return func()
+		except HttpError as e:
+			if attempt >= max_retries or not is_retryable(e):
+				raise
+
+			time.sleep(retry_delay(e, attempt))
+			attempt += 1
+
+
+def is_retryable(error):
+	"""
+	Args:
+		error: Exception renvoyée par googleapiclient
+
+	Returns:
+		bool: True pour un dépassement de quota ou une erreur serveur temporaire
+	"""
+	if not isinstance(error, HttpError):
+		return False
+
+	status = error.resp.status
+	if status in RETRY_STATUSES:
+		return True
+
+	return status == 403 and error_reason(error) in RATE_LIMIT_REASONS
+
+
+def error_reason(error):
+	"""
+	Returns:
+		str: Motif Google de l'erreur (ex: "rateLimitExceeded"), None s'il est absent
+	"""
+	try:
+		content = error.content.decode() if isinstance(error.content, bytes) else error.content
+		return json.loads(content)["error"]["errors"][0]["reason"]
+	except Exception:
+		return None
+
+
+def retry_delay(error, attempt):
+	"""
+	Délai avant la tentative suivante : Retry-After s'il est fourni, sinon délai
+	exponentiel avec gigue complète (évite que les workers relancent en même temps)
+
+	Args:
+		error: HttpError reçue
+		attempt: Numéro de la tentative échouée (0 pour la première)
+
+	Returns:
+		float: Délai en secondes
+	"""
+	retry_after = error.resp.get("retry-after") if error is not None else None
+	if retry_after:
+		try:
+			return min(float(retry_after), BACKOFF_MAX)
+		except ValueError:
+			# Format date HTTP : on retombe sur le délai exponentiel
+			pass
+
+	return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
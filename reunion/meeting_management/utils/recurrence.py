@@ -0,0 +1,172 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+"""
+Correspondance entre les règles de récurrence Google (RRULE) et les champs de
+répétition des Events ERPNext (repeat_this_event, repeat_on, repeat_till, jours)
+
+Seul un sous-ensemble des RRULE a un équivalent ERPNext : une seule règle, sans
+intervalle, jours de semaine simples en hebdomadaire, jour du mois (ou de l'année)
+de la première occurrence en mensuel (ou annuel). Les autres séries sont importées
+occurrence par occurrence.
+"""
+
+from datetime import date, datetime, time
+from dateutil.rrule import rrulestr
+from reunion.meeting_management.utils.google_time import get_zone, google_to_erpnext, parse_google_datetime
+
+
+FREQUENCIES = {
+	"DAILY": "Daily",
+	"WEEKLY": "Weekly",
+	"MONTHLY": "Monthly",
+	"YEARLY": "Yearly"
+}
+
+WEEKDAYS = {
+	"MO": "monday",
+	"TU": "tuesday",
+	"WE": "wednesday",
+	"TH": "thursday",
+	"FR": "friday",
+	"SA": "saturday",
+	"SU": "sunday"
+}
+
+# Nombre maximal d'occurrences parcourues pour convertir COUNT en date de fin
+MAX_COUNT = 1000
+
+
+def repeat_fields_from_google(google_event, site_tz=None):
+	"""
+	Champs de répétition ERPNext équivalents à la récurrence d'un événement Google
+
+	La règle Google s'applique dans le fuseau de l'événement, ERPNext répète le jour de
+	starts_on dans le fuseau du site : les jours de semaine sont décalés d'autant.
+
+	Args:
+		google_event: Événement maître Google (dict avec "recurrence" et "start")
+		site_tz: Fuseau du site (lu dans System Settings par défaut)
+
+	Returns:
+		dict: Champs Event (repeat_this_event, repeat_on, repeat_till, monday...),
+			{"repeat_this_event": 0} sans récurrence, None si la règle n'a pas d'équivalent
+	"""
+	recurrence = google_event.get("recurrence") or []
+	if not recurrence:
+		return {"repeat_this_event": 0}
+
+	start = _parse_start(google_event.get("start") or {})
+	if len(recurrence) != 1 or not recurrence[0].startswith("RRULE:") or not start:
+		return None
+
+	parts = dict(
+		part.split("=", 1) for part in recurrence[0][len("RRULE:"):].split(";") if "=" in part
+	)
+	frequency = FREQUENCIES.get(parts.pop("FREQ", None))
+	parts.pop("WKST", None)
+
+	if not frequency or parts.pop("INTERVAL", "1") != "1":
+		return None
+
+	fields = {"repeat_this_event": 1, "repeat_on": frequency, "repeat_till": None}
+	fields.update({fieldname: 0 for fieldname in WEEKDAYS.values()})
+
+	byday = parts.pop("BYDAY", None)
+	if frequency == "Weekly":
+		codes = list(WEEKDAYS)
+		days = byday.split(",") if byday else [codes[start.weekday()]]
+		if any(day not in WEEKDAYS for day in days):
+			return None
+
+		# Ex: 23:00 à New York le lundi = 05:00 à Paris le mardi
+		starts_on = google_to_erpnext(google_event["start"], google_event["start"], site_tz)[0]
+		shift = (starts_on.date() - start.date()).days
+		for day in days:
+			fields[WEEKDAYS[codes[(codes.index(day) + shift) % 7]]] = 1
+	elif byday:
+		return None
+
+	# Mensuel / annuel : ERPNext répète le jour (et le mois) de la première occurrence
+	bymonthday = parts.pop("BYMONTHDAY", None)
+	if bymonthday and (frequency not in ("Monthly", "Yearly") or bymonthday != str(start.day)):
+		return None
+
+	bymonth = parts.pop("BYMONTH", None)
+	if bymonth and (frequency != "Yearly" or bymonth != str(start.month)):
+		return None
+
+	until = parts.pop("UNTIL", None)
+	count = parts.pop("COUNT", None)
+
+	# BYSETPOS, BYHOUR... : pas d'équivalent
+	if parts:
+		return None
+
+	if until:
+		fields["repeat_till"] = _parse_until(until)
+	elif count:
+		fields["repeat_till"] = _last_occurrence(recurrence[0], start, int(count))
+		if not fields["repeat_till"]:
+			return None
+
+	return fields
+
+
+def rrule_from_repeat_fields(event):
+	"""
+	Règle Google équivalente aux champs de répétition d'un Event ERPNext
+
+	Args:
+		event: Event (dict ou document)
+
+	Returns:
+		list: Valeur du champ "recurrence" Google, None si l'Event ne se répète pas
+	"""
+	frequency = {value: key for key, value in FREQUENCIES.items()}.get(event.get("repeat_on"))
+	if not event.get("repeat_this_event") or not frequency:
+		return None
+
+	rule = f"RRULE:FREQ={frequency}"
+
+	if frequency == "WEEKLY":
+		days = [code for code, fieldname in WEEKDAYS.items() if event.get(fieldname)]
+		if days:
+			rule += ";BYDAY=" + ",".join(days)
+
+	repeat_till = event.get("repeat_till")
+	if repeat_till:
+		if isinstance(repeat_till, str):
+			repeat_till = date.fromisoformat(repeat_till[:10])
+		rule += ";UNTIL=" + repeat_till.strftime("%Y%m%d") + "T235959Z"
+
+	return [rule]
+
+
+def _parse_start(start):
+	"""
+	Returns:
+		datetime: Début naïf dans le fuseau de l'événement (celui de la règle), None sans début
+	"""
+	if start.get("date"):
+		return datetime.combine(date.fromisoformat(start["date"]), time())
+	if not start.get("dateTime"):
+		return None
+
+	value = parse_google_datetime(start["dateTime"], start.get("timeZone"))
+	if start.get("timeZone"):
+		value = value.astimezone(get_zone(start["timeZone"]))
+
+	return value.replace(tzinfo=None)
+
+
+def _parse_until(until):
+	return datetime.strptime(until[:8], "%Y%m%d").date()
+
+
+def _last_occurrence(rule, start, count):
+	if count > MAX_COUNT:
+		return None
+
+	occurrences = list(rrulestr(rule[len("RRULE:"):], dtstart=datetime.combine(start.date(), time())))
+	return occurrences[-1].date() if occurrences else None
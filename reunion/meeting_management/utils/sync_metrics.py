@@ -0,0 +1,153 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+"""
+Mesures d'une exécution de synchronisation, enregistrées dans Google Calendar Sync Run
+"""
+
+import frappe
+import json
+import math
+import time
+from contextlib import contextmanager
+from frappe.utils import now_datetime
+
+
+# Compteurs suivis par calendrier et totalisés sur l'exécution
+COUNTERS = ("pages", "api_calls", "synced", "skipped", "failed", "deleted", "db_writes")
+TIMERS = ("api_time", "db_time")
+
+STATUS_SUCCESS = "Succès"
+STATUS_ERROR = "Erreur"
+
+
+class SyncMetrics:
+	"""
+	Accumule durées et compteurs par calendrier pendant une synchronisation
+
+	Utilisé uniquement dans le thread principal : les durées mesurées dans les threads
+	de récupération (EventPager.api_time) sont ajoutées à la fin de chaque calendrier.
+	"""
+
+	def __init__(self, direction, trigger_calendar_id=None):
+		self.direction = direction
+		self.trigger_calendar_id = trigger_calendar_id
+		self.started_at = now_datetime()
+		self._started = time.monotonic()
+		self.calendars = {}
+
+	def calendar(self, calendar_id):
+		"""
+		Returns:
+			frappe._dict: Compteurs du calendrier (créés au premier appel)
+		"""
+		if calendar_id not in self.calendars:
+			self.calendars[calendar_id] = frappe._dict(
+				{name: 0 for name in COUNTERS},
+				**{name: 0.0 for name in TIMERS},
+				duration=None,
+				error=False
+			)
+		return self.calendars[calendar_id]
+
+	def add(self, calendar_id, **values):
+		"""
+		Ajoute des valeurs aux compteurs d'un calendrier (ex: synced=10, api_time=0.4)
+		"""
+		stats = self.calendar(calendar_id)
+		for name, value in values.items():
+			stats[name] += value or 0
+
+	@contextmanager
+	def timer(self, calendar_id, name):
+		"""
+		Mesure la durée du bloc et l'ajoute au chronomètre name du calendrier
+		"""
+		started = time.monotonic()
+		try:
+			yield
+		finally:
+			self.add(calendar_id, **{name: time.monotonic() - started})
+
+	def finish_calendar(self, calendar_id, error=False):
+		"""
+		Fige la durée d'un calendrier (depuis le début de l'exécution, les calendriers
+		étant lus en parallèle)
+		"""
+		stats = self.calendar(calendar_id)
+		stats.duration = time.monotonic() - self._started
+		stats.error = stats.error or error
+
+	def totals(self):
+		"""
+		Returns:
+			dict: Somme des compteurs et chronomètres de tous les calendriers
+		"""
+		return {
+			name: sum(stats[name] for stats in self.calendars.values())
+			for name in COUNTERS + TIMERS
+		}
+
+	def save(self, status=STATUS_SUCCESS, error=None):
+		"""
+		Enregistre l'exécution dans Google Calendar Sync Run et valide la transaction
+
+		Args:
+			status: STATUS_SUCCESS ou STATUS_ERROR
+			error: Traceback en cas d'erreur
+
+		Returns:
+			str: Nom du Google Calendar Sync Run, None si l'enregistrement a échoué
+		"""
+		duration = time.monotonic() - self._started
+		totals = self.totals()
+
+		for stats in self.calendars.values():
+			if stats.duration is None:
+				stats.duration = duration
+
+		try:
+			run = frappe.get_doc({
+				"doctype": "Google Calendar Sync Run",
+				"direction": self.direction,
+				"status": status,
+				"calendar_id": self.trigger_calendar_id,
+				"started_at": self.started_at,
+				"duration": round(duration, 3),
+				"calendars_count": len(self.calendars),
+				"events_per_second": round(totals["synced"] / duration, 2) if duration else 0,
+				**{name: totals[name] for name in COUNTERS},
+				**{name: round(totals[name], 3) for name in TIMERS},
+				"calendar_stats": json.dumps({
+					calendar_id: {name: round(value, 3) if isinstance(value, float) else value for name, value in stats.items()}
+					for calendar_id, stats in self.calendars.items()
+				}),
+				"error": error
+			})
+			run.insert(ignore_permissions=True)
+			frappe.db.commit()
+			return run.name
+
+		except Exception:
+			# Les mesures ne doivent jamais faire échouer la synchronisation
+			frappe.log_error(frappe.get_traceback(), "Google Calendar - Save Sync Run Error")
+			return None
+
+
+def percentile(values, percent):
+	"""
+	Percentile par rang le plus proche
+
+	Args:
+		values: Valeurs numériques
+		percent: Percentile voulu (0-100)
+
+	Returns:
+		float: Valeur du percentile, None si values est vide
+	"""
+	values = sorted(v for v in values if v is not None)
+	if not values:
+		return None
+
+	rank = max(1, math.ceil(percent / 100 * len(values)))
+	return values[rank - 1]
@@ -0,0 +1,105 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+"""
+Fenêtre de synchronisation d'un calendrier et découpage de l'import de l'historique
+"""
+
+from datetime import date, datetime, time, timedelta
+from dateutil.relativedelta import relativedelta
+
+
+# Fenêtre par défaut (Google Calendar Sync Config.days_past / days_future)
+DEFAULT_DAYS_PAST = 30
+DEFAULT_DAYS_FUTURE = 60
+
+# Intervalle entre deux lectures complètes de la fenêtre (entre-temps, syncToken)
+FULL_RESYNC_INTERVAL = timedelta(days=1)
+
+# Taille d'une tranche d'import de l'historique
+BACKFILL_CHUNK = relativedelta(months=1)
+
+
+def sync_window(days_past=None, days_future=None, now=None):
+	"""
+	Fenêtre lue lors d'une synchronisation complète
+
+	Args:
+		days_past: Jours avant maintenant (None pour la valeur par défaut, 0 accepté)
+		days_future: Jours après maintenant (None pour la valeur par défaut, 0 accepté)
+		now: Instant de référence UTC (maintenant par défaut)
+
+	Returns:
+		tuple: (début, fin) en datetime UTC naïfs
+	"""
+	now = now or datetime.utcnow()
+	days_past = DEFAULT_DAYS_PAST if days_past is None else max(0, int(days_past))
+	days_future = DEFAULT_DAYS_FUTURE if days_future is None else max(0, int(days_future))
+
+	return now - timedelta(days=days_past), now + timedelta(days=days_future)
+
+
+def needs_full_resync(window_anchor, now=None):
+	"""
+	Indique si la fenêtre d'un calendrier doit être relue entièrement
+
+	Args:
+		window_anchor: Date de la dernière lecture complète (None si inconnue)
+		now: Instant de référence, dans le même fuseau que window_anchor
+
+	Returns:
+		bool: True si aucune lecture complète depuis FULL_RESYNC_INTERVAL
+	"""
+	if not window_anchor:
+		return True
+
+	if isinstance(window_anchor, str):
+		window_anchor = datetime.fromisoformat(window_anchor)
+
+	return (now or datetime.now()) - window_anchor >= FULL_RESYNC_INTERVAL
+
+
+def next_backfill_chunk(backfill_until, backfill_cursor, window_start):
+	"""
+	Prochaine tranche de l'historique à importer, en remontant le temps depuis la
+	fenêtre de synchronisation (ou depuis la dernière tranche importée)
+
+	Args:
+		backfill_until: Date la plus ancienne à importer (None : pas d'import de l'historique)
+		backfill_cursor: Début de la dernière tranche importée (None avant la première)
+		window_start: Début de la fenêtre de synchronisation
+
+	Returns:
+		tuple: (début, fin) en dates, None si l'historique est entièrement importé
+	"""
+	if not backfill_until:
+		return None
+
+	end = _as_date(window_start)
+	if backfill_cursor:
+		end = min(end, _as_date(backfill_cursor))
+
+	until = _as_date(backfill_until)
+	if end <= until:
+		return None
+
+	return max(until, end - BACKFILL_CHUNK), end
+
+
+def to_google_time(value):
+	"""
+	Returns:
+		str: Date ou datetime UTC au format RFC 3339 attendu par timeMin / timeMax
+	"""
+	if not isinstance(value, datetime):
+		value = datetime.combine(value, time())
+
+	return value.replace(tzinfo=None).isoformat() + "Z"
+
+
+def _as_date(value):
+	if isinstance(value, datetime):
+		return value.date()
+	if isinstance(value, date):
+		return value
+	return date.fromisoformat(str(value)[:10])
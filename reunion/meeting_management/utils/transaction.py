@@ -0,0 +1,60 @@
+# Copyright (c) 2025, Business Architecte and contributors
+# For license information, please see license.txt
+
+"""
+Regroupement des écritures de synchronisation en transactions
+"""
+
+import frappe
+from contextlib import contextmanager
+from frappe.utils import cint
+
+
+DEFAULT_BATCH_SIZE = 100
+
+
+class TransactionBatch:
+	"""
+	Regroupe les écritures dans des transactions de taille fixe
+
+	Chaque élément est protégé par un savepoint : une erreur n'annule que cet élément,
+	les autres écritures du lot sont conservées et validées au prochain commit.
+	"""
+
+	SAVEPOINT = "google_calendar_sync_item"
+
+	def __init__(self, batch_size=DEFAULT_BATCH_SIZE):
+		self.batch_size = max(1, cint(batch_size) or DEFAULT_BATCH_SIZE)
+		self.pending = 0
+		self.commits = 0
+
+	@contextmanager
+	def item(self):
+		"""
+		Exécute le bloc dans un savepoint, annulé si une exception est levée
+		L'exception est propagée pour que l'appelant puisse la journaliser
+		"""
+		frappe.db.savepoint(self.SAVEPOINT)
+
+		try:
+			yield
+		except Exception:
+			frappe.db.rollback(save_point=self.SAVEPOINT)
+			raise
+
+		frappe.db.release_savepoint(self.SAVEPOINT)
+		self.pending += 1
+
+		if self.pending >= self.batch_size:
+			self.commit()
+
+	def commit(self):
+		"""
+		Valide les écritures en attente
+		"""
+		if not self.pending:
+			return
+
+		frappe.db.commit()
+		self.commits += 1
+		self.pending = 0
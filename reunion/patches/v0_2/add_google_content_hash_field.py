@@ -0,0 +1,11 @@
+"""
+Ajoute les custom fields google_content_hash et google_last_origin sur Event et Task
+utilisés pour ne pas renvoyer vers Google les événements qui viennent d'en être importés
+"""
+
+from frappe.custom.doctype.custom_field.custom_field import create_custom_fields
+from reunion.meeting_management.api.add_google_calendar_fields import get_custom_fields
+
+
+def execute():
+	create_custom_fields(get_custom_fields(["google_content_hash", "google_last_origin"]), update=True)
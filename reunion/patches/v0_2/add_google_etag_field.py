@@ -0,0 +1,11 @@
+"""
+Ajoute le custom field google_etag sur Event et Task
+utilisé pour ignorer les événements Google non modifiés
+"""
+
+from frappe.custom.doctype.custom_field.custom_field import create_custom_fields
+from reunion.meeting_management.api.add_google_calendar_fields import get_custom_fields
+
+
+def execute():
+	create_custom_fields(get_custom_fields(["google_etag"]), update=True)
@@ -0,0 +1,10 @@
+"""
+Ajoute l'index composite (google_calendar_id, google_event_id) sur Event et Task
+pour les sites installés avant sa création
+"""
+
+from reunion.meeting_management.api.add_google_calendar_fields import add_google_sync_indexes
+
+
+def execute():
+	add_google_sync_indexes()
@@ -0,0 +1,38 @@
+"""
+Corrige les Events importés avant la conversion des dates par fuseau (google_time)
+
+- les journées entières stockaient la fin exclusive de Google (lendemain 23:59:59) :
+  la fin est ramenée au dernier jour, sinon l'envoi vers Google ajouterait un jour
+- ces lignes n'ont pas d'empreinte : elle est calculée pour que l'envoi les ignore
+  tant qu'elles ne sont pas modifiées dans ERPNext
+- leur etag et les syncToken sont effacés : la prochaine importation relit la fenêtre
+  et réécrit ces lignes avec les heures converties dans le fuseau du site
+"""
+
+import frappe
+from frappe.utils import add_days, get_datetime, getdate
+from reunion.meeting_management.utils.content_hash import HASH_FIELDS, ORIGIN_GOOGLE, REPEAT_FIELDS, content_hash
+
+
+def execute():
+	if not frappe.db.has_column("Event", "google_content_hash"):
+		return
+
+	events = frappe.get_all("Event",
+		filters={"google_event_id": ["is", "set"], "google_content_hash": ["is", "not set"]},
+		fields=["name", *HASH_FIELDS["Event"], *REPEAT_FIELDS]
+	)
+
+	for event in events:
+		values = {"google_last_origin": ORIGIN_GOOGLE, "google_etag": None}
+
+		if event.all_day and event.ends_on and getdate(event.ends_on) > getdate(event.starts_on):
+			event.ends_on = add_days(get_datetime(event.ends_on), -1)
+			values["ends_on"] = event.ends_on
+
+		values["google_content_hash"] = content_hash("Event", event)
+		frappe.db.set_value("Event", event.name, values, update_modified=False)
+
+	if events:
+		frappe.db.set_value("Google Calendar Sync Config", {"parent": "Google Calendar Settings"},
+			"sync_token", None, update_modified=False)
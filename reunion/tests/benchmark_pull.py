@@ -0,0 +1,145 @@
+"""
+Benchmark of the Google Calendar pull pipeline (sync_from_google) without network
+
+The Google service is replaced by FakeCalendarService; everything else (locks,
+transactions, database writes) is the real code. Synthetic calendars are added to
+Google Calendar Settings for the run and removed afterwards with their documents.
+
+Run on a development site:
+	bench --site <site> execute reunion.tests.benchmark_pull.run --kwargs "{'calendars': 5, 'events': 2000}"
+"""
+
+import frappe
+import time
+import tracemalloc
+from unittest.mock import patch
+from reunion.meeting_management.api import google_calendar
+from reunion.tests.fake_calendar_service import FakeCalendarService
+
+
+def run(calendars=3, events=1000, changes=50, page_size=250, sync_to_doctype="Event"):
+	"""
+	Runs three passes and prints their measures:
+	- full: first import, every event is created
+	- unchanged: full re-read, every event is skipped thanks to its etag
+	- incremental: syncToken request returning `changes` modified events
+
+	Args:
+		calendars: Number of synthetic calendars
+		events: Events per calendar (recurring instances included)
+		changes: Events modified between the unchanged and incremental passes
+		page_size: Google page size (Google Calendar Settings.page_size)
+		sync_to_doctype: "Event" or "Task"
+
+	Returns:
+		list: One dict of measures per pass
+	"""
+	service = FakeCalendarService(calendars, events, changes)
+	settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
+	backup = {
+		"calendars_to_sync": [row.as_dict() for row in settings.calendars_to_sync],
+		"page_size": settings.page_size,
+		"last_sync": settings.last_sync,
+		"sync_status": settings.sync_status
+	}
+
+	results = []
+
+	try:
+		settings.set("calendars_to_sync", [])
+		for calendar_id in service.calendar_ids:
+			settings.append("calendars_to_sync", {
+				"calendar_id": calendar_id,
+				"calendar_name": calendar_id,
+				"enabled": 1,
+				"sync_to_doctype": sync_to_doctype
+			})
+		settings.page_size = page_size
+		settings.save(ignore_permissions=True)
+		frappe.db.commit()
+
+		results.append(measure("full", service))
+
+		# Relecture complète : les etags n'ont pas changé
+		frappe.db.set_value("Google Calendar Sync Config", {"parent": "Google Calendar Settings"},
+			"sync_token", None, update_modified=False)
+		frappe.db.commit()
+		results.append(measure("unchanged", service))
+
+		service.touch()
+		results.append(measure("incremental", service))
+
+	finally:
+		cleanup(service, sync_to_doctype)
+
+		settings = frappe.get_doc("Google Calendar Settings", "Google Calendar Settings")
+		settings.set("calendars_to_sync", backup.pop("calendars_to_sync"))
+		settings.update(backup)
+		settings.save(ignore_permissions=True)
+		frappe.db.commit()
+
+	print_results(results)
+	return results
+
+
+def measure(label, service):
+	"""
+	Runs sync_from_google once against the fake service
+
+	Returns:
+		dict: Events read, duration, events per second, queries per event, peak memory
+	"""
+	events_before = service.events_served
+	calls_before = service.calls
+
+	tracemalloc.start()
+	started = time.perf_counter()
+
+	with patch.object(google_calendar, "get_credentials", return_value=object()), \
+			patch.object(google_calendar, "get_calendar_service", return_value=service), \
+			patch.object(google_calendar, "get_quota_bucket", return_value=None), \
+			patch.object(frappe.db, "sql", wraps=frappe.db.sql) as sql:
+		result = google_calendar.sync_from_google()
+
+	duration = time.perf_counter() - started
+	current, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+
+	if not result.get("success"):
+		frappe.throw(f"Benchmark pass '{label}' failed: {result.get('message')}")
+
+	events_read = service.events_served - events_before
+
+	return {
+		"pass": label,
+		"events": events_read,
+		"api_calls": service.calls - calls_before,
+		"synced": result.get("events_synced", 0) + result.get("tasks_synced", 0),
+		"skipped": result.get("skipped", 0),
+		"duration": round(duration, 3),
+		"events_per_second": round(events_read / duration, 1) if duration else 0,
+		"queries": sql.call_count,
+		"queries_per_event": round(sql.call_count / events_read, 2) if events_read else 0,
+		"peak_memory_mb": round(peak / 1024 / 1024, 2),
+		"sync_run": result.get("sync_run")
+	}
+
+
+def cleanup(service, sync_to_doctype):
+	"""
+	Removes the documents and failures created for the synthetic calendars
+	"""
+	for calendar_id in service.calendar_ids:
+		frappe.db.delete(sync_to_doctype, {"google_calendar_id": calendar_id})
+		frappe.db.delete("Google Calendar Sync Failure", {"calendar_id": calendar_id})
+
+	frappe.db.commit()
+
+
+def print_results(results):
+	columns = ["pass", "events", "api_calls", "synced", "skipped", "duration", "events_per_second",
+		"queries_per_event", "peak_memory_mb"]
+
+	print(" | ".join(columns))
+	for result in results:
+		print(" | ".join(str(result[column]) for column in columns))
@@ -0,0 +1,169 @@
+"""
+In-process stand-in for the Google Calendar API v3 service
+
+Generates calendars of synthetic events on demand (nothing is kept in memory
+besides counters): timed, all-day and weekly recurring events, served in pages
+like events.list, with a nextSyncToken on the last page.
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+
+# Events of a recurring series: items i with i % RECURRING_EVERY < RECURRING_INSTANCES
+RECURRING_EVERY = 10
+RECURRING_INSTANCES = 4
+# Every ALL_DAY_EVERY-th item (outside series) is an all-day event
+ALL_DAY_EVERY = 7
+
+
+class FakeRequest:
+	def __init__(self, func):
+		self.func = func
+
+	def execute(self, **kwargs):
+		return self.func()
+
+
+class FakeBatch:
+	def __init__(self, callback):
+		self.callback = callback
+		self.requests = []
+
+	def add(self, request, request_id=None):
+		self.requests.append((request_id, request))
+
+	def execute(self, **kwargs):
+		for request_id, request in self.requests:
+			self.callback(request_id, request.execute(), None)
+
+
+class FakeCalendarService:
+	"""
+	Fake service: calendarList().list(), events().list/instances/get/update and batch requests
+
+	Args:
+		calendars: Number of calendars (ids "bench-0", "bench-1"...)
+		events: Number of items per calendar when recurring events are expanded (singleEvents)
+		changes: Number of events returned as modified by an incremental (syncToken) request
+		start: Date of the first event (events are spread one hour apart over the following days)
+	"""
+
+	def __init__(self, calendars=3, events=1000, changes=50, start=None):
+		self.calendar_ids = [f"bench-{index}" for index in range(calendars)]
+		self.events_per_calendar = events
+		self.changes = changes
+		self.start = (start or datetime.utcnow() - timedelta(days=7)).replace(minute=0, second=0, microsecond=0)
+		self.generation = 0
+		self._lock = threading.Lock()
+		self.calls = 0
+		self.events_served = 0
+
+	# Resources
+
+	def calendarList(self):
+		return self
+
+	def events(self):
+		return self
+
+	def new_batch_http_request(self, callback=None):
+		return FakeBatch(callback)
+
+	def list(self, calendarId=None, maxResults=250, pageToken=None, syncToken=None, singleEvents=False, **kwargs):
+		if calendarId is None:
+			return FakeRequest(lambda: {"items": [{"id": calendar_id, "summary": calendar_id} for calendar_id in self.calendar_ids]})
+
+		return FakeRequest(lambda: self._list_page(calendarId, int(maxResults), int(pageToken or 0), syncToken, singleEvents))
+
+	def instances(self, calendarId, eventId, maxResults=250, pageToken=None, **kwargs):
+		series = int(eventId.rsplit("-", 1)[1])
+		return FakeRequest(lambda: self._instances_page(calendarId, series, int(maxResults), int(pageToken or 0)))
+
+	def get(self, calendarId, eventId, **kwargs):
+		index = int(eventId.split("_")[0].rsplit("-", 1)[1])
+		return FakeRequest(lambda: self.build_event(calendarId, index, True))
+
+	def update(self, calendarId, eventId, body, **kwargs):
+		return FakeRequest(lambda: dict(body, id=eventId, etag=f'"{self.generation}-updated"'))
+
+	def touch(self):
+		"""
+		Make the next incremental request return `changes` modified events
+		"""
+		self.generation += 1
+
+	# Event generation
+
+	def _list_page(self, calendar_id, page_size, offset, sync_token, single_events):
+		if sync_token:
+			indexes = list(range(min(self.changes, self.events_per_calendar))) if self.generation else []
+		else:
+			indexes = [
+				index for index in range(self.events_per_calendar)
+				if single_events or index % RECURRING_EVERY == 0 or index % RECURRING_EVERY >= RECURRING_INSTANCES
+			]
+
+		page = indexes[offset:offset + page_size]
+		items = [self.build_event(calendar_id, index, single_events) for index in page]
+
+		with self._lock:
+			self.calls += 1
+			self.events_served += len(items)
+
+		result = {"items": items}
+		if offset + page_size < len(indexes):
+			result["nextPageToken"] = str(offset + page_size)
+		else:
+			result["nextSyncToken"] = f"sync-{calendar_id}-{self.generation}"
+
+		return result
+
+	def _instances_page(self, calendar_id, series, page_size, offset):
+		indexes = list(range(series, series + RECURRING_INSTANCES))[offset:offset + page_size]
+		items = [self.build_event(calendar_id, index) for index in indexes]
+
+		with self._lock:
+			self.calls += 1
+			self.events_served += len(items)
+
+		result = {"items": items}
+		if offset + page_size < RECURRING_INSTANCES:
+			result["nextPageToken"] = str(offset + page_size)
+
+		return result
+
+	def build_event(self, calendar_id, index, single_events=True):
+		position = index % RECURRING_EVERY
+		recurring = position < RECURRING_INSTANCES
+		series = index - position
+		start = self.start + timedelta(hours=index)
+
+		event = {
+			"kind": "calendar#event",
+			"id": f"{calendar_id}-{index}",
+			"etag": f'"{self.generation}-{index}"',
+			"status": "confirmed",
+			"summary": f"Event {index}",
+			"description": f"Synthetic event {index} of {calendar_id}",
+			"location": "Salle A" if index % 2 else "",
+			"updated": "2025-01-01T00:00:00.000Z"
+		}
+
+		if recurring:
+			start = self.start + timedelta(hours=series, weeks=position)
+			if single_events:
+				event["id"] = f"{calendar_id}-{series}_{start.strftime('%Y%m%dT%H%M%SZ')}"
+				event["recurringEventId"] = f"{calendar_id}-{series}"
+				event["originalStartTime"] = {"dateTime": start.isoformat() + "Z"}
+			else:
+				event["recurrence"] = [f"RRULE:FREQ=WEEKLY;COUNT={RECURRING_INSTANCES}"]
+
+		if not recurring and index % ALL_DAY_EVERY == 0:
+			event["start"] = {"date": start.date().isoformat()}
+			event["end"] = {"date": (start.date() + timedelta(days=1)).isoformat()}
+		else:
+			event["start"] = {"dateTime": start.isoformat() + "Z"}
+			event["end"] = {"dateTime": (start + timedelta(hours=1)).isoformat() + "Z"}
+
+		return event
@@ -0,0 +1,90 @@
+"""
+Unit tests for concurrent calendar fetching
+"""
+
+import unittest
+from reunion.meeting_management.utils.concurrent_fetch import CalendarFetcher
+
+
+class FakePager:
+	def __init__(self, pages):
+		self._pages = pages
+		self.pages_fetched = 0
+
+	def pages(self):
+		for page in self._pages:
+			self.pages_fetched += 1
+			yield page
+
+
+class TestCalendarFetcher(unittest.TestCase):
+	"""
+	Test the bounded worker pool feeding pages to the caller
+	"""
+
+	def test_yields_pages_then_done_per_calendar(self):
+		"""
+		Every page of every calendar reaches the caller, followed by done
+		"""
+		jobs = [
+			(key, lambda key=key: FakePager([[f"{key}-{i}"] for i in range(5)]))
+			for key in ("a", "b", "c")
+		]
+
+		pages = {}
+		done = set()
+		for kind, key, payload in CalendarFetcher(2, queue_size=1).run(jobs):
+			if kind == "page":
+				self.assertNotIn(key, done)
+				pages.setdefault(key, []).extend(payload)
+			elif kind == "done":
+				done.add(key)
+
+		self.assertEqual(done, {"a", "b", "c"})
+		self.assertEqual(pages["b"], [f"b-{i}" for i in range(5)])
+
+	def test_reports_errors_per_calendar(self):
+		"""
+		A failing calendar is reported without stopping the others
+		"""
+		def broken():
+			raise RuntimeError("quota")
+
+		messages = list(CalendarFetcher(2).run([
+			("ok", lambda: FakePager([["x"]])),
+			("ko", broken),
+		]))
+
+		errors = [m for m in messages if m[0] == "error"]
+		self.assertEqual(len(errors), 1)
+		self.assertEqual(errors[0][1], "ko")
+		self.assertIn("RuntimeError: quota", errors[0][2])
+		self.assertIn(("done", "ok"), [(m[0], m[1]) for m in messages])
+
+	def test_caller_can_stop_early(self):
+		"""
+		Closing the generator releases blocked workers
+		"""
+		jobs = [("a", lambda: FakePager([[i] for i in range(100)]))]
+		run = CalendarFetcher(1, queue_size=1).run(jobs)
+
+		next(run)
+		run.close()
+
+	def test_cancelled_calendar_stops(self):
+		"""
+		A cancelled calendar sends no more messages and stops fetching, the others go on
+		"""
+		pagers = {key: FakePager([[i] for i in range(100)]) for key in ("a", "b")}
+		fetcher = CalendarFetcher(2, queue_size=1)
+
+		messages = []
+		for kind, key, payload in fetcher.run([(key, lambda key=key: pagers[key]) for key in pagers]):
+			if key == "a" and kind == "page":
+				fetcher.cancel("a")
+			messages.append((kind, key))
+
+		self.assertEqual(len([m for m in messages if m[1] == "a"]), 1)
+		self.assertIn(("done", "b"), messages)
+		self.assertEqual(len([m for m in messages if m == ("page", "b")]), 100)
+		self.assertLess(pagers["a"].pages_fetched, 10)
@@ -0,0 +1,65 @@
+"""
+Unit tests for the synced content hash
+"""
+
+import unittest
+from datetime import date, datetime
+from reunion.meeting_management.utils.content_hash import content_hash
+
+
+class TestContentHash(unittest.TestCase):
+	"""
+	Test that pulled and stored values hash the same way
+	"""
+
+	def test_document_and_database_values_match(self):
+		"""
+		Strings set on a document hash like the typed values read back from the database
+		"""
+		pulled = {
+			"subject": "Réunion",
+			"description": "",
+			"location": "Salle A",
+			"starts_on": "2025-03-01 10:00:00",
+			"ends_on": "2025-03-01 11:00:00",
+			"all_day": 0
+		}
+		stored = {
+			"subject": "Réunion",
+			"description": None,
+			"location": "Salle A",
+			"starts_on": datetime(2025, 3, 1, 10, 0),
+			"ends_on": datetime(2025, 3, 1, 11, 0),
+			"all_day": False,
+			"status": "Open"
+		}
+
+		self.assertEqual(content_hash("Event", pulled), content_hash("Event", stored))
+
+	def test_task_dates(self):
+		"""
+		Date strings and date objects give the same hash
+		"""
+		self.assertEqual(
+			content_hash("Task", {"subject": "T", "exp_start_date": "2025-03-01"}),
+			content_hash("Task", {"subject": "T", "exp_start_date": date(2025, 3, 1)})
+		)
+
+	def test_change_is_detected(self):
+		"""
+		Editing a synced field changes the hash
+		"""
+		event = {"subject": "Réunion", "starts_on": "2025-03-01 10:00:00"}
+		moved = dict(event, starts_on="2025-03-01 10:30:00")
+
+		self.assertNotEqual(content_hash("Event", event), content_hash("Event", moved))
+
+	def test_repeat_fields_only_for_series(self):
+		"""
+		Repeat fields change the hash of a series but not of a plain event
+		"""
+		event = {"subject": "Réunion", "starts_on": "2025-03-01 10:00:00"}
+		series = dict(event, repeat_this_event=1, repeat_on="Weekly", monday=1)
+
+		self.assertEqual(content_hash("Event", event), content_hash("Event", dict(event, repeat_this_event=0)))
+		self.assertNotEqual(content_hash("Event", series), content_hash("Event", dict(series, monday=0, friday=1)))
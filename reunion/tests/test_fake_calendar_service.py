@@ -0,0 +1,78 @@
+"""
+Unit tests for the fake Calendar service used by the pull benchmark
+"""
+
+import unittest
+from reunion.meeting_management.utils.google_client import EventPager, SeriesPager
+from reunion.tests.fake_calendar_service import RECURRING_EVERY, RECURRING_INSTANCES, FakeCalendarService
+
+
+class TestFakeCalendarService(unittest.TestCase):
+	"""
+	Test that the fake behaves like events.list for the pager
+	"""
+
+	def test_pages_cover_every_event(self):
+		"""
+		All generated events are served across pages, then a sync token
+		"""
+		service = FakeCalendarService(calendars=1, events=95)
+		pager = EventPager(service, "bench-0", 20, singleEvents=True)
+		events = list(pager)
+
+		self.assertEqual(len(events), 95)
+		self.assertEqual(len({event["id"] for event in events}), 95)
+		self.assertEqual(pager.pages_fetched, 5)
+		self.assertTrue(pager.next_sync_token)
+
+	def test_event_shapes(self):
+		"""
+		Recurring instances and all-day events are generated
+		"""
+		events = list(EventPager(FakeCalendarService(events=30), "bench-0", singleEvents=True))
+
+		self.assertEqual(len([e for e in events if "recurringEventId" in e]), 3 * RECURRING_INSTANCES)
+		self.assertTrue(any("date" in e["start"] for e in events))
+
+	def test_series_mode_returns_masters(self):
+		"""
+		Without singleEvents a series is a single event with a recurrence rule
+		"""
+		events = list(EventPager(FakeCalendarService(events=RECURRING_EVERY), "bench-0"))
+
+		self.assertEqual(len(events), RECURRING_EVERY - RECURRING_INSTANCES + 1)
+		self.assertIn("recurrence", events[0])
+
+	def test_incremental_returns_changes(self):
+		"""
+		A syncToken request only returns events modified since touch()
+		"""
+		service = FakeCalendarService(events=100, changes=10)
+
+		self.assertEqual(list(EventPager(service, "bench-0", syncToken="t")), [])
+		service.touch()
+		self.assertEqual(len(list(EventPager(service, "bench-0", syncToken="t"))), 10)
+
+	def test_unsupported_series_are_expanded(self):
+		"""
+		SeriesPager replaces unsupported masters by their instances and counts the calls
+		"""
+		service = FakeCalendarService(events=2 * RECURRING_EVERY)
+		pager = SeriesPager(EventPager(service, "bench-0", 3), lambda master: False)
+		events = list(pager)
+
+		# Instances of both series, each preceded by the cancellation of its master
+		self.assertEqual(len(events), 2 * RECURRING_EVERY + 2)
+		self.assertEqual(len([e for e in events if e["status"] == "cancelled"]), 2)
+		self.assertFalse(any("recurrence" in e for e in events))
+		self.assertEqual(pager.series_expanded, 2)
+		self.assertEqual(pager.pages_fetched, service.calls)
+
+	def test_supported_series_are_kept(self):
+		"""
+		Supported masters are served once
+		"""
+		pager = SeriesPager(EventPager(FakeCalendarService(events=RECURRING_EVERY), "bench-0"), lambda master: True)
+
+		self.assertEqual(len(list(pager)), RECURRING_EVERY - RECURRING_INSTANCES + 1)
+		self.assertEqual(pager.series_expanded, 0)
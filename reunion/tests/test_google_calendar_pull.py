@@ -0,0 +1,204 @@
+"""
+Unit tests for writing Google events into ERPNext (import and deletions)
+"""
+
+import frappe
+import unittest
+from unittest.mock import patch
+from reunion.meeting_management.api import google_calendar
+from reunion.meeting_management.api.google_calendar import (
+	DELETED_EVENTS_CANCEL,
+	DELETED_EVENTS_DELETE,
+	fetch_calendar_events,
+	get_events_to_push,
+	remove_cancelled_rows,
+	sync_event_to_erpnext,
+	sync_events_to_doctype
+)
+
+
+CALENDAR_ID = "test-pull@example.com"
+
+
+def google_event(event_id, **values):
+	"""
+	Google event as returned by events.list
+	"""
+	event = {
+		"id": event_id,
+		"etag": f'"{event_id}-1"',
+		"status": "confirmed",
+		"summary": "Réunion",
+		"description": "",
+		"start": {"dateTime": "2025-03-01T10:00:00Z"},
+		"end": {"dateTime": "2025-03-01T11:00:00Z"}
+	}
+	event.update(values)
+	return event
+
+
+class FakeRequest:
+	def __init__(self, result):
+		self.result = result
+
+	def execute(self):
+		return self.result
+
+
+class FakeService:
+	"""
+	Stand-in for the Calendar service: deleted events are only listed with showDeleted
+	"""
+
+	def __init__(self, events):
+		self.events_list = events
+		self.calls = []
+
+	def events(self):
+		return self
+
+	def list(self, **kwargs):
+		self.calls.append(kwargs)
+		items = [
+			event for event in self.events_list
+			if kwargs.get("showDeleted") or event.get("status") != "cancelled"
+		]
+		return FakeRequest({"items": items, "nextSyncToken": "token"})
+
+
+class TestGoogleCalendarPull(unittest.TestCase):
+	"""
+	Test the content hash stored when an event is imported
+	"""
+
+	def tearDown(self):
+		"""
+		Clean up after tests
+		"""
+		frappe.db.delete("Event", {"google_calendar_id": CALENDAR_ID})
+
+	def assertNotPushed(self, google_event_id):
+		"""
+		The stored row matches its hash: the next push skips it
+		"""
+		pending = [
+			event for event in get_events_to_push({"google_calendar_id": CALENDAR_ID})
+			if event.google_event_id == google_event_id
+		]
+
+		self.assertEqual(len(pending), 1)
+		self.assertEqual(pending[0].content_hash, pending[0].google_content_hash)
+
+	def test_sanitized_html_is_not_echoed(self):
+		"""
+		HTML cleaned by Frappe on save is hashed as stored
+		"""
+		sync_event_to_erpnext(google_event(
+			"pull-html",
+			summary="Point <b>équipe</b>",
+			description='<p onclick="alert(1)">Ordre du jour</p><script>alert(1)</script>'
+		), CALENDAR_ID)
+
+		self.assertNotPushed("pull-html")
+
+	def test_zero_duration_is_not_echoed(self):
+		"""
+		An event without duration (ends_on emptied by Event.validate) is hashed as stored
+		"""
+		sync_event_to_erpnext(google_event(
+			"pull-zero",
+			end={"dateTime": "2025-03-01T10:00:00Z"}
+		), CALENDAR_ID)
+
+		self.assertNotPushed("pull-zero")
+
+	def test_update_keeps_hash_in_sync(self):
+		"""
+		Re-importing a changed event refreshes the hash of the saved row
+		"""
+		sync_event_to_erpnext(google_event("pull-update"), CALENDAR_ID)
+		existing = frappe.db.get_value("Event", {"google_event_id": "pull-update"})
+
+		sync_event_to_erpnext(google_event("pull-update", description="<p>Nouveau</p><script></script>"),
+			CALENDAR_ID, existing)
+
+		self.assertNotPushed("pull-update")
+
+	def test_full_read_applies_deletions(self):
+		"""
+		A full read (daily pass or expired syncToken) removes the events deleted in Google
+		"""
+		sync_event_to_erpnext(google_event("pull-kept"), CALENDAR_ID)
+		sync_event_to_erpnext(google_event("pull-deleted"), CALENDAR_ID)
+
+		service = FakeService([
+			google_event("pull-kept"),
+			{"id": "pull-deleted", "status": "cancelled"}
+		])
+		pager = fetch_calendar_events(service, CALENDAR_ID, None, "2025-02-01T00:00:00Z", "2025-04-01T00:00:00Z")
+		counts = sync_events_to_doctype(pager, frappe._dict(calendar_id=CALENDAR_ID, sync_to_doctype="Event"))
+
+		self.assertTrue(service.calls[0]["showDeleted"])
+		self.assertEqual(counts.deleted, 1)
+		self.assertEqual(pager.next_sync_token, "token")
+		self.assertTrue(frappe.db.exists("Event", {"google_event_id": "pull-kept"}))
+		# Deleted or cancelled depending on Google Calendar Settings.deleted_events_action
+		self.assertIn(frappe.db.get_value("Event", {"google_event_id": "pull-deleted"}, "status"), (None, "Cancelled"))
+
+
+class TestRemoveCancelledRows(unittest.TestCase):
+	"""
+	Test the chunked removal of events deleted in Google
+	"""
+
+	def setUp(self):
+		"""
+		Three imported Events, removed two per query
+		"""
+		for index in range(3):
+			sync_event_to_erpnext(google_event(f"pull-removed-{index}"), CALENDAR_ID)
+
+		self.names = frappe.get_all("Event", filters={"google_calendar_id": CALENDAR_ID}, pluck="name")
+
+		chunk_size = patch.object(google_calendar, "DELETE_CHUNK_SIZE", 2)
+		chunk_size.start()
+		self.addCleanup(chunk_size.stop)
+
+	def tearDown(self):
+		"""
+		Clean up after tests
+		"""
+		frappe.db.delete("Comment", {"reference_doctype": "Event", "reference_name": ["in", self.names]})
+		frappe.db.delete("Event", {"google_calendar_id": CALENDAR_ID})
+
+	def test_delete_removes_rows_and_linked_documents(self):
+		"""
+		Every chunk is deleted with the comments of its Events
+		"""
+		frappe.get_doc("Event", self.names[0]).add_comment("Comment", "Note")
+
+		self.assertEqual(remove_cancelled_rows("Event", self.names, DELETED_EVENTS_DELETE), 3)
+		self.assertFalse(frappe.db.exists("Event", {"google_calendar_id": CALENDAR_ID}))
+		self.assertFalse(frappe.db.exists("Comment", {"reference_doctype": "Event", "reference_name": self.names[0]}))
+
+	def test_cancel_keeps_rows(self):
+		"""
+		Cancelling sets the status of every chunk
+		"""
+		self.assertEqual(remove_cancelled_rows("Event", self.names, DELETED_EVENTS_CANCEL), 3)
+		self.assertEqual(
+			set(frappe.get_all("Event", filters={"google_calendar_id": CALENDAR_ID}, pluck="status")),
+			{"Cancelled"}
+		)
+
+	def test_tasks_are_never_deleted(self):
+		"""
+		Tasks are cancelled even when the action is to delete
+		"""
+		task = frappe.get_doc({"doctype": "Task", "subject": "Tâche Google", "google_calendar_id": CALENDAR_ID})
+		task.insert(ignore_permissions=True)
+		self.addCleanup(frappe.db.delete, "Task", {"name": task.name})
+
+		remove_cancelled_rows("Task", [task.name], DELETED_EVENTS_DELETE)
+
+		self.assertEqual(frappe.db.get_value("Task", task.name, "status"), "Cancelled")
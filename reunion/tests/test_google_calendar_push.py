@@ -0,0 +1,86 @@
+"""
+Unit tests for pushing modified Events to Google Calendar
+"""
+
+import frappe
+import unittest
+from reunion.meeting_management.api.google_calendar import push_calendar_to_google, sync_event_to_erpnext
+from reunion.tests.fake_calendar_service import FakeCalendarService
+from reunion.tests.test_google_calendar_pull import google_event
+
+
+CALENDAR_ID = "test-push@example.com"
+
+
+class RecordingService(FakeCalendarService):
+	"""
+	Fake service remembering the events sent with events.update
+	"""
+
+	def __init__(self):
+		super().__init__(calendars=1, events=0)
+		self.updated = []
+
+	def update(self, calendarId, eventId, body, **kwargs):
+		self.updated.append(eventId)
+		return super().update(calendarId, eventId, body, **kwargs)
+
+
+class TestGoogleCalendarPush(unittest.TestCase):
+	"""
+	Test the push watermark and the content hash check
+	"""
+
+	def setUp(self):
+		"""
+		Two imported Events, one of them then edited in ERPNext
+		"""
+		for event_id in ("push-edited", "push-untouched"):
+			sync_event_to_erpnext(google_event(event_id), CALENDAR_ID)
+
+		edited = frappe.get_doc("Event", {"google_event_id": "push-edited"})
+		edited.subject = "Réunion déplacée"
+		edited.save(ignore_permissions=True)
+
+		# Row not stored: update_calendar_config only changes it in memory
+		self.cal_config = frappe._dict(
+			doctype="Google Calendar Sync Config",
+			name="test-push-config",
+			calendar_id=CALENDAR_ID,
+			last_push_watermark=None
+		)
+
+	def tearDown(self):
+		"""
+		Clean up after tests
+		"""
+		frappe.db.delete("Event", {"google_calendar_id": CALENDAR_ID})
+		frappe.db.commit()
+
+	def test_only_changed_events_are_pushed(self):
+		"""
+		Events whose hash matches the last exchange with Google are skipped
+		"""
+		service = RecordingService()
+
+		self.assertEqual(push_calendar_to_google(service, self.cal_config), 1)
+		self.assertEqual(service.updated, ["push-edited"])
+
+		edited = frappe.db.get_value("Event", {"google_event_id": "push-edited"},
+			["google_last_origin", "google_etag"], as_dict=True)
+		self.assertEqual(edited.google_last_origin, "ERPNext")
+		self.assertTrue(edited.google_etag.endswith('-updated"'))
+
+	def test_watermark_advances(self):
+		"""
+		The watermark moves to the last modified Event, the next push reads nothing older
+		"""
+		push_calendar_to_google(RecordingService(), self.cal_config)
+
+		latest = frappe.get_all("Event", filters={"google_calendar_id": CALENDAR_ID},
+			pluck="modified", order_by="modified desc", limit=1)[0]
+		self.assertEqual(self.cal_config.last_push_watermark, latest)
+
+		service = RecordingService()
+		self.assertEqual(push_calendar_to_google(service, self.cal_config), 0)
+		self.assertEqual(service.updated, [])
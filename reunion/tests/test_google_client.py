@@ -0,0 +1,279 @@
+"""
+Unit tests for the Google Calendar client helpers
+"""
+
+import json
+import unittest
+from unittest.mock import patch
+from httplib2 import Response
+from googleapiclient.errors import HttpError
+from concurrent.futures import ThreadPoolExecutor
+from google.oauth2.credentials import Credentials
+from reunion.meeting_management.utils.google_client import (
+	EVENT_LIST_FIELDS,
+	EventPager,
+	MAX_PAGE_SIZE,
+	SeriesPager,
+	execute_batch,
+	get_calendar_service,
+	get_discovery_document
+)
+
+
+class FakeRequest:
+	def __init__(self, result):
+		self.result = result
+
+	def execute(self):
+		return self.result
+
+
+class FlakyRequest:
+	"""
+	Request rejected for rate limiting before succeeding
+	"""
+
+	def __init__(self, result, failures=1):
+		self.failures = failures
+		self._result = result
+
+	@property
+	def result(self):
+		if self.failures:
+			self.failures -= 1
+			content = json.dumps({"error": {"errors": [{"reason": "rateLimitExceeded"}]}}).encode()
+			return HttpError(Response({"status": 403}), content)
+		return self._result
+
+
+class FakeEventsResource:
+	"""
+	Stand-in for service.events() returning pre-built pages
+	"""
+
+	def __init__(self, pages):
+		self.pages = pages
+		self.calls = []
+
+	def list(self, **kwargs):
+		self.calls.append(kwargs)
+		index = int(kwargs.get("pageToken") or 0)
+		return FakeRequest(self.pages[index])
+
+
+class FakeBatch:
+	"""
+	Stand-in for BatchHttpRequest calling back with each request outcome
+	"""
+
+	def __init__(self, callback):
+		self.callback = callback
+		self.requests = []
+
+	def add(self, request, request_id=None):
+		self.requests.append((request_id, request))
+
+	def execute(self):
+		for request_id, request in self.requests:
+			result = request.result
+			if isinstance(result, Exception):
+				self.callback(request_id, None, result)
+			else:
+				self.callback(request_id, result, None)
+
+
+class FakeService:
+	def __init__(self, pages):
+		self.events_resource = FakeEventsResource(pages)
+
+	def events(self):
+		return self.events_resource
+
+	def new_batch_http_request(self, callback=None):
+		return FakeBatch(callback)
+
+
+class TestEventPager(unittest.TestCase):
+	"""
+	Test pagination of events.list
+	"""
+
+	def test_walks_every_page(self):
+		"""
+		All pages are read and the sync token comes from the last one
+		"""
+		service = FakeService([
+			{"items": [{"id": "a"}, {"id": "b"}], "nextPageToken": "1"},
+			{"items": [{"id": "c"}], "nextPageToken": "2"},
+			{"items": [{"id": "d"}], "nextSyncToken": "token"},
+		])
+		pager = EventPager(service, "primary", 2, singleEvents=True)
+
+		self.assertEqual([e["id"] for e in pager], ["a", "b", "c", "d"])
+		self.assertEqual(pager.next_sync_token, "token")
+		self.assertEqual(pager.pages_fetched, 3)
+		self.assertGreaterEqual(pager.api_time, 0)
+		self.assertEqual(service.events_resource.calls[0]["maxResults"], 2)
+		self.assertTrue(service.events_resource.calls[0]["singleEvents"])
+
+	def test_start_fetches_first_page_once(self):
+		"""
+		start() prefetches the first page without requesting it twice
+		"""
+		service = FakeService([{"items": [{"id": "a"}], "nextSyncToken": "token"}])
+		pager = EventPager(service, "primary").start()
+
+		self.assertEqual(len(service.events_resource.calls), 1)
+		self.assertEqual([e["id"] for e in pager], ["a"])
+		self.assertEqual(len(service.events_resource.calls), 1)
+
+	def test_requests_partial_response(self):
+		"""
+		Only the fields read by the sync are requested, unless fields is given
+		"""
+		service = FakeService([{"items": [], "nextSyncToken": "token"}] * 2)
+		list(EventPager(service, "primary"))
+		list(EventPager(service, "primary", fields="items(id)"))
+
+		self.assertEqual(service.events_resource.calls[0]["fields"], EVENT_LIST_FIELDS)
+		self.assertIn("nextSyncToken", EVENT_LIST_FIELDS)
+		self.assertEqual(service.events_resource.calls[1]["fields"], "items(id)")
+
+	def test_page_size_is_clamped(self):
+		"""
+		Page size never exceeds the API maximum
+		"""
+		pager = EventPager(FakeService([]), "primary", 100000)
+		self.assertEqual(pager.page_size, MAX_PAGE_SIZE)
+
+
+class FakeSeriesService(FakeService):
+	"""
+	Stand-in for a calendar read without singleEvents, with the instances of each series
+	"""
+
+	def __init__(self, pages, instances):
+		super().__init__(pages)
+		self.events_resource.instances = lambda eventId, **kwargs: FakeRequest({"items": instances[eventId]})
+
+
+def series_master(event_id, rule="RRULE:FREQ=WEEKLY"):
+	return {"id": event_id, "status": "confirmed", "recurrence": [rule]}
+
+
+def series_instance(series_id, day, status="confirmed"):
+	return {"id": f"{series_id}_202503{day:02d}", "status": status, "recurringEventId": series_id}
+
+
+class TestSeriesPager(unittest.TestCase):
+	"""
+	Test which series are stored once and which are replaced by their instances
+	"""
+
+	def read(self, pages, instances):
+		pager = SeriesPager(
+			EventPager(FakeSeriesService(pages, instances), "primary"),
+			lambda master: master["recurrence"] == ["RRULE:FREQ=WEEKLY"]
+		)
+		return pager, [(event["id"], event["status"]) for event in pager]
+
+	def test_unsupported_master_is_cancelled(self):
+		"""
+		An expanded master is cancelled so that a previously stored series row is removed
+		"""
+		pager, events = self.read(
+			[{"items": [series_master("a", "RRULE:FREQ=WEEKLY;INTERVAL=2")], "nextSyncToken": "token"}],
+			{"a": [series_instance("a", 3), series_instance("a", 17)]}
+		)
+
+		self.assertEqual(events, [("a", "cancelled"), ("a_20250303", "confirmed"), ("a_20250317", "confirmed")])
+		self.assertEqual(pager.series_expanded, 1)
+
+	def test_exceptions_expand_their_series(self):
+		"""
+		A series with a moved or deleted occurrence is expanded once, wherever the exceptions are listed
+		"""
+		instances = {"a": [series_instance("a", 3), series_instance("a", 10, "cancelled"), series_instance("a", 17)]}
+		pager, events = self.read([
+			{"items": [series_master("a"), series_master("b")], "nextPageToken": "1"},
+			{"items": [series_instance("a", 10, "cancelled"), series_instance("a", 17)], "nextSyncToken": "token"}
+		], instances)
+
+		self.assertEqual(events, [
+			("a", "confirmed"),
+			("b", "confirmed"),
+			("a", "cancelled"),
+			("a_20250303", "confirmed"),
+			("a_20250310", "cancelled"),
+			("a_20250317", "confirmed")
+		])
+		self.assertEqual(pager.series_expanded, 1)
+
+	def test_master_after_its_exception_is_skipped(self):
+		"""
+		A master listed after one of its exceptions is not stored as a series again
+		"""
+		pager, events = self.read(
+			[{"items": [series_instance("a", 10, "cancelled"), series_master("a")], "nextSyncToken": "token"}],
+			{"a": [series_instance("a", 3)]}
+		)
+
+		self.assertEqual(events, [("a", "cancelled"), ("a_20250303", "confirmed")])
+
+
+class TestCalendarService(unittest.TestCase):
+	"""
+	Test the per-thread Calendar API clients
+	"""
+
+	def test_discovery_document_is_parsed_once(self):
+		"""
+		Every thread builds its client from the same document, left unchanged by API calls
+		"""
+		document = get_discovery_document()
+		snapshot = json.dumps(document, sort_keys=True)
+
+		def build(_index):
+			service = get_calendar_service(Credentials("token"))
+			service.events().list(calendarId="primary")
+			return get_discovery_document()
+
+		with ThreadPoolExecutor(max_workers=4) as executor:
+			documents = list(executor.map(build, range(8)))
+
+		self.assertTrue(all(shared is document for shared in documents))
+		self.assertEqual(json.dumps(document, sort_keys=True), snapshot)
+
+
+class TestExecuteBatch(unittest.TestCase):
+	"""
+	Test mapping of batch sub-responses
+	"""
+
+	def test_maps_responses_to_request_ids(self):
+		"""
+		Each sub-response is returned under its request id
+		"""
+		error = ValueError("boom")
+		results = execute_batch(FakeService([]), [
+			("EV-1", FakeRequest({"id": "a"})),
+			("EV-2", FakeRequest(error)),
+		])
+
+		self.assertEqual(results["EV-1"], ({"id": "a"}, None))
+		self.assertEqual(results["EV-2"], (None, error))
+
+	@patch("reunion.meeting_management.utils.google_client.time.sleep")
+	def test_rate_limited_requests_are_retried(self, sleep):
+		"""
+		Sub-requests rejected for rate limiting are sent again in a new batch
+		"""
+		flaky = FlakyRequest({"id": "b"})
+		results = execute_batch(FakeService([]), [
+			("EV-1", FakeRequest({"id": "a"})),
+			("EV-2", flaky),
+		])
+
+		self.assertEqual(results["EV-1"], ({"id": "a"}, None))
+		self.assertEqual(results["EV-2"], ({"id": "b"}, None))
+		self.assertEqual(sleep.call_count, 1)
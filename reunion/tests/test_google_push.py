@@ -0,0 +1,98 @@
+"""
+Unit tests for Google Calendar push notifications
+"""
+
+import frappe
+import unittest
+from unittest.mock import patch
+from reunion.meeting_management.api.google_push import (
+	clear_pending_notification,
+	handle_notification,
+	has_pending_notification,
+	sync_notified_calendar
+)
+
+
+def post_notification(channel_id="channel-1", token="secret", state="exists"):
+	"""
+	Local stand-in for Google: delivers the headers of a push notification
+	"""
+	return handle_notification({
+		"X-Goog-Channel-ID": channel_id,
+		"X-Goog-Channel-Token": token,
+		"X-Goog-Resource-State": state,
+		"X-Goog-Resource-ID": "resource-1",
+	})
+
+
+class TestGooglePush(unittest.TestCase):
+	"""
+	Test the push notification webhook
+	"""
+
+	def setUp(self):
+		"""
+		Stub the channel lookup with a known calendar
+		"""
+		config = frappe._dict(calendar_id="team@example.com", channel_token="secret", enabled=1)
+		lookup = patch("frappe.db.get_value", side_effect=lambda *args, **kwargs: (
+			config if args[1] == {"channel_id": "channel-1"} else None
+		))
+		lookup.start()
+		self.addCleanup(lookup.stop)
+
+		enqueue = patch("frappe.enqueue")
+		self.enqueue = enqueue.start()
+		self.addCleanup(enqueue.stop)
+
+		clear_pending_notification("team@example.com")
+		self.addCleanup(clear_pending_notification, "team@example.com")
+		self.addCleanup(frappe.set_user, frappe.session.user)
+
+	def test_change_enqueues_calendar_sync(self):
+		"""
+		A change notification enqueues a deduplicated sync of that calendar only
+		"""
+		self.assertTrue(post_notification())
+
+		self.enqueue.assert_called_once()
+		kwargs = self.enqueue.call_args.kwargs
+		self.assertEqual(kwargs["calendar_id"], "team@example.com")
+		self.assertTrue(kwargs["deduplicate"])
+
+	def test_sync_handshake_is_ignored(self):
+		"""
+		The initial "sync" message does not trigger a sync
+		"""
+		self.assertTrue(post_notification(state="sync"))
+		self.enqueue.assert_not_called()
+
+	def test_wrong_token_is_rejected(self):
+		"""
+		Notifications with an unknown channel or token are refused
+		"""
+		self.assertFalse(post_notification(token="forged"))
+		self.assertFalse(post_notification(channel_id="unknown"))
+		self.enqueue.assert_not_called()
+
+	def test_notification_during_sync_runs_it_again(self):
+		"""
+		A notification received while the calendar is being imported is not lost
+		"""
+		self.assertTrue(post_notification())
+		self.assertTrue(has_pending_notification("team@example.com"))
+
+		passes = []
+
+		def sync(calendar_id):
+			passes.append(calendar_id)
+			# Change notified after the first pass has read its delta
+			if len(passes) == 1:
+				post_notification()
+			return {"success": True}
+
+		with patch("reunion.meeting_management.api.google_calendar.sync_from_google", side_effect=sync):
+			sync_notified_calendar("team@example.com")
+
+		self.assertEqual(passes, ["team@example.com"] * 2)
+		self.assertFalse(has_pending_notification("team@example.com"))
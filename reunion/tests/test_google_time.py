@@ -0,0 +1,96 @@
+"""
+Unit tests for the Google <-> ERPNext datetime conversions
+"""
+
+import unittest
+from datetime import date, datetime
+from reunion.meeting_management.utils.google_time import (
+	erpnext_to_google,
+	google_date_to_erpnext,
+	google_to_erpnext,
+	parse_google_datetime
+)
+
+
+SITE_TZ = "Europe/Paris"
+
+
+class TestGoogleToErpnext(unittest.TestCase):
+	"""
+	Test pulled dates
+	"""
+
+	def test_offset_is_converted_to_site_timezone(self):
+		"""
+		A UTC time is stored as the site wall time instead of dropping the offset
+		"""
+		starts_on, ends_on, all_day = google_to_erpnext(
+			{"dateTime": "2025-03-01T09:00:00Z"},
+			{"dateTime": "2025-03-01T10:30:00.000Z"},
+			SITE_TZ
+		)
+
+		self.assertEqual(starts_on, datetime(2025, 3, 1, 10, 0))
+		self.assertEqual(ends_on, datetime(2025, 3, 1, 11, 30))
+		self.assertEqual(all_day, 0)
+
+	def test_time_zone_field_without_offset(self):
+		"""
+		start.timeZone applies when the dateTime has no offset
+		"""
+		self.assertEqual(
+			parse_google_datetime("2025-07-01T10:00:00", "America/New_York").utcoffset().total_seconds(),
+			-4 * 3600
+		)
+
+	def test_all_day_end_is_exclusive(self):
+		"""
+		A one-day Google event ends the same day in ERPNext
+		"""
+		starts_on, ends_on, all_day = google_to_erpnext({"date": "2025-03-01"}, {"date": "2025-03-02"}, SITE_TZ)
+
+		self.assertEqual(starts_on, datetime(2025, 3, 1))
+		self.assertEqual(ends_on, datetime(2025, 3, 1, 23, 59, 59))
+		self.assertEqual(all_day, 1)
+
+	def test_task_dates(self):
+		"""
+		Task dates use the site day and the last day of an all-day event
+		"""
+		self.assertEqual(google_date_to_erpnext({"dateTime": "2025-03-01T23:30:00Z"}, SITE_TZ), date(2025, 3, 2))
+		self.assertEqual(google_date_to_erpnext({"date": "2025-03-03"}, SITE_TZ, end=True), date(2025, 3, 2))
+
+
+class TestErpnextToGoogle(unittest.TestCase):
+	"""
+	Test pushed dates
+	"""
+
+	def test_site_time_keeps_its_offset(self):
+		"""
+		Site wall time is sent with its offset and time zone
+		"""
+		start, end = erpnext_to_google("2025-07-01 10:00:00", datetime(2025, 7, 1, 11, 0), 0, SITE_TZ)
+
+		self.assertEqual(start, {"dateTime": "2025-07-01T10:00:00+02:00", "timeZone": SITE_TZ})
+		self.assertEqual(end["dateTime"], "2025-07-01T11:00:00+02:00")
+
+	def test_all_day_end_is_next_day(self):
+		"""
+		The last day of an all-day Event becomes Google's exclusive end
+		"""
+		start, end = erpnext_to_google("2025-03-01 00:00:00", "2025-03-01 23:59:59", 1, SITE_TZ)
+
+		self.assertEqual(start, {"date": "2025-03-01"})
+		self.assertEqual(end, {"date": "2025-03-02"})
+
+	def test_round_trip_is_stable(self):
+		"""
+		Pulling what was pushed gives back the same values
+		"""
+		for values in (
+			(datetime(2025, 10, 26, 1, 30), datetime(2025, 10, 26, 4, 0), 0),
+			(datetime(2025, 3, 1), datetime(2025, 3, 3, 23, 59, 59), 1)
+		):
+			start, end = erpnext_to_google(*values, SITE_TZ)
+			self.assertEqual(google_to_erpnext(start, end, SITE_TZ), values)
@@ -0,0 +1,120 @@
+"""
+Unit tests for the rate-limit aware Google request executor
+"""
+
+import json
+import unittest
+from unittest.mock import patch
+from httplib2 import Response
+from googleapiclient.errors import HttpError
+from reunion.meeting_management.utils.rate_limit import (
+	BACKOFF_MAX,
+	call_with_backoff,
+	is_retryable,
+	retry_delay
+)
+
+
+def http_error(status, reason=None, retry_after=None):
+	headers = {"status": status}
+	if retry_after:
+		headers["retry-after"] = retry_after
+
+	content = json.dumps({"error": {"errors": [{"reason": reason}]}}).encode()
+	return HttpError(Response(headers), content)
+
+
+class TestRetryPolicy(unittest.TestCase):
+	"""
+	Test which Google errors are retried and how long to wait
+	"""
+
+	def test_retryable_errors(self):
+		"""
+		Quota and transient server errors are retried, other errors are not
+		"""
+		self.assertTrue(is_retryable(http_error(429)))
+		self.assertTrue(is_retryable(http_error(503)))
+		self.assertTrue(is_retryable(http_error(403, "rateLimitExceeded")))
+		self.assertTrue(is_retryable(http_error(403, "userRateLimitExceeded")))
+		self.assertFalse(is_retryable(http_error(403, "forbidden")))
+		self.assertFalse(is_retryable(http_error(410)))
+		self.assertFalse(is_retryable(None))
+
+	def test_retry_after_is_honoured(self):
+		"""
+		Retry-After wins over exponential backoff
+		"""
+		self.assertEqual(retry_delay(http_error(429, retry_after="3"), 0), 3)
+
+	def test_backoff_is_bounded(self):
+		"""
+		Exponential backoff never exceeds the maximum delay
+		"""
+		for attempt in range(12):
+			delay = retry_delay(http_error(503), attempt)
+			self.assertGreaterEqual(delay, 0)
+			self.assertLessEqual(delay, BACKOFF_MAX)
+
+
+class TestCallWithBackoff(unittest.TestCase):
+	"""
+	Test retries around a Google call
+	"""
+
+	@patch("reunion.meeting_management.utils.rate_limit.time.sleep")
+	def test_retries_until_success(self, sleep):
+		"""
+		A rate-limited call is retried and its result returned
+		"""
+		outcomes = [http_error(429), http_error(403, "rateLimitExceeded"), {"id": "a"}]
+
+		def call():
+			outcome = outcomes.pop(0)
+			if isinstance(outcome, Exception):
+				raise outcome
+			return outcome
+
+		self.assertEqual(call_with_backoff(call), {"id": "a"})
+		self.assertEqual(sleep.call_count, 2)
+
+	@patch("reunion.meeting_management.utils.rate_limit.time.sleep")
+	def test_gives_up_after_max_retries(self, sleep):
+		"""
+		The last error is raised once retries are exhausted
+		"""
+		def call():
+			raise http_error(503)
+
+		with self.assertRaises(HttpError):
+			call_with_backoff(call, max_retries=2)
+
+		self.assertEqual(sleep.call_count, 2)
+
+	@patch("reunion.meeting_management.utils.rate_limit.time.sleep")
+	def test_non_retryable_error_is_raised(self, sleep):
+		"""
+		Errors other than quota or server errors are not retried
+		"""
+		def call():
+			raise http_error(404)
+
+		with self.assertRaises(HttpError):
+			call_with_backoff(call)
+
+		sleep.assert_not_called()
+
+	def test_bucket_is_charged_per_attempt(self):
+		"""
+		Every attempt reserves tokens from the shared bucket
+		"""
+		class Bucket:
+			costs = []
+
+			def acquire(self, cost=1):
+				self.costs.append(cost)
+
+		bucket = Bucket()
+		call_with_backoff(lambda: "ok", bucket, cost=50)
+
+		self.assertEqual(bucket.costs, [50])
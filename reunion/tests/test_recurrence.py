@@ -0,0 +1,104 @@
+"""
+Unit tests for RRULE <-> Event repeat fields mapping
+"""
+
+import unittest
+from datetime import date
+from reunion.meeting_management.utils.recurrence import repeat_fields_from_google, rrule_from_repeat_fields
+
+
+SITE_TZ = "Europe/Paris"
+
+
+def master(rule, start="2025-03-03T09:00:00+01:00", tz_name=None):
+	event = {"recurrence": [rule], "start": {"dateTime": start}}
+	if tz_name:
+		event["start"]["timeZone"] = tz_name
+	return event
+
+
+class TestRecurrence(unittest.TestCase):
+	"""
+	Test which Google recurrences map to ERPNext repeat fields
+	"""
+
+	def test_weekly_with_days(self):
+		"""
+		BYDAY becomes weekday checkboxes, UNTIL becomes repeat_till
+		"""
+		fields = repeat_fields_from_google(master("RRULE:FREQ=WEEKLY;BYDAY=MO,TH;UNTIL=20250630T220000Z"), SITE_TZ)
+
+		self.assertEqual(fields["repeat_on"], "Weekly")
+		self.assertEqual(fields["monday"], 1)
+		self.assertEqual(fields["thursday"], 1)
+		self.assertEqual(fields["friday"], 0)
+		self.assertEqual(fields["repeat_till"], date(2025, 6, 30))
+
+	def test_count_becomes_end_date(self):
+		"""
+		COUNT is converted to the date of the last occurrence
+		"""
+		fields = repeat_fields_from_google(master("RRULE:FREQ=DAILY;COUNT=5"), SITE_TZ)
+
+		self.assertEqual(fields["repeat_on"], "Daily")
+		self.assertEqual(fields["repeat_till"], date(2025, 3, 7))
+
+	def test_weekly_defaults_to_start_day(self):
+		"""
+		A weekly rule without BYDAY repeats on the weekday of the first occurrence
+		"""
+		fields = repeat_fields_from_google(master("RRULE:FREQ=WEEKLY"), SITE_TZ)
+		self.assertEqual(fields["monday"], 1)
+
+	def test_weekdays_follow_site_timezone(self):
+		"""
+		A Monday evening in New York repeats on Tuesday once stored in Paris time
+		"""
+		for rule in ("RRULE:FREQ=WEEKLY", "RRULE:FREQ=WEEKLY;BYDAY=MO,SU"):
+			fields = repeat_fields_from_google(
+				master(rule, "2025-03-03T23:00:00-05:00", "America/New_York"), SITE_TZ
+			)
+
+			self.assertEqual(fields["monday"], 1 if "SU" in rule else 0, rule)
+			self.assertEqual(fields["tuesday"], 1, rule)
+			self.assertEqual(fields["sunday"], 0, rule)
+
+	def test_rule_day_uses_event_timezone(self):
+		"""
+		The default weekday comes from the event time zone, not from the UTC offset sent
+		"""
+		fields = repeat_fields_from_google(
+			master("RRULE:FREQ=WEEKLY", "2025-03-04T04:00:00Z", "America/New_York"), "America/New_York"
+		)
+
+		self.assertEqual(fields["monday"], 1)
+		self.assertEqual(fields["tuesday"], 0)
+
+	def test_unsupported_rules(self):
+		"""
+		Rules ERPNext cannot express fall back to instances
+		"""
+		for rule in (
+			"RRULE:FREQ=WEEKLY;INTERVAL=2",
+			"RRULE:FREQ=MONTHLY;BYDAY=1MO",
+			"RRULE:FREQ=MONTHLY;BYMONTHDAY=15",
+			"RRULE:FREQ=DAILY;BYMONTH=3",
+			"RRULE:FREQ=MONTHLY;BYSETPOS=-1;BYDAY=MO,TU,WE,TH,FR",
+			"EXDATE:20250310T090000",
+		):
+			self.assertIsNone(repeat_fields_from_google(master(rule), SITE_TZ), rule)
+
+	def test_not_recurring(self):
+		"""
+		A plain event clears the repeat flag
+		"""
+		self.assertEqual(repeat_fields_from_google({"start": {"date": "2025-03-03"}}), {"repeat_this_event": 0})
+
+	def test_round_trip(self):
+		"""
+		Repeat fields are turned back into an equivalent rule
+		"""
+		fields = repeat_fields_from_google(master("RRULE:FREQ=WEEKLY;BYDAY=MO,TH;UNTIL=20250630T220000Z"), SITE_TZ)
+
+		self.assertEqual(rrule_from_repeat_fields(fields), ["RRULE:FREQ=WEEKLY;BYDAY=MO,TH;UNTIL=20250630T235959Z"])
+		self.assertIsNone(rrule_from_repeat_fields({"repeat_this_event": 0}))
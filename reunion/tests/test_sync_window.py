@@ -0,0 +1,91 @@
+"""
+Unit tests for the sync window and history backfill chunks
+"""
+
+import unittest
+from datetime import date, datetime
+from reunion.meeting_management.utils.sync_window import (
+	DEFAULT_DAYS_FUTURE,
+	DEFAULT_DAYS_PAST,
+	needs_full_resync,
+	next_backfill_chunk,
+	sync_window,
+	to_google_time
+)
+
+
+NOW = datetime(2025, 6, 15, 12, 0)
+
+
+class TestSyncWindow(unittest.TestCase):
+	"""
+	Test the per-calendar window
+	"""
+
+	def test_defaults(self):
+		"""
+		Unset fields fall back to the historical 30/60 days window
+		"""
+		time_min, time_max = sync_window(None, None, NOW)
+
+		self.assertEqual((NOW - time_min).days, DEFAULT_DAYS_PAST)
+		self.assertEqual((time_max - NOW).days, DEFAULT_DAYS_FUTURE)
+
+	def test_zero_is_kept(self):
+		"""
+		A zero window only reads from now on
+		"""
+		time_min, time_max = sync_window(0, 7, NOW)
+
+		self.assertEqual(time_min, NOW)
+		self.assertEqual((time_max - NOW).days, 7)
+
+	def test_google_time(self):
+		"""
+		Dates and datetimes are sent as UTC RFC 3339
+		"""
+		self.assertEqual(to_google_time(NOW), "2025-06-15T12:00:00Z")
+		self.assertEqual(to_google_time(date(2025, 6, 1)), "2025-06-01T00:00:00Z")
+
+	def test_full_resync_once_a_day(self):
+		"""
+		The window is read again in full once a day, and when never read
+		"""
+		self.assertTrue(needs_full_resync(None, NOW))
+		self.assertFalse(needs_full_resync(datetime(2025, 6, 15, 0, 0), NOW))
+		self.assertTrue(needs_full_resync("2025-06-14 11:00:00", NOW))
+
+
+class TestBackfillChunks(unittest.TestCase):
+	"""
+	Test month-sized chunks walking back in time
+	"""
+
+	def test_first_chunk_ends_at_window(self):
+		"""
+		Without a cursor the first chunk ends where the window starts
+		"""
+		self.assertEqual(
+			next_backfill_chunk("2025-01-01", None, NOW),
+			(date(2025, 5, 15), date(2025, 6, 15))
+		)
+
+	def test_resumes_from_cursor(self):
+		"""
+		The next chunk ends at the start of the last imported one
+		"""
+		self.assertEqual(
+			next_backfill_chunk(date(2025, 1, 1), "2025-05-15", NOW),
+			(date(2025, 4, 15), date(2025, 5, 15))
+		)
+
+	def test_last_chunk_is_clamped(self):
+		"""
+		The oldest chunk stops at backfill_until, then the backfill is over
+		"""
+		self.assertEqual(
+			next_backfill_chunk(date(2025, 5, 1), date(2025, 5, 15), NOW),
+			(date(2025, 5, 1), date(2025, 5, 15))
+		)
+		self.assertIsNone(next_backfill_chunk(date(2025, 5, 1), date(2025, 5, 1), NOW))
+		self.assertIsNone(next_backfill_chunk(None, None, NOW))
@@ -0,0 +1,76 @@
+"""
+Unit tests for batched sync transactions
+"""
+
+import frappe
+import unittest
+from reunion.meeting_management.utils.transaction import TransactionBatch
+
+
+SUBJECT = "Test TransactionBatch"
+
+
+def insert_event(suffix):
+	frappe.get_doc({
+		"doctype": "Event",
+		"subject": f"{SUBJECT} {suffix}",
+		"starts_on": "2025-03-01 10:00:00",
+		"event_type": "Public"
+	}).insert(ignore_permissions=True)
+
+
+class TestTransactionBatch(unittest.TestCase):
+	"""
+	Test that a failing item only rolls back its own savepoint
+	"""
+
+	def tearDown(self):
+		"""
+		Clean up after tests
+		"""
+		frappe.db.rollback()
+		frappe.db.delete("Event", {"subject": ["like", f"{SUBJECT}%"]})
+		frappe.db.commit()
+
+	def get_subjects(self):
+		return sorted(frappe.get_all("Event", filters={"subject": ["like", f"{SUBJECT}%"]}, pluck="subject"))
+
+	def test_failing_item_keeps_the_others(self):
+		"""
+		Items before and after a failure are committed, the failed insert is not
+		"""
+		batch = TransactionBatch(10)
+
+		with batch.item():
+			insert_event("A")
+
+		with self.assertRaises(RuntimeError):
+			with batch.item():
+				insert_event("B")
+				raise RuntimeError("boom")
+
+		with batch.item():
+			insert_event("C")
+
+		batch.commit()
+		# Anything left uncommitted is discarded here
+		frappe.db.rollback()
+
+		self.assertEqual(self.get_subjects(), [f"{SUBJECT} A", f"{SUBJECT} C"])
+		self.assertEqual(batch.commits, 1)
+
+	def test_commits_every_batch_size_items(self):
+		"""
+		A commit is issued each time batch_size items succeed
+		"""
+		batch = TransactionBatch(2)
+
+		for suffix in "ABC":
+			with batch.item():
+				insert_event(suffix)
+
+		self.assertEqual(batch.commits, 1)
+		self.assertEqual(batch.pending, 1)
+
+		frappe.db.rollback()
+		self.assertEqual(self.get_subjects(), [f"{SUBJECT} A", f"{SUBJECT} B"])
@@ -67,7 +67,7 @@ def get_context(context):
     try:
         # Utiliser l'API Google directement
         from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
+        from reunion.meeting_management.utils.google_client import get_calendar_service
 
         # Essayer de récupérer les credentials
         google_settings = frappe.get_doc("Google Settings", "Google Settings")
@@ -89,7 +89,7 @@ def get_context(context):
                     client_secret=google_settings.get_password("client_secret")
                 )
 
-                service = build('calendar', 'v3', credentials=creds)
+                service = get_calendar_service(creds)
                 calendar_list = service.calendarList().list().execute()
 
                 results["google_calendars"] = {